@@ -0,0 +1,71 @@
+"""Micro-benchmark of the JSON decoding backends in controllers.json_codec.
+
+For flight and booking payloads of each size, times parsing to dicts
+("raw") and decoding straight into model objects ("models") with every
+installed backend, and prints the speed-up over the stdlib json path.
+
+Run from the Client directory:
+
+    python -m benchmarks.bench_decode --sizes 10000 50000 100000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+from benchmarks.mock_server import MockData  # noqa: E402
+from controllers import json_codec  # noqa: E402
+from models import Booking, Flight  # noqa: E402
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def payloads(size, seed):
+    # Bookings: one user per 10 bookings so the list has ``size`` elements
+    data = MockData(flights=size, users=max(1, size // 10), bookings_per_user=10, seed=seed)
+    return {
+        "flights": (Flight, json.dumps(list(data.flights.values())).encode("utf-8")),
+        "bookings": (Booking, json.dumps(list(data.bookings.values())[:size]).encode("utf-8")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON decoding backends")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Installed backends: {', '.join(json_codec.BACKENDS)} (default {json_codec.BACKEND})")
+    print(f"{'payload':<18} {'mode':<7} " + " ".join(f"{name:>16}" for name in json_codec.BACKENDS))
+    for size in args.sizes:
+        for name, (model, body) in payloads(size, args.seed).items():
+            for mode, decode_model in (("raw", None), ("models", model)):
+                times = {
+                    backend: best_of(lambda: json_codec.decode(body, decode_model, backend), args.repeat)
+                    for backend in json_codec.BACKENDS
+                }
+                baseline = times["json"]
+                cells = " ".join(
+                    f"{times[backend] * 1000:>8.1f}ms {baseline / times[backend]:>5.1f}x"
+                    for backend in json_codec.BACKENDS
+                )
+                print(f"{name + ' ' + str(size):<18} {mode:<7} {cells}")
+
+
+if __name__ == "__main__":
+    main()
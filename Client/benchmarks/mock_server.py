@@ -0,0 +1,479 @@
+"""Local stand-in for the IsraFlight API, for benchmarks and offline work.
+
+Serves seeded synthetic data for the routes the client uses:
+
+    /api/flights (GET with ids / route / date filters, POST)
+    /api/flights/{id} (GET, PUT, DELETE), /api/flights/count
+    /api/flights/page, /api/planes/page, /api/bookings/page (?afterId&limit)
+    /api/flights/search (route, departure window, price bounds, sort, limit)
+    /api/flights/arrivals?hoursAhead=N
+    /api/airports, /api/airports/{id}
+    /api/planes, /api/planes/{id} (GET, POST, PUT, DELETE)
+    /api/bookings?userId=N, /api/bookings/{id} (GET, POST, DELETE)
+    /api/frequentflyers, /api/frequentflyers/{id}
+    /api/auths, /api/auths/login
+    /api/changes?since=N&limit=M, /api/changes/version
+
+No database or external service (Aviationstack, HebCal, Imagga) is needed.
+GET responses carry the same strong ETags as the real server.
+
+Run from the Client directory:
+
+    python -m benchmarks.mock_server --flights 10000 --latency-ms 20 --port 5126
+
+and point the client at it with API_BASE_URL=http://127.0.0.1:5126/api.
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+CITIES = [
+    ("TLV", "Ben Gurion", "Tel Aviv", "Israel"),
+    ("ETM", "Ramon", "Eilat", "Israel"),
+    ("JFK", "John F. Kennedy", "New York", "USA"),
+    ("LAX", "Los Angeles International", "Los Angeles", "USA"),
+    ("LHR", "Heathrow", "London", "United Kingdom"),
+    ("CDG", "Charles de Gaulle", "Paris", "France"),
+    ("FCO", "Fiumicino", "Rome", "Italy"),
+    ("ATH", "Athens International", "Athens", "Greece"),
+    ("BER", "Brandenburg", "Berlin", "Germany"),
+    ("MAD", "Barajas", "Madrid", "Spain"),
+    ("AMS", "Schiphol", "Amsterdam", "Netherlands"),
+    ("DXB", "Dubai International", "Dubai", "UAE"),
+    ("BKK", "Suvarnabhumi", "Bangkok", "Thailand"),
+    ("NRT", "Narita", "Tokyo", "Japan"),
+    ("IST", "Istanbul Airport", "Istanbul", "Turkey"),
+    ("VIE", "Vienna International", "Vienna", "Austria"),
+]
+MANUFACTURERS = ["Boeing", "Airbus", "Embraer", "Bombardier"]
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+PAGE_LIMIT = 500
+MAX_PAGE_LIMIT = 2000
+# Tables whose writes are recorded in the change log, like the server's ChangeLog
+SYNCED_TABLES = ("flights", "planes", "airports")
+
+
+class MockData:
+    """Deterministic synthetic data set.
+
+    ``flights`` flights are spread over ``days`` days starting at ``start``
+    between random airport pairs; every frequent flyer gets
+    ``bookings_per_user`` bookings.
+    """
+
+    def __init__(self, flights=1000, airports=len(CITIES), planes=50, users=100,
+                 bookings_per_user=20, days=60, seed=42, start=None):
+        rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.version = 0
+        # (entity, id) per write to a synced table; the change version is the index + 1
+        self.change_log = []
+        self.start = start or datetime(2030, 1, 1)
+
+        self.airports = {}
+        for i in range(airports):
+            code, name, city, country = CITIES[i % len(CITIES)]
+            if i >= len(CITIES):
+                code = f"{code[:2]}{chr(65 + i % 26)}"
+                name = f"{name} {i // len(CITIES) + 1}"
+            self.airports[i + 1] = {"id": i + 1, "name": name, "code": code, "city": city, "country": country}
+
+        self.planes = {}
+        for i in range(1, planes + 1):
+            self.planes[i] = {
+                "id": i,
+                "manufacturer": rng.choice(MANUFACTURERS),
+                "nickname": f"Plane {i}",
+                "year": rng.randint(1995, 2024),
+                "imageUrl": "",
+            }
+
+        self.flights = {}
+        airport_ids = list(self.airports)
+        for i in range(1, flights + 1):
+            dep, arr = rng.sample(airport_ids, 2)
+            departure = self.start + timedelta(minutes=rng.randrange(days * 24 * 12) * 5)
+            arrival = departure + timedelta(minutes=rng.randint(45, 14 * 60))
+            self.flights[i] = {
+                "id": i,
+                "planeId": rng.randint(1, planes),
+                "departureAirportId": dep,
+                "arrivalAirportId": arr,
+                "departureTime": departure.strftime(TIME_FORMAT),
+                "arrivalTime": arrival.strftime(TIME_FORMAT),
+                "price": round(rng.uniform(60, 1500), 2),
+            }
+
+        self.frequent_flyers = {}
+        self.auths = {}
+        self.bookings = {}
+        for i in range(1, users + 1):
+            self.frequent_flyers[i] = {
+                "id": i, "username": f"user{i}", "password": "password",
+                "firstName": "User", "lastName": str(i), "email": f"user{i}@example.com",
+                "phoneNumber": "050-0000000", "dateOfBirth": "1990-01-01T00:00:00",
+                "passportNumber": f"P{i:08d}",
+            }
+            self.auths[i] = {"id": i, "username": f"user{i}", "password": "password", "role": "frequentFlyer"}
+            for _ in range(bookings_per_user if flights else 0):
+                booking_id = len(self.bookings) + 1
+                self.bookings[booking_id] = {
+                    "id": booking_id,
+                    "frequentFlyerId": i,
+                    "flightId": rng.randint(1, flights),
+                    "bookingDate": self.start.strftime(TIME_FORMAT),
+                }
+        admin_id = users + 1
+        self.auths[admin_id] = {"id": admin_id, "username": "admin", "password": "admin", "role": "admin"}
+
+    def next_id(self, table):
+        return max(table, default=0) + 1
+
+    def changed(self, table=None, item_id=None):
+        self.version += 1
+        for name in SYNCED_TABLES:
+            if getattr(self, name) is table:
+                self.change_log.append((name, item_id))
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Request handler; ``server.data`` holds the MockData and
+    ``server.latency`` / ``server.jitter`` the injected delay in seconds."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle plus
+    # delayed ACKs add ~40ms to every small keep-alive response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # === Plumbing ===
+
+    def _delay(self):
+        delay = self.server.latency + random.uniform(0, self.server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _send(self, status, payload=None, raw=None):
+        # Routes run under the data lock; the response is written after it is released
+        self._response = (status, payload, raw)
+
+    def _write(self, status, payload=None, raw=None):
+        body = raw if raw is not None else (b"" if payload is None else json.dumps(payload).encode("utf-8"))
+        if self.command == "GET" and status == 200:
+            etag = '"' + hashlib.sha256(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        if self.command == "GET" and status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if body:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _dispatch(self):
+        self._delay()
+        url = urlsplit(self.path)
+        parts = [p.lower() for p in url.path.strip("/").split("/")]
+        if parts[:1] == ["api"]:
+            parts = parts[1:]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = getattr(self, f"route_{parts[0]}", None) if parts else None
+        self._response = (404, {"error": "Not found"}, None)
+        if route is not None:
+            with self.server.data.lock:
+                route(parts[1:], query)
+        self._write(*self._response)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    @staticmethod
+    def _pascal_to_camel(payload):
+        return {key[:1].lower() + key[1:]: value for key, value in payload.items()}
+
+    def _page(self, items, query):
+        """Keyset page after query["afterId"]. ``items`` is a table dict or a
+        list; both are in id order since tables are filled in ascending ids."""
+        after_id = int(query.get("afterId", 0))
+        limit = max(1, min(int(query.get("limit", PAGE_LIMIT)), MAX_PAGE_LIMIT))
+        if isinstance(items, dict):
+            ids = list(items)
+            start = bisect.bisect_right(ids, after_id)
+            return [items[i] for i in ids[start:start + limit]]
+        start = bisect.bisect_right([item["id"] for item in items], after_id)
+        return items[start:start + limit]
+
+    def _crud(self, table, rest, query, listing=None):
+        data = self.server.data
+        if rest == ["page"] and self.command == "GET":
+            if listing is None or not set(query) - {"afterId", "limit"}:
+                return self._send(200, self._page(table, query))
+            return self._send(200, self._page(listing(), query))
+        if not rest:
+            if self.command == "GET":
+                return self._send(200, listing() if listing else list(table.values()))
+            if self.command == "POST":
+                item = self._pascal_to_camel(self._body())
+                item["id"] = data.next_id(table)
+                table[item["id"]] = item
+                data.changed(table, item["id"])
+                return self._send(200, item)
+            return self._send(405)
+
+        if not rest[0].isdigit():
+            return self._send(404, {"error": "Not found"})
+        item_id = int(rest[0])
+        if item_id not in table:
+            return self._send(404)
+        if self.command == "GET":
+            return self._send(200, table[item_id])
+        if self.command == "PUT":
+            table[item_id] = {**table[item_id], **self._pascal_to_camel(self._body()), "id": item_id}
+            data.changed(table, item_id)
+            return self._send(204)
+        if self.command == "DELETE":
+            del table[item_id]
+            data.changed(table, item_id)
+            return self._send(204)
+        return self._send(405)
+
+    # === Routes ===
+
+    def route_airports(self, rest, query):
+        self._crud(self.server.data.airports, rest, query)
+
+    def route_planes(self, rest, query):
+        self._crud(self.server.data.planes, rest, query)
+
+    def route_frequentflyers(self, rest, query):
+        self._crud(self.server.data.frequent_flyers, rest, query)
+
+    def route_bookings(self, rest, query):
+        bookings = self.server.data.bookings
+
+        def listing():
+            if "userid" in {k.lower() for k in query}:
+                user_id = int(next(v for k, v in query.items() if k.lower() == "userid"))
+                return [b for b in bookings.values() if b["frequentFlyerId"] == user_id]
+            return list(bookings.values())
+
+        self._crud(bookings, rest, query, listing)
+
+    def route_auths(self, rest, query):
+        data = self.server.data
+        if rest == ["login"] and self.command == "POST":
+            credentials = self._pascal_to_camel(self._body())
+            for auth in data.auths.values():
+                if auth["username"] == credentials.get("username") and auth["password"] == credentials.get("password"):
+                    return self._send(200, {"auth": {"id": auth["id"], "username": auth["username"], "role": auth["role"]}})
+            return self._send(401, {"error": "Invalid username or password"})
+        self._crud(data.auths, rest, query)
+
+    def route_changes(self, rest, query):
+        """Same contract as ChangesController"""
+        log = self.server.data.change_log
+        if self.command != "GET":
+            return self._send(405)
+        if rest == ["version"]:
+            return self._send(200, {"version": len(log)})
+        if rest:
+            return self._send(404, {"error": "Not found"})
+
+        since = int(query.get("since", 0))
+        if since > len(log):
+            return self._send(200, {"version": len(log), "hasMore": False, "reset": True,
+                                    "flights": [], "planes": [], "airports": [],
+                                    "deleted": {name: [] for name in SYNCED_TABLES}})
+        limit = max(1, min(int(query.get("limit", PAGE_LIMIT)), MAX_PAGE_LIMIT))
+        entries = log[since:since + limit]
+        changes = {"version": since + len(entries), "hasMore": since + limit < len(log), "reset": False,
+                   "deleted": {}}
+        for name in SYNCED_TABLES:
+            table = getattr(self.server.data, name)
+            ids = list(dict.fromkeys(item_id for entity, item_id in entries if entity == name))
+            changes[name] = [table[i] for i in ids if i in table]
+            changes["deleted"][name] = [i for i in ids if i not in table]
+        return self._send(200, changes)
+
+    def route_flights(self, rest, query):
+        data = self.server.data
+        if rest == ["count"] and self.command == "GET":
+            return self._send(200, len(data.flights))
+        if rest == ["search"] and self.command == "GET":
+            return self._send(*self._search_flights(query))
+        if rest == ["arrivals"] and self.command == "GET":
+            return self._send(200, self._arrivals(int(query.get("hoursAhead", 2))))
+        if not rest and self.command == "GET" and not query:
+            return self._send(200, raw=self._all_flights_body())
+        self._crud(data.flights, rest, query, lambda: self._filter_flights(query))
+
+    def _all_flights_body(self):
+        # The full listing is by far the largest response; encode it once per version
+        data = self.server.data
+        cached = self.server.flights_body
+        if cached is None or cached[0] != data.version:
+            cached = (data.version, json.dumps(list(data.flights.values())).encode("utf-8"))
+            self.server.flights_body = cached
+        return cached[1]
+
+    def _filter_flights(self, query):
+        flights = self.server.data.flights
+        if query.get("ids"):
+            ids = {int(i) for i in query["ids"].split(",") if i.strip().isdigit()}
+            return [flights[i] for i in sorted(ids) if i in flights]
+        result = flights.values()
+        if query.get("departureAirportId"):
+            dep = int(query["departureAirportId"])
+            result = [f for f in result if f["departureAirportId"] == dep]
+        if query.get("arrivalAirportId"):
+            arr = int(query["arrivalAirportId"])
+            result = [f for f in result if f["arrivalAirportId"] == arr]
+        if query.get("date"):
+            day = query["date"][:10]
+            result = [f for f in result if f["departureTime"][:10] == day]
+        return list(result)
+
+    def _search_flights(self, query):
+        """Same filters and ordering as FlightsController.Search"""
+        result = self.server.data.flights.values()
+        if query.get("departureAirportId"):
+            dep = int(query["departureAirportId"])
+            result = [f for f in result if f["departureAirportId"] == dep]
+        if query.get("arrivalAirportId"):
+            arr = int(query["arrivalAirportId"])
+            result = [f for f in result if f["arrivalAirportId"] == arr]
+        # Timestamps share one format, so string comparison orders them
+        if query.get("departureFrom"):
+            start = query["departureFrom"][:19]
+            result = [f for f in result if f["departureTime"] >= start]
+        if query.get("departureTo"):
+            end = query["departureTo"][:19]
+            result = [f for f in result if f["departureTime"] < end]
+        if query.get("minPrice"):
+            result = [f for f in result if f["price"] >= float(query["minPrice"])]
+        if query.get("maxPrice"):
+            result = [f for f in result if f["price"] <= float(query["maxPrice"])]
+
+        sort = query.get("sort", "departure")
+        field = {"departure": "departureTime", "arrival": "arrivalTime", "price": "price"}.get(sort.lstrip("-").lower())
+        if field is None:
+            return 400, {"error": "sort must be departure, arrival or price, optionally prefixed with '-'"}
+        result = sorted(result, key=lambda f: f["id"])
+        result.sort(key=lambda f: f[field], reverse=sort.startswith("-"))
+        limit = max(1, min(int(query.get("limit", 100)), MAX_PAGE_LIMIT))
+        return 200, result[:limit]
+
+    def _arrivals(self, hours_ahead):
+        data = self.server.data
+        airports = data.airports
+        rng = random.Random(hours_ahead)
+        now = datetime.now()
+        arrivals = []
+        for i in range(min(100, len(data.flights)) or 20):
+            origin = airports[rng.choice(list(airports))]
+            arrivals.append({
+                "flightNumber": f"LY{100 + i}",
+                "airline": "El Al",
+                "origin": origin["code"],
+                "scheduledArrival": (now + timedelta(minutes=rng.randrange(hours_ahead * 60))).strftime(TIME_FORMAT),
+                "terminal": "3",
+                "gate": f"B{rng.randint(1, 12)}",
+                "status": "scheduled",
+                "isCodeshare": False,
+                "codeshareAirline": None,
+                "codeshareFlightNumber": None,
+            })
+        return sorted(arrivals, key=lambda a: a["scheduledArrival"])
+
+
+class MockApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data, latency=0.0, jitter=0.0, verbose=False):
+        super().__init__(address, MockApiHandler)
+        self.data = data
+        self.latency = latency
+        self.jitter = jitter
+        self.verbose = verbose
+        self.flights_body = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+
+def start_mock_server(data=None, host="127.0.0.1", port=0, latency=0.0, jitter=0.0):
+    """Start a MockApiServer on a background thread and return it"""
+    server = MockApiServer((host, port), data or MockData(), latency, jitter)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_data_arguments(parser):
+    parser.add_argument("--flights", type=int, default=1000, help="number of flights (default 1000)")
+    parser.add_argument("--planes", type=int, default=50)
+    parser.add_argument("--airports", type=int, default=len(CITIES))
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--bookings-per-user", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random extra delay up to this value")
+
+
+def data_from_args(args):
+    return MockData(
+        flights=args.flights, airports=args.airports, planes=args.planes, users=args.users,
+        bookings_per_user=args.bookings_per_user, seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the mock IsraFlight API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5126, help="0 picks a free port")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    add_data_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockApiServer(
+        (args.host, args.port), data_from_args(args),
+        args.latency_ms / 1000, args.jitter_ms / 1000, args.verbose,
+    )
+    print(f"Mock IsraFlight API listening on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""End-to-end benchmarks for the Python client against the mock API.
+
+Starts benchmarks.mock_server in a subprocess (so it does not compete with
+the client for the GIL), times the client's data paths and stores the
+results in benchmarks/results.json keyed by git commit. Each run is
+compared with the latest run of a different commit at the same scale and
+slower medians beyond the threshold are reported as regressions.
+
+Run from the Client directory:
+
+    python -m benchmarks.run_benchmarks --flights 10000 --latency-ms 5
+    python -m benchmarks.run_benchmarks --only flights.get_all --repeat 20
+    python -m benchmarks.run_benchmarks --base-url http://localhost:5126/api
+
+Use --fail-on-regression to make the exit status non-zero (e.g. in CI).
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+from benchmarks.mock_server import add_data_arguments  # noqa: E402
+from controllers.api_controller import ApiController, _create_session  # noqa: E402
+from controllers.airport_controller import AirportController  # noqa: E402
+from controllers.booking_controller import BookingController  # noqa: E402
+from controllers.flight_controller import FlightController  # noqa: E402
+from controllers.flight_index import FlightIndex  # noqa: E402
+from controllers.plane_controller import PlaneController  # noqa: E402
+from controllers.reference_cache import ReferenceCache  # noqa: E402
+from controllers.replica import Replica  # noqa: E402
+from controllers.snapshot_store import SnapshotStore  # noqa: E402
+
+RESULTS_PATH = os.path.join(CLIENT_DIR, "benchmarks", "results.json")
+
+
+# === Benchmark registry ===
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register ``fn(ctx)``; it may return a zero-argument callable to time instead"""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def forget_client_state(base_url):
+    """Drop the in-memory caches and indexes for base_url, as a restart would"""
+    with ReferenceCache._registry_lock:
+        for key in [k for k in ReferenceCache._registry if k[0] == base_url]:
+            del ReferenceCache._registry[key]
+    with FlightIndex._registry_lock:
+        FlightIndex._registry.pop(base_url, None)
+    with Replica._registry_lock:
+        Replica._registry.pop(base_url, None)
+
+
+def reset_client_state(base_url):
+    """Forget every shared cache, index and stored snapshot for base_url so each run starts cold"""
+    forget_client_state(base_url)
+    SnapshotStore.shared().drop(SnapshotStore.scope(base_url))
+
+
+def fresh_api(ctx):
+    reset_client_state(ctx.base_url)
+    return ApiController(ctx.base_url, session=ctx.session)
+
+
+@benchmark("flights.get_all")
+def bench_get_all_flights(ctx):
+    controller = FlightController(fresh_api(ctx))
+    return controller.get_all_flights
+
+
+@benchmark("flights.get_all_revalidated")
+def bench_get_all_flights_revalidated(ctx):
+    controller = FlightController(fresh_api(ctx))
+    controller.get_all_flights()  # prime the ETag cache, the timed call gets a 304
+    return controller.get_all_flights
+
+
+@benchmark("flights.first_page")
+def bench_first_flight_page(ctx):
+    controller = FlightController(fresh_api(ctx))
+    return lambda: next(controller.iter_flight_pages())
+
+
+@benchmark("flights.all_pages")
+def bench_all_flight_pages(ctx):
+    controller = FlightController(fresh_api(ctx))
+    return lambda: sum(len(page) for page in controller.iter_flight_pages())
+
+
+@benchmark("flights.snapshot_first_page")
+def bench_snapshot_first_flight_page(ctx):
+    FlightController(fresh_api(ctx)).get_all_flights()  # fill the snapshot store
+
+    def first_page():
+        # A restarted client: nothing in memory, the first page comes from disk
+        forget_client_state(ctx.base_url)
+        controller = FlightController(ApiController(ctx.base_url, session=ctx.session))
+        return next(controller.iter_flight_pages(revalidate=False))
+    return first_page
+
+
+@benchmark("flights.delta_sync")
+def bench_flights_delta_sync(ctx):
+    controller = FlightController(fresh_api(ctx))
+    controller.get_all_flights()  # download once; the timed call only pulls the change feed
+    return lambda: controller.replica.sync(("flights",), force=True)
+
+
+@benchmark("flights.search")
+def bench_search_flights(ctx):
+    controller = FlightController(fresh_api(ctx))
+    rng = random.Random(ctx.seed)
+    queries = [
+        (rng.randint(1, ctx.airports), rng.randint(1, ctx.airports), date(2030, 1, 1) + timedelta(days=rng.randrange(60)))
+        for _ in range(100)
+    ]
+
+    def run():
+        # Includes building the index (or server-side filtering) on the first query
+        for from_id, to_id, day in queries:
+            controller.search_flights(from_id, to_id, day)
+    return run
+
+
+@benchmark("bookings.load")
+def bench_load_bookings(ctx):
+    from views.MyBookingsWindow import MyBookingsWindow
+
+    api = fresh_api(ctx)
+    window = SimpleNamespace(
+        user_id=ctx.user_id,
+        booking_controller=BookingController(api),
+        flight_controller=FlightController(api),
+        airport_controller=AirportController(api),
+    )
+    return lambda: MyBookingsWindow.fetch_bookings(window, 0, lambda page: None)
+
+
+@benchmark("planes.load")
+def bench_load_planes(ctx):
+    return PlaneController(fresh_api(ctx)).get_all_planes
+
+
+@benchmark("pdf.ticket")
+def bench_ticket_pdf(ctx):
+    from models import Booking, Flight
+    from services.pdf_service import generate_ticket_pdf
+
+    booking = Booking(id=1, frequentFlyerId=ctx.user_id, flightId=1, bookingDate="2030-01-01T00:00:00")
+    flight = Flight(
+        id=1, planeId=1, departureAirportId=1, arrivalAirportId=2,
+        departureTime="2030-01-02T08:00:00", arrivalTime="2030-01-02T12:30:00", price=420.0,
+    )
+    return lambda: generate_ticket_pdf(booking, flight, "Bench Traveler", "Ben Gurion", "Heathrow")
+
+
+
+@benchmark("pdf.ticket_repeat")
+def bench_repeat_ticket(ctx):
+    from services.ticket_service import TicketService
+
+    api = fresh_api(ctx)
+    booking = BookingController(api).list_user_bookings(ctx.user_id)[0]
+    service = TicketService(api)
+    service.render(booking)  # the timed call finds the rendered ticket
+    return lambda: service.render(booking)
+
+
+BATCH_TICKETS = 64
+
+
+def batch_tickets(ctx):
+    from models import Booking, Flight
+
+    flight = Flight(
+        id=1, planeId=1, departureAirportId=1, arrivalAirportId=2,
+        departureTime="2030-01-02T08:00:00", arrivalTime="2030-01-02T12:30:00", price=420.0,
+    )
+    return [
+        (Booking(id=i, frequentFlyerId=ctx.user_id, flightId=1, bookingDate="2030-01-01T00:00:00"),
+         flight, f"Bench Traveler {i}", "Ben Gurion", "Heathrow")
+        for i in range(1, BATCH_TICKETS + 1)
+    ]
+
+
+@benchmark("pdf.batch_files")
+def bench_ticket_pdf_batch_files(ctx):
+    from services.pdf_service import generate_ticket_pdfs
+
+    tickets = batch_tickets(ctx)
+    return lambda: generate_ticket_pdfs(tickets)
+
+
+@benchmark("pdf.batch_merged")
+def bench_ticket_pdf_batch_merged(ctx):
+    from services.pdf_service import generate_ticket_pdfs
+
+    tickets = batch_tickets(ctx)
+    return lambda: generate_ticket_pdfs(tickets, merged_path="PDF_files/manifest.pdf")
+
+
+# === Running ===
+
+def measure(fn, ctx, repeat, warmup):
+    samples = []
+    for i in range(warmup + repeat):
+        run = fn(ctx)
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            samples.append(elapsed)
+    samples.sort()
+    return {
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": samples[-1],
+        "repeat": repeat,
+    }
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=CLIENT_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no", "--", "."], cwd=CLIENT_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def start_server(args):
+    cmd = [
+        sys.executable, "-m", "benchmarks.mock_server", "--port", "0",
+        "--flights", str(args.flights), "--planes", str(args.planes), "--airports", str(args.airports),
+        "--users", str(args.users), "--bookings-per-user", str(args.bookings_per_user),
+        "--seed", str(args.seed), "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+    ]
+    process = subprocess.Popen(cmd, cwd=CLIENT_DIR, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if "listening on" not in line:
+        process.kill()
+        raise RuntimeError(f"Mock server failed to start: {line!r}")
+    return process, line.rsplit(" ", 1)[-1].strip()
+
+
+def load_history(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"runs": []}
+
+
+def find_baseline(history, params, commit, baseline_commit=None):
+    for run in reversed(history["runs"]):
+        if run["params"] != params:
+            continue
+        if baseline_commit is not None:
+            if run["commit"].startswith(baseline_commit):
+                return run
+        elif run["commit"] != commit:
+            return run
+    return None
+
+
+def compare(results, baseline, threshold, min_delta):
+    """Return {name: ratio} and the names whose median regressed"""
+    ratios, regressions = {}, []
+    if baseline is None:
+        return ratios, regressions
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        ratios[name] = result["median"] / before["median"] if before["median"] else None
+        if result["median"] - before["median"] > max(min_delta, before["median"] * threshold):
+            regressions.append(name)
+    return ratios, regressions
+
+
+def print_report(results, baseline, ratios, regressions):
+    header = f"{'benchmark':<30} {'median':>10} {'min':>10} {'max':>10}"
+    if baseline:
+        header += f"   vs {baseline['commit']}"
+    print(header)
+    for name, result in results.items():
+        line = f"{name:<30} {result['median'] * 1000:>8.2f}ms {result['min'] * 1000:>8.2f}ms {result['max'] * 1000:>8.2f}ms"
+        ratio = ratios.get(name)
+        if ratio is not None:
+            line += f"   {ratio:>5.2f}x"
+            if name in regressions:
+                line += "  REGRESSION"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the IsraFlight client against the mock API")
+    add_data_arguments(parser)
+    parser.add_argument("--base-url", help="benchmark an already running API instead of starting the mock")
+    parser.add_argument("--user-id", type=int, default=1, help="frequent flyer whose bookings are loaded")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    parser.add_argument("--baseline", help="compare against this commit instead of the previous run")
+    parser.add_argument("--results", default=RESULTS_PATH, help="results history file")
+    parser.add_argument("--no-save", action="store_true", help="do not record this run")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.base_url
+    if base_url is None:
+        process, base_url = start_server(args)
+
+    ctx = SimpleNamespace(
+        base_url=base_url, session=_create_session(), seed=args.seed,
+        airports=args.airports, user_id=args.user_id,
+    )
+    # Ticket PDFs are written relative to the working directory, and the
+    # snapshots kept there too so benchmarks never touch the user's cache
+    workdir = tempfile.mkdtemp(prefix="israflight-bench-")
+    SnapshotStore.cache_dir = workdir
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        results = {}
+        for name in args.only or BENCHMARKS:
+            results[name] = measure(BENCHMARKS[name], ctx, args.repeat, args.warmup)
+    finally:
+        os.chdir(cwd)
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    params = {
+        "flights": args.flights, "planes": args.planes, "airports": args.airports, "users": args.users,
+        "bookings_per_user": args.bookings_per_user, "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms, "target": "mock" if args.base_url is None else args.base_url,
+    }
+    commit = git_commit()
+    history = load_history(args.results)
+    baseline = find_baseline(history, params, commit, args.baseline)
+    ratios, regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000)
+    print_report(results, baseline, ratios, regressions)
+
+    if not args.no_save:
+        history["runs"].append({"commit": commit, "timestamp": time.time(), "params": params, "results": results})
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
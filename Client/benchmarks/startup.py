@@ -0,0 +1,113 @@
+"""Startup benchmark of the desktop client.
+
+Runs ``import views.main_window`` under ``python -X importtime`` in a fresh
+interpreter and prints the total import time with the heaviest packages
+and modules. Then times a fresh interpreter from start to the first
+window painted: QApplication, MainWindow().show() and one round of
+events, as main.py does. The windows behind the landing page, the HTTP
+stack and reportlab are imported on first use, so neither number should
+include them; ``--check`` fails if they are loaded anyway.
+
+Run from the Client directory:
+
+    python -m benchmarks.startup --repeat 5
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_MODULE = "views.main_window"
+
+# Loaded on demand after the landing page is shown
+DEFERRED = ("requests", "reportlab", "controllers.api_controller", "services.pdf_service",
+            "views.login_dialog", "views.user_window", "views.admin_window")
+
+FIRST_WINDOW = """
+import sys, time
+started = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from views.main_window import MainWindow
+app = QApplication(sys.argv)
+window = MainWindow()
+window.show()
+app.processEvents()
+loaded = [name for name in {deferred!r} if name in sys.modules]
+print(time.perf_counter() - started, *loaded)
+"""
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def child_env():
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def import_times(module):
+    """Return {module: (self us, cumulative us)} for a cold ``import module``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=CLIENT_DIR, env=child_env(), capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            own, cumulative, _, name = match.groups()
+            times[name] = (int(own), int(cumulative))
+    return times
+
+
+def time_to_first_window():
+    """Return (seconds, deferred modules that were loaded anyway)"""
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_WINDOW.format(deferred=DEFERRED)],
+        cwd=CLIENT_DIR, env=child_env(), capture_output=True, text=True, check=True,
+    )
+    seconds, *loaded = result.stdout.split()
+    return float(seconds), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure client import time and time to first window")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="heaviest packages and modules to list")
+    parser.add_argument("--check", action="store_true", help="fail if a deferred module is imported at startup")
+    args = parser.parse_args()
+
+    runs = [import_times(ENTRY_MODULE) for _ in range(args.repeat)]
+    totals = [run[ENTRY_MODULE][1] for run in runs]
+    times = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    print(f"import {ENTRY_MODULE}: {statistics.median(totals) / 1000:.1f}ms (median of {args.repeat})")
+
+    # Top-level packages by cumulative time, then single modules by self time
+    packages = {name: cumulative for name, (_, cumulative) in times.items() if "." not in name}
+    print(f"\n{'package':<48} {'cumulative':>12}")
+    for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<48} {cumulative / 1000:>10.1f}ms")
+    print(f"\n{'module':<48} {'self':>12}")
+    for name, (own, _) in sorted(times.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"{name:<48} {own / 1000:>10.1f}ms")
+
+    windows = [time_to_first_window() for _ in range(args.repeat)]
+    seconds = [elapsed for elapsed, _ in windows]
+    print(f"\ntime to first window: {statistics.median(seconds) * 1000:.1f}ms "
+          f"(median of {args.repeat}, min {min(seconds) * 1000:.1f}ms)")
+
+    loaded = sorted({name for _, names in windows for name in names} |
+                    {name for name in DEFERRED if name in times})
+    if loaded:
+        print(f"loaded at startup although deferred: {', '.join(loaded)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
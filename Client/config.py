@@ -5,3 +5,6 @@ load_dotenv()
 
 # Get API base URL, fallback to localhost if not defined
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:5126/api")
+
+# Local data (change-feed replica) lives here
+CACHE_DIR = os.getenv("ISRAFLIGHT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "israflight"))
@@ -1,6 +1,6 @@
 # controllers/admin_controller.py
 from PySide6.QtCore import QObject, Signal
-from .api_controller import ApiController
+from .api_controller import get_api
 from .plane_controller import PlaneController
 from .flight_controller import FlightController
 
@@ -17,7 +17,7 @@ class AdminController(QObject):
 
     def __init__(self, api=None):
         super().__init__()
-        self.api = api or ApiController()
+        self.api = api or get_api()
         self.plane_controller = PlaneController(self.api)
         self.flight_controller = FlightController(self.api)
 
@@ -1,12 +1,28 @@
 from controllers.api_controller import ApiController
+from controllers.reference_cache import ReferenceCache
 
 
 class AirportController:
     def __init__(self, api: ApiController):
         self.api = api
+        self.cache = ReferenceCache.for_api(api, "airports")
         
     def get_all_airports(self):
-        return self.api.get("airports")
+        return self.cache.all()
+
+    def get_cached_airports(self):
+        """Airports as last stored on disk, without a request; None before the first download"""
+        return self.cache.cached()
         
     def get_airport_by_id(self, airport_id):
-        return self.api.get(f"airports/{airport_id}")
\ No newline at end of file
+        return self.cache.get(airport_id)
+
+    def get_cached_airport(self, airport_id):
+        """The airport if it is already held, without a request (safe while painting)"""
+        return self.cache.peek(airport_id)
+
+    def get_airport_name(self, airport_id, default="Unknown Airport"):
+        airport = self.cache.get(airport_id)
+        if not airport:
+            return default
+        return airport.get("name", airport.get("Name", default))
@@ -1,27 +1,190 @@
-
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from config import API_BASE_URL
+from controllers import json_codec
+from controllers.http_cache import ResponseCache
+from controllers.instrumentation import Instrumentation, TimingRecord, body_size
+from controllers.resilience import Resilience, CircuitOpenError, endpoint_template
+
+# Connection pool sizing for the shared session. POOL_MAXSIZE should cover the
+# number of worker threads that may talk to the API at the same time.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+_registry_lock = threading.Lock()
+_sessions = {}
+_clients = {}
+
+
+def _create_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_shared_session(base_url=None):
+    """Return the pooled requests.Session shared by every client of base_url"""
+    base_url = base_url or API_BASE_URL
+    with _registry_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = _create_session()
+            _sessions[base_url] = session
+        return session
+
+
+def get_api(base_url=None):
+    """Return the application-wide ApiController for base_url (config.API_BASE_URL by default)"""
+    base_url = base_url or API_BASE_URL
+    with _registry_lock:
+        api = _clients.get(base_url)
+    if api is None:
+        api = ApiController(base_url)
+        with _registry_lock:
+            api = _clients.setdefault(base_url, api)
+    return api
+
 
 class ApiController:
-    def __init__(self, base_url=None):
+    # Read timeouts in seconds; the connect timeout comes from Resilience
+    READ_TIMEOUT = 20
+    POST_READ_TIMEOUT = 30
+
+    def __init__(self, base_url=None, session=None, resilience=None, instrumentation=None):
         self.base_url = base_url or API_BASE_URL
-        self.session = requests.Session()
+        self.session = session or get_shared_session(self.base_url)
+        self.cache = ResponseCache()
+        self.resilience = resilience or Resilience()
+        self.instrumentation = instrumentation or Instrumentation()
 
     def _url(self, path):
         if path.startswith("/"):
             path = path[1:]
         return f"{self.base_url}/{path}"
 
-    def get(self, path, params=None):
-        resp = self.session.get(self._url(path), params=params, timeout=20)
+    def _send(self, method, path, read_timeout=READ_TIMEOUT, idempotency_key=None, model=None, **kwargs):
+        """Send a request and return (response, decoded JSON or None).
+
+        Connection errors, timeouts and 502/503/504 responses count as
+        failures of the endpoint; they are retried with backoff when the
+        method is idempotent (or an idempotency key is given). The final
+        response is returned as is, so callers still handle HTTP errors.
+        Successful non-empty bodies are decoded here so that one
+        TimingRecord covers the transfer and the JSON decoding. With
+        ``model``, a JSON array body is decoded into a list of that model.
+        """
+        endpoint = endpoint_template(method, path)
+        record = TimingRecord(time.time(), method, endpoint, None, 0, 0.0)
+        started = time.perf_counter()
+        resp = None
+        try:
+            resp = self._send_with_retries(method, path, endpoint, read_timeout, idempotency_key, record, kwargs)
+            data = None
+            if resp.ok and resp.status_code != 204 and resp.content and not resp.content.isspace():
+                decode_started = time.perf_counter()
+                data = json_codec.decode(resp.content, model)
+                record.decode = time.perf_counter() - decode_started
+            return resp, data
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            record.total = time.perf_counter() - started
+            if resp is not None:
+                record.status = resp.status_code
+                record.bytes_in = len(resp.content)
+                record.bytes_out = body_size(getattr(resp, "request", None))
+                elapsed = getattr(resp, "elapsed", None)
+                record.ttfb = elapsed.total_seconds() if elapsed is not None else None
+            self.instrumentation.emit(record)
+
+    def _send_with_retries(self, method, path, endpoint, read_timeout, idempotency_key, record, kwargs):
+        resilience = self.resilience
+        breaker = resilience.breaker(endpoint)
+        retryable = resilience.retry.can_retry(method, idempotency_key)
+        if idempotency_key is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Idempotency-Key": idempotency_key}
+
+        attempt = 0
+        while True:
+            try:
+                breaker.before_request(endpoint)
+            except CircuitOpenError:
+                resilience.count(endpoint, "short_circuits")
+                raise
+            resilience.count(endpoint, "requests")
+            record.attempts += 1
+
+            resp, error = None, None
+            try:
+                resp = self.session.request(
+                    method, self._url(path), timeout=resilience.timeout(read_timeout), **kwargs
+                )
+            except requests.exceptions.RequestException as e:
+                error = e
+            except BaseException:
+                # Anything else still ends the request, so a half-open trial reopens the circuit
+                resilience.count(endpoint, "failures")
+                if breaker.record_failure():
+                    resilience.count(endpoint, "trips")
+                raise
+
+            failed = error is not None or resp.status_code >= 500
+            if not failed:
+                breaker.record_success()
+                return resp
+
+            resilience.count(endpoint, "failures")
+            if breaker.record_failure():
+                resilience.count(endpoint, "trips")
+            if not (retryable and resilience.retry.should_retry(attempt, resp, error)):
+                if error is not None:
+                    raise error
+                return resp
+
+            resilience.count(endpoint, "retries")
+            time.sleep(resilience.retry.delay(attempt))
+            attempt += 1
+
+    def stats(self):
+        """Per-endpoint request, retry, failure and circuit breaker counters"""
+        return self.resilience.stats()
+
+    def latency_summary(self):
+        """Per-endpoint p50/p95/p99 call times in seconds"""
+        return self.instrumentation.summary()
+
+    def get(self, path, params=None, model=None):
+        """GET a JSON resource; with ``model`` the response list is decoded
+        into model objects (shared with the response cache, do not mutate)"""
+        cache_key = self.cache.key(self._url(path), params)
+        if model is not None:
+            cache_key += "#" + model.__name__
+        headers = self.cache.validators(cache_key)
+        resp, data = self._send("GET", path, params=params, headers=headers, model=model)
+        if resp.status_code == 304:
+            cached = self.cache.revalidated(cache_key)
+            if cached is not None:
+                return cached
+            # Cached body was evicted meanwhile, fetch it unconditionally
+            resp, data = self._send("GET", path, params=params, model=model)
         resp.raise_for_status()
-        return resp.json()
+        self.cache.store(cache_key, resp, data)
+        return data
 
-    def post(self, path, json=None, data=None, files=None):
+    def post(self, path, json=None, data=None, files=None, idempotency_key=None):
         try:
-            resp = self.session.post(self._url(path), json=json, data=data, files=files, timeout=30)
+            resp, body = self._send(
+                "POST", path, read_timeout=self.POST_READ_TIMEOUT, idempotency_key=idempotency_key,
+                json=json, data=data, files=files
+            )
             resp.raise_for_status()
-            return resp.json()
+            return body if body is not None else resp.json()
         except requests.exceptions.HTTPError as e:
             try:
                 # Try to parse JSON from the error response
@@ -33,13 +196,13 @@ class ApiController:
 
 
     def put(self, path, json=None):
-        resp = self.session.put(self._url(path), json=json, timeout=20)
+        resp, data = self._send("PUT", path, json=json)
         resp.raise_for_status()
         if resp.status_code == 204 or not resp.content.strip():
             return True
-        return resp.json()
+        return data
 
     def delete(self, path):
-        resp = self.session.delete(self._url(path), timeout=20)
+        resp, _ = self._send("DELETE", path)
         resp.raise_for_status()
         return resp.status_code == 204
@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QTableWidgetItem
 from datetime import datetime
 from .api_controller import ApiController
 from views.arrivals_window import ArrivalsWindow
+from services.worker import run_async
 
 
 class ArrivalsController(QObject):
@@ -19,22 +20,33 @@ class ArrivalsController(QObject):
         self.window.refresh_btn.clicked.connect(self.load_arrivals)
 
     def load_arrivals(self):
-        """Fetch arrivals from API and update table."""
+        """Fetch arrivals from API on a worker thread and update table."""
         hours = self.window.hours_spin.value()
-        try:
-            flights = self.api.get(f"/flights/arrivals?hoursAhead={hours}")
-
-            if isinstance(flights, dict):
-                flights = flights.get("data", [])
-
-            print(f"Fetched {len(flights)} arrivals")
-            self.populate_table(flights)
-            self.data_loaded.emit(flights)
-
-        except Exception as e:
-            self.window.table.setRowCount(1)
-            self.window.table.setItem(0, 0, QTableWidgetItem(f"Error: {str(e)}"))
-            self.error_occurred.emit(str(e))
+        self.window.refresh_btn.setEnabled(False)
+        run_async(
+            self.fetch_arrivals, hours,
+            on_result=self.on_arrivals_loaded,
+            on_error=self.on_arrivals_error,
+            on_finished=lambda: self.window.refresh_btn.setEnabled(True),
+        )
+
+    def fetch_arrivals(self, hours):
+        """Fetch arrivals from API (runs on a worker thread)."""
+        flights = self.api.get(f"/flights/arrivals?hoursAhead={hours}")
+
+        if isinstance(flights, dict):
+            flights = flights.get("data", [])
+        return flights
+
+    def on_arrivals_loaded(self, flights):
+        print(f"Fetched {len(flights)} arrivals")
+        self.populate_table(flights)
+        self.data_loaded.emit(flights)
+
+    def on_arrivals_error(self, message):
+        self.window.table.setRowCount(1)
+        self.window.table.setItem(0, 0, QTableWidgetItem(f"Error: {message}"))
+        self.error_occurred.emit(message)
 
     def populate_table(self, flights: list):
         """Fill the arrivals QTableWidget with data."""
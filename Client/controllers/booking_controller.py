@@ -1,10 +1,12 @@
 from .api_controller import ApiController
-from models import Booking
+from .snapshot_store import SnapshotStore
+from models import Booking, Flight, decode_booking, encode_booking, encode_flight
 import json
 
 class BookingController:
     def __init__(self, api: ApiController):
         self.api = api
+        self.store = SnapshotStore.shared()
 
     def create_booking(self, user_id, flight_id):
         data = {"frequentFlyerId": user_id, "flightId": flight_id}
@@ -15,13 +17,48 @@ class BookingController:
             # Backend returned an error (like Shabbat)
             raise Exception(json.dumps(res))
 
-        return Booking(**res)
+        return decode_booking(res)
 
     def list_user_bookings(self, user_id):
-        res = self.api.get("/bookings", params={"userId": user_id})
-        return [Booking(**b) for b in res]
+        return list(self.api.get("/bookings", params={"userId": user_id}, model=Booking))
     
-    def delete_booking(self, booking_id: int):
+    def iter_user_bookings(self, user_id, page_size=100):
+        """Yield a user's bookings page by page (keyset pagination on id)"""
+        after_id = 0
+        while True:
+            page = self.api.get("/bookings/page", params={
+                "userId": user_id, "afterId": after_id, "limit": page_size,
+            }, model=Booking)
+            if page:
+                yield list(page)
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
+    def delete_booking(self, booking_id: int, user_id=None):
         res = self.api.delete(f"/bookings/{booking_id}")
+        if user_id is not None:
+            self.store.apply(self.store.scope(self.api.base_url, user_id), "bookings", deleted_ids=[booking_id])
         return res
 
+    # === Snapshot ===
+    # The last bookings list a user saw, with its flights, so the window can
+    # draw it before the server answers
+
+    def get_cached_bookings(self, user_id):
+        """Return the stored (booking, flight) pairs, or None if nothing was saved"""
+        scope = self.store.scope(self.api.base_url, user_id)
+        bookings = self.store.load(scope, "bookings", Booking)
+        flights = self.store.load(scope, "flights", Flight)
+        if bookings is None or flights is None:
+            return None
+        flights = {flight.id: flight for flight in flights[1]}
+        return [(booking, flights[booking.flightId]) for booking in bookings[1] if booking.flightId in flights]
+
+    def save_bookings_snapshot(self, user_id, pairs):
+        """Store the (booking, flight) pairs just fetched for a user"""
+        scope = self.store.scope(self.api.base_url, user_id)
+        flights = {flight.id: flight for _, flight in pairs}
+        self.store.replace(scope, "bookings", [encode_booking(booking) for booking, _ in pairs])
+        self.store.replace(scope, "flights", [encode_flight(flight) for flight in flights.values()])
+
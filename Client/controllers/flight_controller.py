@@ -1,24 +1,198 @@
+from datetime import timedelta
+
 from .api_controller import ApiController
-from models import Flight
+from .flight_index import FlightIndex
+from .replica import Replica
+from models import Flight, decode_flight
+
 
 class FlightController:
     def __init__(self, api: ApiController):
         self.api = api
+        self.index = FlightIndex.for_api(api)
+        self.replica = Replica.for_api(api)
 
     def get_all_flights(self):
-        data = self.api.get("flights")
-        return [Flight(**item) for item in data]
-    
+        # Downloaded once, then kept current through the change feed
+        self.replica.sync(("flights",))
+        flights = self.replica.all("flights")
+        # A full listing is also a fresh snapshot for the search index
+        if len(flights) <= self.index.max_flights:
+            self.index.load(flights)
+        return flights
+
+    def has_flight_snapshot(self):
+        """True if flights can be listed from the local store without a request"""
+        return self.replica.has("flights")
+
+    def iter_flight_pages(self, page_size=2000, first_page_size=50, revalidate=True):
+        """Yield the flight catalogue as lists of flights, page by page.
+
+        Once the replica holds the flights, they are yielded from memory,
+        after a change-feed delta unless ``revalidate`` is False (the caller
+        then brings them up to date with sync_flights). Otherwise pages come
+        from the keyset-paginated flights/page endpoint and fill the replica
+        at the end. Either way the first page is small so the caller can
+        draw something right away; later pages double in size up to
+        ``page_size``. Once the last page is out the search index is
+        refreshed like get_all_flights does.
+        """
+        if self.replica.has("flights"):
+            if revalidate:
+                self.replica.sync(("flights",))
+            flights = self.replica.all("flights")
+            start, limit = 0, min(first_page_size, page_size)
+            while start < len(flights):
+                yield flights[start:start + limit]
+                start += limit
+                limit = min(limit * 2, page_size)
+        else:
+            version = self.replica.feed_version()
+            flights = []
+            after_id = 0
+            limit = min(first_page_size, page_size)
+            while True:
+                page = self.api.get("flights/page", params={"afterId": after_id, "limit": limit}, model=Flight)
+                if page:
+                    flights.extend(page)
+                    yield list(page)
+                if len(page) < limit:
+                    break
+                after_id = page[-1].id
+                limit = min(limit * 2, page_size)
+            self.replica.load_table("flights", flights, version)
+
+        if len(flights) <= self.index.max_flights:
+            self.index.load(flights)
+
+    def sync_flights(self, listed):
+        """Bring the replicated flights up to date with the server.
+
+        Returns (upserted, removed_ids): the flights that are new or changed
+        compared to ``listed`` (what the caller shows, e.g. the pages of
+        ``iter_flight_pages(revalidate=False)``) and the ids that are gone,
+        ready for FlightListModel.apply_changes.
+        """
+        before = {flight.id: flight for flight in listed}
+        self.replica.sync(("flights",), force=True)
+        after = self.replica.all("flights")
+
+        # Replica rows are replaced, never mutated, so identity means unchanged
+        upserted = [flight for flight in after if before.pop(flight.id, None) is not flight]
+        removed_ids = list(before)
+        if upserted or removed_ids:
+            if len(after) <= self.index.max_flights:
+                self.index.load(after)
+        return upserted, removed_ids
+
+    def count_flights(self):
+        return self.api.get("flights/count")
+
+    def search_flights(self, from_id, to_id, departure_date, date_to=None,
+                       min_price=None, max_price=None, sort="departure", limit=100):
+        """Find direct flights for a route departing between two dates.
+
+        ``date_to`` is inclusive and defaults to ``departure_date``. The
+        search runs on the server (api/flights/search), so its cost depends
+        on the number of results, not on the catalogue size. A plain
+        one-day search is answered from the local index instead when a
+        full catalogue load has already filled it.
+        """
+        date_to = date_to or departure_date
+        if (self.index.is_loaded and date_to == departure_date and sort == "departure"
+                and min_price is None and max_price is None):
+            return self.index.search(from_id, to_id, departure_date)[:limit]
+
+        params = {
+            "departureAirportId": from_id,
+            "arrivalAirportId": to_id,
+            "departureFrom": departure_date.isoformat(),
+            "departureTo": (date_to + timedelta(days=1)).isoformat(),
+            "sort": sort,
+            "limit": limit,
+        }
+        if min_price is not None:
+            params["minPrice"] = min_price
+        if max_price is not None:
+            params["maxPrice"] = max_price
+        return list(self.api.get("flights/search", params=params, model=Flight))
+
+    def get_flights_departing(self, start_date, end_date, page_size=2000):
+        """Return every flight departing between two dates (inclusive), for route planning.
+
+        Served from the local index when it is loaded, otherwise from
+        api/flights/search with only a departure window, paging forward
+        from the last departure time seen.
+        """
+        if self.index.is_loaded:
+            return [f for f in self.index.all()
+                    if f.departureAt is not None and start_date <= f.departureAt.date() <= end_date]
+
+        flights = {}
+        departure_from = start_date.isoformat()
+        departure_to = (end_date + timedelta(days=1)).isoformat()
+        while True:
+            page = self.api.get("flights/search", params={
+                "departureFrom": departure_from,
+                "departureTo": departure_to,
+                "sort": "departure",
+                "limit": page_size,
+            }, model=Flight)
+            before = len(flights)
+            for flight in page:
+                flights[flight.id] = flight
+            # The next page starts at the last departure time; flights sharing it are deduplicated
+            if len(page) < page_size or len(flights) == before:
+                break
+            departure_from = page[-1].departureTime
+        return list(flights.values())
+
     def get_flight_by_id(self, flight_id: int):
         # Call the API endpoint for a specific flight
         data = self.api.get(f"flights/{flight_id}")
-        return Flight(**data)
+        return decode_flight(data)
+
+    def iter_flights_by_ids(self, flight_ids, chunk_size=50):
+        """Yield lists of flights for the given ids, one request per chunk"""
+        unique_ids = list(dict.fromkeys(fid for fid in flight_ids if fid is not None))
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            flights = self.api.get("flights", params={"ids": ",".join(str(fid) for fid in chunk)}, model=Flight)
+            wanted = set(chunk)
+            yield [flight for flight in flights if flight.id in wanted]
+
+    def get_flights_by_ids(self, flight_ids):
+        """Return a {flight_id: Flight} dict for the given ids"""
+        flights = {}
+        for page in self.iter_flights_by_ids(flight_ids):
+            for flight in page:
+                flights[flight.id] = flight
+        return flights
 
     def create_flight(self, flight_data):
-        return self.api.post("flights", json=flight_data)
+        """Create a flight; returns the created Flight as echoed by the server"""
+        created = self.api.post("flights", json=flight_data)
+        if not isinstance(created, dict):
+            return created
+        flight = decode_flight(created)
+        self.index.add(flight)
+        self.replica.upsert("flights", flight)
+        return flight
 
     def delete_flight(self, flight_id):
-        return self.api.delete(f"flights/{flight_id}")
+        deleted = self.api.delete(f"flights/{flight_id}")
+        self.index.remove(flight_id)
+        self.replica.remove("flights", flight_id)
+        return deleted
     
     def update_flight(self, plane_id, data):
-        return self.api.put(f"flights/{plane_id}", data)  
+        """Update a flight; returns the updated Flight, or a falsy value on failure"""
+        updated = self.api.put(f"flights/{plane_id}", data)
+        if not updated:
+            return updated
+        # PUT answers 204 No Content, so the new state is the data that was sent
+        flight = decode_flight(updated if isinstance(updated, dict) else data)
+        self.index.add(flight)
+        self.replica.upsert("flights", flight)
+        return flight
+  
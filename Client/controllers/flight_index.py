@@ -0,0 +1,122 @@
+import threading
+import time
+
+
+class FlightIndex:
+    """Client-side search index over the flight catalogue.
+
+    Flights are bucketed by (departure airport, arrival airport, departure
+    date) using their pre-parsed ``departureAt``, so a search is a
+    dictionary lookup. The index is built once per API base URL, kept up to
+    date incrementally by FlightController's create/update/delete calls and
+    rebuilt after ``ttl`` seconds. Catalogues bigger than ``max_flights`` are
+    never downloaded; ``too_large`` tells the caller to search server-side.
+    """
+
+    DEFAULT_TTL = 5 * 60
+    MAX_FLIGHTS = 20000
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, ttl=DEFAULT_TTL, max_flights=MAX_FLIGHTS):
+        self.ttl = ttl
+        self.max_flights = max_flights
+        self.too_large = False
+        self._flights = {}
+        self._buckets = {}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_api(cls, api):
+        """Return the shared index for this API's base URL"""
+        with cls._registry_lock:
+            index = cls._registry.get(api.base_url)
+            if index is None:
+                index = cls()
+                cls._registry[api.base_url] = index
+            return index
+
+    @property
+    def is_loaded(self):
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    @staticmethod
+    def _key(flight):
+        return (flight.departureAirportId, flight.arrivalAirportId, flight.departureAt.date())
+
+    @staticmethod
+    def _departure(flight):
+        return flight.departureAt
+
+    def ensure_loaded(self, count_flights, get_all_flights):
+        """Build the index unless it is fresh; returns False if it is too large"""
+        with self._lock:
+            if self.is_loaded:
+                return True
+            self.too_large = count_flights() > self.max_flights
+            if self.too_large:
+                self.clear()
+                return False
+            flights = get_all_flights()
+            if not self.is_loaded:
+                self.load(flights)
+            return True
+
+    def load(self, flights):
+        """Replace the index contents with the given flights"""
+        with self._lock:
+            self.clear()
+            for flight in flights:
+                self._insert(flight)
+            for bucket in self._buckets.values():
+                bucket.sort(key=self._departure)
+            self._loaded_at = time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._flights = {}
+            self._buckets = {}
+            self._loaded_at = None
+
+    def _insert(self, flight):
+        """Add a flight; returns its bucket, or None if it has no valid departure time"""
+        self._flights[flight.id] = flight
+        if flight.departureAt is None:
+            return None
+        bucket = self._buckets.setdefault(self._key(flight), [])
+        bucket.append(flight)
+        return bucket
+
+    def add(self, flight):
+        """Insert or replace a single flight"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self.remove(flight.id)
+            bucket = self._insert(flight)
+            if bucket is not None:
+                bucket.sort(key=self._departure)
+
+    def remove(self, flight_id):
+        """Drop a single flight from the index"""
+        with self._lock:
+            flight = self._flights.pop(flight_id, None)
+            if flight is None or flight.departureAt is None:
+                return
+            key = self._key(flight)
+            bucket = [f for f in self._buckets.get(key, []) if f.id != flight_id]
+            if bucket:
+                self._buckets[key] = bucket
+            else:
+                self._buckets.pop(key, None)
+
+    def search(self, from_id, to_id, departure_date):
+        """Return flights for a route on a date, ordered by departure time"""
+        with self._lock:
+            return list(self._buckets.get((from_id, to_id, departure_date), []))
+
+    def all(self):
+        with self._lock:
+            return list(self._flights.values())
@@ -0,0 +1,191 @@
+import json
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+
+@dataclass
+class TimingRecord:
+    """Timing and size of one ApiController call.
+
+    Times are in seconds. ``ttfb`` is the time from sending the last attempt
+    until its response headers were parsed; ``total`` covers every attempt,
+    backoff waits and JSON decoding. requests does not expose DNS lookup and
+    TCP connect times, so ``dns`` and ``connect`` stay None unless a
+    transport fills them in.
+    """
+    timestamp: float
+    method: str
+    endpoint: str
+    status: Optional[int]
+    attempts: int
+    total: float
+    ttfb: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    decode: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class RingBufferSink:
+    """Keeps the most recent ``capacity`` records in memory"""
+
+    def __init__(self, capacity=1000):
+        self.records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.records)
+
+
+class JsonLinesSink:
+    """Appends every record as one JSON object per line to ``path``"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record.to_dict(), separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class PrometheusTextSink:
+    """Aggregates records into Prometheus text exposition format.
+
+    ``render()`` returns the current counters and latency sums, ``dump(path)``
+    writes them to a file (e.g. for a node_exporter textfile collector).
+    """
+
+    PREFIX = "israflight_api"
+
+    def __init__(self):
+        self._requests = {}
+        self._seconds = {}
+        self._bytes_in = {}
+        self._bytes_out = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        key = (record.method, record.endpoint, str(record.status or record.error or "none"))
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._seconds[key] = self._seconds.get(key, 0.0) + record.total
+            self._bytes_in[key] = self._bytes_in.get(key, 0) + record.bytes_in
+            self._bytes_out[key] = self._bytes_out.get(key, 0) + record.bytes_out
+
+    @staticmethod
+    def _labels(key):
+        method, endpoint, status = key
+        endpoint = endpoint.split(" ", 1)[-1].replace("\\", "\\\\").replace('"', '\\"')
+        return f'method="{method}",endpoint="{endpoint}",status="{status}"'
+
+    def render(self):
+        metrics = (
+            ("requests_total", "counter", "API calls", self._requests),
+            ("request_seconds_total", "counter", "Total API call time", self._seconds),
+            ("response_bytes_total", "counter", "Response body bytes received", self._bytes_in),
+            ("request_bytes_total", "counter", "Request body bytes sent", self._bytes_out),
+        )
+        lines = []
+        with self._lock:
+            for name, kind, help_text, values in metrics:
+                lines.append(f"# HELP {self.PREFIX}_{name} {help_text}")
+                lines.append(f"# TYPE {self.PREFIX}_{name} {kind}")
+                for key, value in sorted(values.items()):
+                    lines.append(f"{self.PREFIX}_{name}{{{self._labels(key)}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+
+
+class Instrumentation:
+    """Collects TimingRecords from an ApiController and fans them out to sinks.
+
+    Sinks are any objects with an ``emit(record)`` method. The last
+    ``window`` total times per endpoint are kept for ``summary()``.
+    """
+
+    def __init__(self, sinks=None, window=1024):
+        self.sinks = list(sinks) if sinks is not None else [RingBufferSink()]
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def emit(self, record):
+        with self._lock:
+            samples = self._samples.get(record.endpoint)
+            if samples is None:
+                samples = self._samples[record.endpoint] = deque(maxlen=self.window)
+            samples.append(record.total)
+        for sink in list(self.sinks):
+            try:
+                sink.emit(record)
+            except Exception as e:
+                # Instrumentation must never break the request itself
+                print(f"Timing sink {type(sink).__name__} failed: {e}")
+
+    def summary(self):
+        """Return {endpoint: {"count", "p50", "p95", "p99", "max"}} in seconds"""
+        with self._lock:
+            samples = {endpoint: sorted(values) for endpoint, values in self._samples.items()}
+        return {
+            endpoint: {
+                "count": len(values),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1] if values else None,
+            }
+            for endpoint, values in samples.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def body_size(request):
+    """Length of a prepared request's body in bytes"""
+    body = getattr(request, "body", None)
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        # Streaming body of unknown length
+        return 0
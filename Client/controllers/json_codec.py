@@ -0,0 +1,91 @@
+"""JSON decoding for API responses with optional fast backends.
+
+The backend is msgspec when it is installed, then orjson, then the stdlib.
+``decode(body, model)`` turns a JSON array straight into model objects:
+with msgspec, Flight/Booking/Airport lists are decoded directly into the
+slotted dataclasses without building intermediate dicts; otherwise the
+body is parsed with ``loads`` and passed to the model's bulk decoder from
+models.py. Neither library is required.
+"""
+import json
+
+from models import (
+    Airport, Booking, Flight, Plane, parse_datetime,
+    decode_airports, decode_bookings, decode_flights, decode_planes,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKENDS = tuple(name for name, module in (("msgspec", msgspec), ("orjson", orjson)) if module) + ("json",)
+BACKEND = BACKENDS[0]
+
+BULK_DECODERS = {
+    Flight: decode_flights,
+    Booking: decode_bookings,
+    Airport: decode_airports,
+    Plane: decode_planes,
+}
+
+# Models whose field names match the API's camelCase keys, so msgspec can
+# decode into them directly (Plane uses PascalCase fields)
+TYPED_MODELS = (Flight, Booking, Airport)
+
+_typed_decoders = {}
+
+
+def loads(body, backend=None):
+    """Parse a JSON document (bytes or str) into Python objects"""
+    backend = backend or BACKEND
+    if backend == "orjson":
+        return orjson.loads(body)
+    if backend == "msgspec":
+        return msgspec.json.decode(body)
+    return json.loads(body)
+
+
+def _fill_flight_times(flights):
+    parsed = {}
+    for flight in flights:
+        departure = flight.departureTime
+        departure_at = parsed.get(departure)
+        if departure_at is None:
+            departure_at = parsed[departure] = parse_datetime(departure)
+        flight.departureAt = departure_at
+        arrival = flight.arrivalTime
+        arrival_at = parsed.get(arrival)
+        if arrival_at is None:
+            arrival_at = parsed[arrival] = parse_datetime(arrival)
+        flight.arrivalAt = arrival_at
+    return flights
+
+
+def _decode_typed(body, model):
+    decoder = _typed_decoders.get(model)
+    if decoder is None:
+        decoder = _typed_decoders[model] = msgspec.json.Decoder(list[model])
+    items = decoder.decode(body)
+    if model is Flight:
+        _fill_flight_times(items)
+    return items
+
+
+def decode(body, model=None, backend=None):
+    """Decode a response body, into a list of ``model`` objects if given"""
+    backend = backend or BACKEND
+    if model is None:
+        return loads(body, backend)
+    if backend == "msgspec" and model in TYPED_MODELS:
+        try:
+            return _decode_typed(body, model)
+        except msgspec.ValidationError:
+            # Unexpected shape (e.g. PascalCase keys); use the tolerant decoders
+            pass
+    return BULK_DECODERS[model](loads(body, backend))
@@ -1,20 +1,31 @@
 from controllers.api_controller import ApiController
+from controllers.reference_cache import ReferenceCache
 
 
 class PlaneController:
     def __init__(self, api: ApiController):
         self.api = api
+        self.cache = ReferenceCache.for_api(api, "planes")
 
     def get_all_planes(self):
-        return self.api.get("planes")  # GET /planes
+        return self.cache.all()  # GET /planes once, then change-feed deltas
+
+    def get_cached_planes(self):
+        """Planes as last stored on disk, without a request; None before the first download"""
+        return self.cache.cached()
 
         
     def get_plane_by_id(self, plane_id):
-        return self.api.get(f"planes/{plane_id}")
+        return self.cache.get(plane_id)
+
+    def get_cached_plane(self, plane_id):
+        """The plane if it is already held, without a request (safe while painting)"""
+        return self.cache.peek(plane_id)
 
     def add_plane(self, data):
         try:
             response = self.api.post("planes", data)  # POST /planes
+            self.cache.invalidate()
             return {"success": True, "data": response}
         except Exception as e:
             if hasattr(e, 'response') and e.response is not None:
@@ -24,6 +35,7 @@ class PlaneController:
     def update_plane(self, plane_id, data):
         try:
             response = self.api.put(f"planes/{plane_id}", data)  # PUT /planes/{id}
+            self.cache.invalidate()
             return {"success": True, "data": response}
         except Exception as e:
             if hasattr(e, 'response') and e.response is not None:
@@ -32,4 +44,5 @@ class PlaneController:
 
     def delete_plane(self, plane_id):
         self.api.delete(f"planes/{plane_id}")  # DELETE /planes/{id}
+        self.cache.invalidate()
         return True
\ No newline at end of file
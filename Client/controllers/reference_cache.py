@@ -0,0 +1,139 @@
+import threading
+
+import requests
+
+from controllers.replica import Replica
+
+
+class ReferenceCache:
+    """Id-indexed access to a reference collection (airports, planes).
+
+    The rows come from the shared Replica for the API's base URL: the
+    collection is downloaded once and later listings only pull the change
+    feed (at most every few seconds). ``get`` may still wait on the network,
+    for a cold collection or an unknown id, so code that runs while
+    painting uses ``peek`` instead: it never makes a request and queues its
+    misses for ``fetch_pending`` on a worker thread. Caches are shared per
+    (API base URL, collection).
+    """
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, api, collection, replica=None):
+        self.api = api
+        self.collection = collection
+        self.replica = replica or Replica.for_api(api)
+        self._missing = set()
+        self._pending = set()  # ids peek could not find, see fetch_pending
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_api(cls, api, collection):
+        """Return the shared cache for this API's base URL and collection"""
+        key = (api.base_url, collection)
+        with cls._registry_lock:
+            cache = cls._registry.get(key)
+            if cache is None:
+                cache = cls(api, collection)
+                cls._registry[key] = cache
+            return cache
+
+    @staticmethod
+    def item_id(item):
+        return Replica.item_id(item)
+
+    def _sync(self):
+        if self.replica.sync((self.collection,)):
+            with self._lock:
+                self._missing = set()
+
+    def all(self):
+        """Return the full collection, downloading it on first use"""
+        self._sync()
+        return self.replica.all(self.collection)
+
+    def cached(self):
+        """Return the collection as last stored, without any request (None if never downloaded)"""
+        if not self.replica.has(self.collection):
+            return None
+        return self.replica.all(self.collection)
+
+    def get(self, item_id):
+        """Return one item by id, fetching it only if it is not replicated.
+
+        Returns None if the item cannot be fetched; only ids the server
+        answers 404 for are remembered as missing, anything else (a timeout,
+        an open circuit) is requested again on the next lookup.
+        """
+        if not self.replica.has(self.collection):
+            self._sync()
+        try:
+            return self._lookup(item_id)
+        except Exception:
+            return None
+
+    def _lookup(self, item_id):
+        """Return a replicated item or request it; raises if the request fails"""
+        item = self.replica.get(self.collection, item_id)
+        if item is not None or item_id is None or item_id in self._missing:
+            return item
+
+        try:
+            item = self.api.get(f"{self.collection}/{item_id}")
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            item = None
+        if not item:
+            with self._lock:
+                # Remember misses so unknown ids don't cost a request per lookup
+                self._missing.add(item_id)
+        else:
+            self.replica.upsert(self.collection, item)
+        return item
+
+    def peek(self, item_id):
+        """Return one item by id if it is held, without any request.
+
+        A miss returns None and queues the id for ``fetch_pending``.
+        """
+        item = self.replica.get(self.collection, item_id)
+        if item is None and item_id is not None:
+            with self._lock:
+                if item_id not in self._missing:
+                    self._pending.add(item_id)
+        return item
+
+    def has_pending(self):
+        with self._lock:
+            return bool(self._pending)
+
+    def fetch_pending(self):
+        """Look up the ids ``peek`` missed (blocks, run it on a worker thread);
+        returns True if any of them was found. Ids whose lookup failed stay
+        pending for the next call."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        found = False
+        failed = set()
+        for item_id in pending:
+            try:
+                if not self.replica.has(self.collection):
+                    self._sync()
+                item = self._lookup(item_id)
+            except Exception:
+                failed.add(item_id)
+                continue
+            if item is not None:
+                found = True
+        if failed:
+            with self._lock:
+                self._pending |= failed
+        return found
+
+    def invalidate(self):
+        """Make the next lookup pull the latest changes"""
+        with self._lock:
+            self._missing = set()
+        self.replica.expire()
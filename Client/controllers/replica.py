@@ -0,0 +1,243 @@
+import threading
+import time
+
+import requests
+
+from controllers.snapshot_store import SnapshotStore
+from models import Flight, decode_flights, encode_flight
+
+
+class Replica:
+    """Local copy of the flights, planes and airports tables kept current
+    through the server's change feed.
+
+    A table is downloaded in full the first time it is synced, after reading
+    the feed's version (api/changes/version); every later sync asks
+    api/changes for what changed since then and applies it, so reopening a
+    screen costs one small request instead of a full download. The feed
+    returns the current state of changed rows, so one delta can be applied
+    to every table regardless of the version each one started from.
+
+    Tables and versions are kept in a SnapshotStore under the API base URL,
+    so a restarted client can draw from them at once (``cached``) and then
+    resume with a delta; each table is read from the store the first time
+    it is used. Flights are kept as Flight objects, planes and airports as
+    the API's dicts. A server without the change feed (404) gets full
+    downloads instead, at most once per ``sync_interval`` like the deltas.
+    """
+
+    TABLES = ("flights", "planes", "airports")
+    SYNC_INTERVAL = 5
+    BATCH_LIMIT = 2000
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, api, store=None, sync_interval=SYNC_INTERVAL):
+        self.api = api
+        self.store = store
+        self.scope = SnapshotStore.scope(api.base_url)
+        self.sync_interval = sync_interval
+        self.feed_supported = True
+        self._tables = {name: {} for name in self.TABLES}
+        self._versions = {}  # table -> change version it is current to (None without a feed)
+        self._restored = set()  # tables already looked up in the store
+        self._synced_at = None
+        # _sync_lock is held across requests; _lock only around table updates,
+        # so reads (e.g. ``cached`` on the GUI thread) never wait on the network
+        self._sync_lock = threading.Lock()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_api(cls, api):
+        """Return the shared replica for this API's base URL"""
+        with cls._registry_lock:
+            replica = cls._registry.get(api.base_url)
+            if replica is None:
+                replica = cls(api, SnapshotStore.shared())
+                cls._registry[api.base_url] = replica
+            return replica
+
+    @staticmethod
+    def item_id(item):
+        if isinstance(item, Flight):
+            return item.id
+        return SnapshotStore.row_id(item)
+
+    # === Reading ===
+
+    def has(self, table):
+        """True once the table has been downloaded or restored from the store"""
+        with self._lock:
+            self._restore(table)
+            return table in self._versions
+
+    def all(self, table):
+        with self._lock:
+            self._restore(table)
+            return list(self._tables[table].values())
+
+    def get(self, table, item_id):
+        with self._lock:
+            self._restore(table)
+            return self._tables[table].get(item_id)
+
+    def cached(self, tables=TABLES):
+        """True if every table can be read without a request (possibly stale)"""
+        return all(self.has(table) for table in tables)
+
+    # === Syncing ===
+
+    def sync(self, tables=TABLES, force=False):
+        """Bring ``tables`` up to date; returns the number of rows changed.
+
+        Within ``sync_interval`` seconds of the last sync no request is made
+        unless ``force`` is set or one of the tables was never downloaded.
+        """
+        with self._sync_lock:
+            with self._lock:
+                for table in tables:
+                    self._restore(table)
+                missing = [table for table in tables if table not in self._versions]
+                fresh = self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval
+                if fresh and not missing and not force:
+                    return 0
+
+            changed = self._download(missing) if missing else 0
+            if self.feed_supported:
+                changed += self._pull()
+            elif not missing:
+                changed += self._download(tables)
+            self._synced_at = time.monotonic()
+            return changed
+
+    def expire(self):
+        """Make the next sync contact the server (e.g. after a local write)"""
+        with self._lock:
+            self._synced_at = None
+
+    def feed_version(self):
+        """Current change version, or None when the server has no change feed"""
+        if not self.feed_supported:
+            return None
+        try:
+            return self.api.get("changes/version")["version"]
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            self.feed_supported = False
+            return None
+
+    def _download(self, tables):
+        # The version is read first: changes made during the download are
+        # pulled again by the next delta, and applying them twice is harmless
+        version = self.feed_version()
+        changed = 0
+        for table in tables:
+            if table == "flights":
+                items = self.api.get("flights", model=Flight)
+            else:
+                items = self.api.get(table) or []
+            self.load_table(table, items, version)
+            changed += len(items)
+        return changed
+
+    def _pull(self):
+        """Apply change feed batches until caught up; returns the rows changed"""
+        with self._lock:
+            if not self._versions:
+                return 0
+            since = min(self._versions.values())
+        changed = 0
+        while True:
+            try:
+                changes = self.api.get("changes", params={"since": since, "limit": self.BATCH_LIMIT})
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                # Resumed from disk against a server without the feed
+                self.feed_supported = False
+                return changed + self._download(list(self._versions))
+            if changes.get("reset"):
+                # The server does not know our version (e.g. a recreated database)
+                return changed + self._download(list(self._versions))
+            since = changes["version"]
+            changed += self.apply(changes, since)
+            if not changes.get("hasMore"):
+                return changed
+
+    def apply(self, changes, version):
+        """Apply one api/changes response to the downloaded tables, which are
+        then current to ``version``; returns the rows changed"""
+        changed = 0
+        stored = []
+        deleted = changes.get("deleted") or {}
+        with self._lock:
+            for table in self._versions:
+                rows = self._tables[table]
+                raw_items = changes.get(table) or []
+                items = decode_flights(raw_items) if table == "flights" else raw_items
+                for item in items:
+                    rows[self.item_id(item)] = item
+                removed = deleted.get(table) or []
+                for item_id in removed:
+                    rows.pop(item_id, None)
+                changed += len(items) + len(removed)
+
+                if version != self._versions[table] or items or removed:
+                    self._versions[table] = max(self._versions[table], version)
+                    stored.append((table, raw_items, removed, self._versions[table]))
+
+        # Written after releasing the lock so readers are not held up by the disk
+        if self.store is not None:
+            for table, raw_items, removed, table_version in stored:
+                if table_version is not None:
+                    self.store.apply(self.scope, table, raw_items, removed, table_version)
+        return changed
+
+    def load_table(self, table, items, version):
+        """Replace a table with a full download that started at feed ``version``
+        (see FlightController.iter_flight_pages)"""
+        rows = {self.item_id(item): item for item in items}
+        unique = list(rows.values())
+        with self._lock:
+            self._restored.add(table)
+            self._tables[table] = rows
+            self._versions[table] = version
+        self._store_table(table, unique, version)
+
+    # === Local writes ===
+
+    def upsert(self, table, item):
+        """Record a write made by this client before the feed reports it"""
+        with self._lock:
+            if table in self._versions:
+                self._tables[table][self.item_id(item)] = item
+
+    def remove(self, table, item_id):
+        with self._lock:
+            self._tables[table].pop(item_id, None)
+
+    # === Store ===
+
+    def _restore(self, table):
+        """Read a table from the store the first time it is needed"""
+        if table in self._restored:
+            return
+        self._restored.add(table)
+        if self.store is None or table in self._versions:
+            return
+        stored = self.store.load(self.scope, table, Flight if table == "flights" else None)
+        if stored is None or stored[0] is None:
+            return
+        version, items = stored
+        self._tables[table] = {self.item_id(item): item for item in items}
+        self._versions[table] = version
+
+    def _store_table(self, table, rows, version):
+        # Tables without a feed version cannot be resumed, so they are not stored
+        if self.store is None or version is None:
+            return
+        if table == "flights":
+            rows = [encode_flight(flight) for flight in rows]
+        self.store.replace(self.scope, table, rows, version)
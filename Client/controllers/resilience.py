@@ -0,0 +1,146 @@
+import random
+import re
+import threading
+import time
+
+import requests
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+
+
+def endpoint_template(method, path):
+    """Return "METHOD /path/{id}" for a request path, grouping numeric ids"""
+    path = path.split("?", 1)[0].strip("/").lower()
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    return f"{method.upper()} /" + "/".join(segments)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while an endpoint's circuit is open"""
+
+    def __init__(self, endpoint, retry_in):
+        super().__init__(f"{endpoint} is unavailable, retrying in {retry_in:.0f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """When and how long to wait before resending a failed request.
+
+    Only idempotent methods are retried; a POST is retried only when the
+    caller supplied an idempotency key. Delays follow exponential backoff
+    with full jitter: a random wait in [0, min(max_delay, base * 2**attempt)].
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({502, 503, 504})
+
+    def __init__(self, max_retries=2, base_delay=0.25, max_delay=4.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def can_retry(self, method, idempotency_key=None):
+        return method in self.IDEMPOTENT_METHODS or idempotency_key is not None
+
+    def should_retry(self, attempt, response=None, error=None):
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return response is not None and response.status_code in self.RETRY_STATUSES
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast with CircuitOpenError for ``reset_timeout`` seconds.
+    Then one trial request is let through (half-open): success closes the
+    circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self, endpoint):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(endpoint, max(remaining, 0))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """Count a failure; return True if this opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                tripped = self.state != self.OPEN
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return tripped
+            return False
+
+
+class Resilience:
+    """Retry policy, circuit breakers and counters for one ApiController.
+
+    Breakers and counters are kept per endpoint template, e.g.
+    "GET /flights/{id}". ``stats()`` returns a snapshot of the counters:
+    requests, retries, failures, trips (circuit opened) and short_circuits
+    (requests refused while open).
+    """
+
+    COUNTERS = ("requests", "retries", "failures", "trips", "short_circuits")
+
+    def __init__(self, retry=None, failure_threshold=5, reset_timeout=30.0, connect_timeout=5.0):
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.connect_timeout = connect_timeout
+        self._breakers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint):
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def count(self, endpoint, counter):
+        with self._lock:
+            counters = self._counters.setdefault(endpoint, dict.fromkeys(self.COUNTERS, 0))
+            counters[counter] += 1
+
+    def timeout(self, read_timeout):
+        return (self.connect_timeout, read_timeout)
+
+    def stats(self):
+        with self._lock:
+            snapshot = {endpoint: dict(counters) for endpoint, counters in self._counters.items()}
+            for endpoint, breaker in self._breakers.items():
+                snapshot.setdefault(endpoint, dict.fromkeys(self.COUNTERS, 0))["state"] = breaker.state
+            return snapshot
@@ -0,0 +1,166 @@
+import json
+import os
+import sqlite3
+import threading
+
+from config import CACHE_DIR
+from controllers import json_codec
+
+
+class SnapshotStore:
+    """SQLite store of API rows, so windows can draw before the network answers.
+
+    Rows are grouped by scope and table. The scope is the API base URL for
+    shared reference data, plus the user id for per-user data (see
+    ``scope``). Each row is kept as the API's JSON object, and a table has
+    an optional change-feed version. Loading a table joins the stored
+    objects into one JSON array and decodes it in one call, with the fast
+    json_codec backends and straight into models when ``model`` is given.
+
+    The database runs in WAL mode. Writes go through one connection under
+    a lock, and every thread reads through a connection of its own, so a
+    snapshot read on the GUI thread never waits for a worker that is
+    writing a delta. (An in-memory database cannot be shared between
+    connections, so it reads through the writer.)
+    """
+
+    FILENAME = "snapshots.sqlite3"
+
+    cache_dir = CACHE_DIR
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()  # serializes writes (and reads of an in-memory store)
+        self._local = threading.local()
+        self._readers = []  # every thread's read connection, closed by close()
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " scope TEXT NOT NULL, name TEXT NOT NULL, version INTEGER,"
+                " PRIMARY KEY (scope, name))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rows ("
+                " scope TEXT NOT NULL, name TEXT NOT NULL, id INTEGER NOT NULL, body TEXT NOT NULL,"
+                " PRIMARY KEY (scope, name, id)) WITHOUT ROWID"
+            )
+
+    @classmethod
+    def shared(cls):
+        """Return the application-wide store in ``cache_dir``"""
+        with cls._shared_lock:
+            if cls._shared is None or os.path.dirname(cls._shared.path) != cls.cache_dir:
+                cls._shared = cls(os.path.join(cls.cache_dir, cls.FILENAME))
+            return cls._shared
+
+    @staticmethod
+    def scope(base_url, user_id=None):
+        return base_url if user_id is None else f"{base_url}#user={user_id}"
+
+    @staticmethod
+    def row_id(row):
+        """Key of an API row; the API answers with "id" or "Id" depending on the endpoint"""
+        return row.get("id", row.get("Id"))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+
+    def _reader(self):
+        """This thread's read connection"""
+        reader = getattr(self._local, "db", None)
+        if reader is None:
+            reader = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._local.db = reader
+            with self._lock:
+                self._readers.append(reader)
+        return reader
+
+    # === Reading ===
+
+    def load(self, scope, name, model=None):
+        """Return (version, rows) for a stored table, or None if it was never saved"""
+        if self.path == ":memory:":
+            with self._lock:
+                stored = self._read(self._db, scope, name)
+        else:
+            stored = self._read(self._reader(), scope, name)
+        if stored is None:
+            return None
+        version, bodies = stored
+        rows = json_codec.decode("[" + ",".join(bodies) + "]", model)
+        return version, rows
+
+    @staticmethod
+    def _read(db, scope, name):
+        # One read transaction, so the version matches the rows even while a delta is written
+        db.execute("BEGIN")
+        try:
+            snapshot = db.execute(
+                "SELECT version FROM snapshots WHERE scope = ? AND name = ?", (scope, name)
+            ).fetchone()
+            if snapshot is None:
+                return None
+            bodies = [body for (body,) in db.execute(
+                "SELECT body FROM rows WHERE scope = ? AND name = ? ORDER BY id", (scope, name)
+            )]
+            return snapshot[0], bodies
+        finally:
+            db.execute("COMMIT")
+
+    # === Writing ===
+
+    def replace(self, scope, name, items, version=None):
+        """Store a full table, replacing whatever was stored before"""
+        rows = [(scope, name, self.row_id(item), json.dumps(item)) for item in items]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM rows WHERE scope = ? AND name = ?", (scope, name))
+                self._db.executemany("INSERT INTO rows (scope, name, id, body) VALUES (?, ?, ?, ?)", rows)
+                self._save_version(scope, name, version)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def apply(self, scope, name, upserted=(), deleted_ids=(), version=None):
+        """Store a delta: insert or replace ``upserted`` rows, drop ``deleted_ids``"""
+        rows = [(scope, name, self.row_id(item), json.dumps(item)) for item in upserted]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO rows (scope, name, id, body) VALUES (?, ?, ?, ?)", rows)
+                self._db.executemany(
+                    "DELETE FROM rows WHERE scope = ? AND name = ? AND id = ?",
+                    [(scope, name, item_id) for item_id in deleted_ids],
+                )
+                self._save_version(scope, name, version)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _save_version(self, scope, name, version):
+        self._db.execute(
+            "INSERT OR REPLACE INTO snapshots (scope, name, version) VALUES (?, ?, ?)", (scope, name, version)
+        )
+
+    def drop(self, scope):
+        """Forget every table stored for a scope"""
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.execute("DELETE FROM rows WHERE scope = ?", (scope,))
+            self._db.execute("DELETE FROM snapshots WHERE scope = ?", (scope,))
+            self._db.execute("COMMIT")
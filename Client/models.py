@@ -1,7 +1,24 @@
 # models.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional, List
 
+
+def parse_datetime(value):
+    """Parse an ISO 8601 string from the API; None if it is missing or invalid"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _camel_keys(item):
+    """Normalize PascalCase keys ("DepartureTime") to the API's camelCase"""
+    return {key[:1].lower() + key[1:]: value for key, value in item.items()}
+
+
 @dataclass
 class Admin:
     Id: Optional[int]
@@ -9,7 +26,7 @@ class Admin:
     Password: str  
     Email: str 
 
-@dataclass
+@dataclass(slots=True)
 class Airport:
     id: Optional[int]
     name: str
@@ -24,7 +41,7 @@ class Auth:
     Role: str
     Password: Optional[str]  = None
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     id: Optional[int]
     frequentFlyerId: int
@@ -32,7 +49,7 @@ class Booking:
     bookingDate: str  # datetime string
 
 
-@dataclass
+@dataclass(slots=True)
 class Flight:
     id: Optional[int]
     planeId: int
@@ -41,6 +58,9 @@ class Flight:
     departureTime: str  # datetime string
     arrivalTime: str  # datetime string
     price: float
+    # Parsed once by decode_flight(s); None if the strings are not valid ISO 8601
+    departureAt: Optional[datetime] = field(default=None, repr=False, compare=False)
+    arrivalAt: Optional[datetime] = field(default=None, repr=False, compare=False)
 
 @dataclass
 class FrequentFlyer:
@@ -54,7 +74,7 @@ class FrequentFlyer:
     DateOfBirth: str  # datetime string
     PassportNumber: str
 
-@dataclass
+@dataclass(slots=True)
 class Plane:
     Id: Optional[int]
     Manufacturer: str
@@ -68,8 +88,92 @@ class Ticket:
     Id: Optional[int]
     BookingId: int
     FlightId: int
-    PdfUrl: str  
+    PdfUrl: str
+
+
+# === Decoders ===
+# One function per model turns API dicts (camelCase, or PascalCase from
+# request payloads) into model objects. The *_list variants are the bulk
+# path for whole collections.
+
+def decode_flight(item):
+    if "id" not in item:
+        item = _camel_keys(item)
+    departure = item.get("departureTime")
+    arrival = item.get("arrivalTime")
+    return Flight(
+        item.get("id"), item.get("planeId"), item.get("departureAirportId"), item.get("arrivalAirportId"),
+        departure, arrival, item.get("price"), parse_datetime(departure), parse_datetime(arrival),
+    )
+
+
+def decode_flights(items):
+    # Many flights share departure/arrival slots, so each distinct string is parsed once
+    parsed = {}
+    flights = []
+    append = flights.append
+    for item in items:
+        if "id" not in item:
+            append(decode_flight(item))
+            continue
+        departure = item["departureTime"]
+        arrival = item["arrivalTime"]
+        departure_at = parsed.get(departure)
+        if departure_at is None:
+            departure_at = parsed[departure] = parse_datetime(departure)
+        arrival_at = parsed.get(arrival)
+        if arrival_at is None:
+            arrival_at = parsed[arrival] = parse_datetime(arrival)
+        append(Flight(
+            item["id"], item["planeId"], item["departureAirportId"], item["arrivalAirportId"],
+            departure, arrival, item["price"], departure_at, arrival_at,
+        ))
+    return flights
+
+
+def decode_booking(item):
+    if "id" not in item:
+        item = _camel_keys(item)
+    return Booking(item.get("id"), item.get("frequentFlyerId"), item.get("flightId"), item.get("bookingDate"))
+
+
+def decode_bookings(items):
+    return [decode_booking(item) for item in items]
+
+
+def decode_airport(item):
+    if "id" not in item:
+        item = _camel_keys(item)
+    return Airport(item.get("id"), item.get("name"), item.get("code"), item.get("city"), item.get("country"))
+
+
+def decode_airports(items):
+    return [decode_airport(item) for item in items]
+
+
+def decode_plane(item):
+    if "Id" in item:
+        return Plane(item.get("Id"), item.get("Manufacturer"), item.get("Nickname"), item.get("Year"), item.get("ImageUrl"))
+    return Plane(item.get("id"), item.get("manufacturer"), item.get("nickname"), item.get("year"), item.get("imageUrl"))
+
+
+def decode_planes(items):
+    return [decode_plane(item) for item in items]
+
 
+# === Encoders ===
+# The inverse of the decoders, for storing models in the API's JSON shape.
 
+def encode_flight(flight):
+    return {
+        "id": flight.id, "planeId": flight.planeId,
+        "departureAirportId": flight.departureAirportId, "arrivalAirportId": flight.arrivalAirportId,
+        "departureTime": flight.departureTime, "arrivalTime": flight.arrivalTime, "price": flight.price,
+    }
 
 
+def encode_booking(booking):
+    return {
+        "id": booking.id, "frequentFlyerId": booking.frequentFlyerId,
+        "flightId": booking.flightId, "bookingDate": booking.bookingDate,
+    }
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QUrl, QStandardPaths, QSize, Qt
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+logger = logging.getLogger(__name__)
+
+
+class ImageLoader(QObject):
+    """Non-blocking image loader with a memory LRU and an on-disk cache.
+
+    Images are fetched with QNetworkAccessManager, so nothing blocks the GUI
+    thread. Decoded, pre-scaled pixmaps are kept in an LRU keyed by
+    (url, size). Raw image bytes are stored on disk keyed by URL together with
+    their ETag/Last-Modified validators; a disk hit is shown immediately and
+    then revalidated with a conditional request.
+    """
+
+    MEMORY_CAPACITY = 128
+    TIMEOUT_MS = 15000
+
+    _instance = None
+
+    def __init__(self, cache_dir=None, parent=None):
+        super().__init__(parent)
+        self.network = QNetworkAccessManager(self)
+        self.cache_dir = cache_dir or os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.CacheLocation) or ".cache",
+            "israflight", "images"
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._pixmaps = OrderedDict()
+        self._pending = {}
+        self._revalidated = set()
+
+    @classmethod
+    def instance(cls):
+        """Return the application-wide loader"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # === Memory cache ===
+
+    def _remember(self, key, pixmap):
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.MEMORY_CAPACITY:
+            self._pixmaps.popitem(last=False)
+
+    def _forget_url(self, url):
+        for key in [k for k in self._pixmaps if k[0] == url]:
+            del self._pixmaps[key]
+
+    # === Disk cache ===
+
+    def _paths(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, name)
+        return base + ".img", base + ".json"
+
+    def _read_disk(self, url):
+        data_path, meta_path = self._paths(url)
+        try:
+            with open(data_path, "rb") as f:
+                data = f.read()
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+        return data, meta
+
+    def _write_disk(self, url, data, meta):
+        data_path, meta_path = self._paths(url)
+        try:
+            with open(data_path, "wb") as f:
+                f.write(data)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            # The image is still shown, it is just fetched again next session
+            logger.warning("Could not cache image %s: %s", url, e)
+
+    # === Loading ===
+
+    @staticmethod
+    def _scaled(data, size):
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data):
+            return None
+        return pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def load(self, url, size, callback):
+        """Deliver a pixmap for ``url`` scaled to ``size`` to ``callback``.
+
+        ``callback(pixmap)`` receives None when the image cannot be loaded.
+        It may be called twice: once from the disk cache and again if the
+        server reports that the image changed.
+        """
+        size = QSize(size) if not isinstance(size, QSize) else size
+        key = (url, size.width(), size.height())
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            callback(pixmap)
+            if url in self._revalidated:
+                return
+
+        data, meta = (None, {}) if pixmap is not None else self._read_disk(url)
+        if data:
+            pixmap = self._scaled(data, size)
+            if pixmap is not None:
+                self._remember(key, pixmap)
+                callback(pixmap)
+                if url in self._revalidated:
+                    return
+        elif pixmap is not None:
+            _, meta = self._read_disk(url)
+
+        waiters = self._pending.get(url)
+        if waiters is not None:
+            waiters.append((size, callback, pixmap is not None))
+            return
+        self._pending[url] = [(size, callback, pixmap is not None)]
+
+        request = QNetworkRequest(QUrl(url))
+        request.setTransferTimeout(self.TIMEOUT_MS)
+        if pixmap is not None:
+            if meta.get("etag"):
+                request.setRawHeader(b"If-None-Match", meta["etag"].encode("latin-1"))
+            if meta.get("last_modified"):
+                request.setRawHeader(b"If-Modified-Since", meta["last_modified"].encode("latin-1"))
+        reply = self.network.get(request)
+        reply.finished.connect(lambda r=reply, u=url: self._on_finished(u, r))
+
+    def _on_finished(self, url, reply):
+        waiters = self._pending.pop(url, [])
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        succeeded = reply.error() == QNetworkReply.NoError
+
+        if succeeded and status == 304:
+            # Cached copy is still current; most callers already have it
+            self._revalidated.add(url)
+            data, _ = self._read_disk(url)
+            waiters = [w for w in waiters if not w[2]]
+        elif succeeded and status == 200:
+            data = bytes(reply.readAll())
+            if not QImage().loadFromData(data):
+                # Not an image (e.g. an HTML error page): keep the cached copy
+                # and try again on the next load
+                data = b""
+        else:
+            # Failed requests are retried on the next load
+            data = b""
+        if data and status == 200:
+            self._revalidated.add(url)
+            headers = {
+                bytes(name).decode("latin-1").lower(): bytes(value).decode("latin-1")
+                for name, value in reply.rawHeaderPairs()
+            }
+            meta = {
+                "etag": headers.get("etag", ""),
+                "last_modified": headers.get("last-modified", ""),
+            }
+            self._forget_url(url)
+            self._write_disk(url, data, meta)
+
+        for size, callback, has_cached in waiters:
+            pixmap = self._scaled(data, size) if data else None
+            if pixmap is not None:
+                self._remember((url, size.width(), size.height()), pixmap)
+            elif has_cached:
+                # Keep showing the cached copy if revalidation failed
+                continue
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                # Target widget was deleted while the image was loading
+                pass
+        reply.deleteLater()
+
+    def load_into(self, label, url, width, height):
+        """Load ``url`` into a QLabel, showing placeholder text meanwhile"""
+        label.setProperty("image_url", url)
+        if not url:
+            self._show_text(label, "No Image")
+            return
+
+        self._show_text(label, "Loading image...")
+
+        def apply(pixmap):
+            # Ignore late results for a URL the label no longer shows
+            if label.property("image_url") != url:
+                return
+            if pixmap is None:
+                self._show_text(label, "Image failed to load")
+            else:
+                label.setStyleSheet("border: none;")
+                label.setPixmap(pixmap)
+
+        self.load(url, QSize(width, height), apply)
+
+    @staticmethod
+    def _show_text(label, text):
+        label.setPixmap(QPixmap())
+        label.setText(text)
+        label.setStyleSheet("color: #666; font-style: italic;")
@@ -1,28 +1,97 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
-from reportlab.graphics.barcode import code128
+from reportlab.graphics.barcode import code128, qrencoder
 from reportlab.lib.units import cm, mm
-import datetime, os
-import qrcode
-from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+import datetime, itertools, os
 
+# Tickets handed to one worker process at a time, see generate_ticket_pdfs
+BATCH_CHUNK_SIZE = 16
 
-def generate_qr_code(data, path="qr_temp.png"):
-    img = qrcode.make(data)
-    img.save(path)
-    return path
+
+def qr_modules(data):
+    """Encode data as a QR code (level M); returns rows of truthy dark modules"""
+    qr = qrencoder.QRCode(None, qrencoder.QRErrorCorrectLevel.M)
+    qr.addData(data)
+    qr.make()
+    return qr.modules
+
+
+def draw_qr_code(c, data, x, y, size, border=4):
+    """Draw the QR code for data as a size x size square at (x, y).
+
+    Runs of dark modules become rectangles of one filled path, so nothing
+    is rasterised or written to disk and concurrent tickets share no state.
+    """
+    modules = qr_modules(data)
+    box = size / (len(modules) + 2 * border)
+    path = c.beginPath()
+    for row, cells in enumerate(modules):
+        top = y + size - (row + border + 1) * box
+        col = 0
+        for dark, run in itertools.groupby(map(bool, cells)):
+            count = len(list(run))
+            if dark:
+                path.rect(x + (col + border) * box, top, count * box, box)
+            col += count
+    c.saveState()
+    c.setFillColor(colors.black)
+    c.drawPath(path, stroke=0, fill=1)
+    c.restoreState()
 
 
-def generate_ticket_pdf(booking, flight, traveler_name, dep_airport_name, arr_airport_name):
+def ticket_filename(booking, traveler_name):
+    return f"PDF_files/ticket_{traveler_name.replace(' ', '_')}_{booking.id}.pdf"
+
+
+def generate_ticket_pdf(booking, flight, traveler_name, dep_airport_name, arr_airport_name, filename=None):
     """
     Generates a boarding pass PDF for a booking.
     traveler_name, dep_airport_name, arr_airport_name are required.
+    filename defaults to ticket_filename(booking, traveler_name).
     """
-    filename = f"PDF_files/ticket_{traveler_name.replace(' ', '_')}_{booking.id}.pdf"
+    filename = filename or ticket_filename(booking, traveler_name)
     os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
 
     c = canvas.Canvas(filename, pagesize=A4)
+    draw_ticket(c, booking, flight, traveler_name, dep_airport_name, arr_airport_name)
+    c.showPage()
+    c.save()
+    return os.path.abspath(filename)
+
+
+# === Boarding pass layout ===
+# Everything that is the same on every ticket (header, boxes, field labels)
+# is drawn by draw_ticket_layout; the values are stamped after the labels.
+# A canvas holding many tickets keeps the layout as one form XObject that
+# every page places, so it is drawn and stored once per document.
+
+TICKET_LAYOUT = "ticketLayout"
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+PASSENGER_Y = PAGE_HEIGHT - 140
+FLIGHT_Y = PASSENGER_Y - 120
+CODES_Y = 160
+
+# (font, size, x, y, label, color), in the order draw_ticket passes values
+TICKET_FIELDS = (
+    ("Helvetica-Bold", 16, 70, PASSENGER_Y - 20, "Passenger: ", colors.black),
+    ("Helvetica", 14, 70, PASSENGER_Y - 45, "Booking ID: ", colors.black),
+    ("Helvetica", 14, 300, PASSENGER_Y - 45, "User ID: ", colors.black),
+    ("Helvetica-Bold", 16, 70, FLIGHT_Y - 20, "From: ", colors.black),
+    ("Helvetica-Bold", 16, 70, FLIGHT_Y - 50, "To:   ", colors.black),
+    ("Helvetica", 14, 70, FLIGHT_Y - 80, "Departure: ", colors.black),
+    ("Helvetica", 14, 350, FLIGHT_Y - 80, "Arrival: ", colors.black),
+    ("Helvetica-Oblique", 10, 60, 60, "Issued: ", colors.gray),
+)
+
+# Where each value starts: right after its label
+TICKET_VALUE_X = tuple(x + stringWidth(label, font, size) for font, size, x, _, label, _ in TICKET_FIELDS)
+
+
+def draw_ticket_layout(c):
+    """Draw the static part of a boarding pass"""
     width, height = A4
 
     # === Header ===
@@ -33,44 +102,169 @@ def generate_ticket_pdf(booking, flight, traveler_name, dep_airport_name, arr_ai
     c.setLineWidth(2)
     c.line(50, height - 80, width - 50, height - 80)
 
-    # === Passenger Info ===
-    y = height - 140
+    # === Passenger and flight boxes ===
     c.setFillColor(colors.lightgrey)
-    c.roundRect(50, y-60, width-100, 70, 10, fill=True, stroke=False)
-    c.setFillColor(colors.black)
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(70, y-20, f"Passenger: {traveler_name}")
-    c.setFont("Helvetica", 14)
-    c.drawString(70, y-45, f"Booking ID: {booking.id}")
-    c.drawString(300, y-45, f"User ID: {booking.frequentFlyerId}")
-
-    # === Flight Info ===
-    y -= 120
+    c.roundRect(50, PASSENGER_Y-60, width-100, 70, 10, fill=True, stroke=False)
     c.setFillColor(colors.whitesmoke)
-    c.roundRect(50, y-100, width-100, 110, 10, fill=True, stroke=True)
-    c.setFillColor(colors.black)
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(70, y-20, f"From: {dep_airport_name} ({flight.departureAirportId})")
-    c.drawString(70, y-50, f"To:   {arr_airport_name} ({flight.arrivalAirportId})")
-    c.setFont("Helvetica", 14)
-    c.drawString(70, y-80, f"Departure: {flight.departureTime}")
-    c.drawString(350, y-80, f"Arrival: {flight.arrivalTime}")
+    c.roundRect(50, FLIGHT_Y-100, width-100, 110, 10, fill=True, stroke=True)
+
+    # === Labels ===
+    for font, size, x, y, label, color in TICKET_FIELDS:
+        c.setFillColor(color)
+        c.setFont(font, size)
+        c.drawString(x, y, label)
+
+
+def use_ticket_layout(c):
+    """Place the static layout on the current page, defining it on first use"""
+    if not c.hasForm(TICKET_LAYOUT):
+        c.beginForm(TICKET_LAYOUT)
+        draw_ticket_layout(c)
+        c.endForm()
+    c.doForm(TICKET_LAYOUT)
+
+
+def issued_at(booking):
+    """Issue time printed on a ticket: the booking date, so a ticket rendered
+    again (or reused from disk) always shows the same time"""
+    try:
+        return datetime.datetime.fromisoformat(booking.bookingDate).strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return str(booking.bookingDate or "")
+
+
+def draw_ticket(c, booking, flight, traveler_name, dep_airport_name, arr_airport_name,
+                shared_layout=False):
+    """Draw one boarding pass on the current page of canvas c.
+
+    Pass ``shared_layout=True`` when the canvas will hold several tickets.
+    """
+    if shared_layout:
+        use_ticket_layout(c)
+    else:
+        draw_ticket_layout(c)
+
+    values = (
+        traveler_name,
+        str(booking.id),
+        str(booking.frequentFlyerId),
+        f"{dep_airport_name} ({flight.departureAirportId})",
+        f"{arr_airport_name} ({flight.arrivalAirportId})",
+        flight.departureTime,
+        flight.arrivalTime,
+        issued_at(booking),
+    )
+    for (font, size, _, y, _, color), x, value in zip(TICKET_FIELDS, TICKET_VALUE_X, values):
+        c.setFillColor(color)
+        c.setFont(font, size)
+        c.drawString(x, y, value)
 
     # === Barcode and QR ===
-    y = 160
+    c.setFillColor(colors.black)
     barcode_value = f"{booking.id}-{flight.id}-{booking.frequentFlyerId}"
     barcode = code128.Code128(barcode_value, barHeight=25*mm, barWidth=1.0)
-    barcode.drawOn(c, 60, y)
+    barcode.drawOn(c, 60, CODES_Y)
     qr_data = f"Booking:{booking.id}, Flight:{flight.id}, User:{booking.frequentFlyerId}"
-    qr_path = generate_qr_code(qr_data)
-    qr_img = ImageReader(qr_path)
-    c.drawImage(qr_img, width-180, y-10, width=100, height=100)
+    draw_qr_code(c, qr_data, PAGE_WIDTH-180, CODES_Y-10, 100)
 
-    # === Footer ===
-    c.setFont("Helvetica-Oblique", 10)
-    c.setFillColor(colors.gray)
-    c.drawString(60, 60, f"Issued: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    c.showPage()
+# === Batches ===
+
+def _render_files(tickets):
+    # Runs in a worker process
+    return [generate_ticket_pdf(*ticket) for ticket in tickets]
+
+
+def _render_pages(tickets, path):
+    # Runs in a worker process (or inline): one page per ticket in one PDF
+    c = canvas.Canvas(path, pagesize=A4)
+    for ticket in tickets:
+        draw_ticket(c, *ticket, shared_layout=True)
+        c.showPage()
     c.save()
-    return os.path.abspath(filename)
+    return path
+
+
+def _pdf_writer():
+    # pypdf is optional and only needed to join the parts of a merged batch
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        return None
+    return PdfWriter
+
+
+def generate_ticket_pdfs(tickets, merged_path=None, workers=None, progress=None,
+                         chunk_size=BATCH_CHUNK_SIZE):
+    """Render many boarding passes across a process pool.
+
+    ``tickets`` holds (booking, flight, traveler_name, dep_airport_name,
+    arr_airport_name) tuples, the arguments of generate_ticket_pdf. Without
+    ``merged_path`` every ticket gets its own file and the absolute paths
+    are returned in input order; with it, the tickets become the pages of
+    one PDF at ``merged_path``, whose absolute path is returned.
+
+    Tickets go to the pool in chunks of ``chunk_size`` and ``progress`` is
+    called with (tickets_done, total) after each chunk, so it can be the
+    ``progress`` callable that run_async passes in. ``workers`` defaults to
+    the number of CPUs; batches that fit in one chunk are rendered in this
+    process, where starting a pool would cost more than it saves. A merged
+    PDF is rendered in parallel parts and joined with pypdf when it is
+    installed, otherwise its pages are drawn here one after the other.
+    """
+    # The pool machinery is imported here, single tickets never need it
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    import multiprocessing, tempfile
+
+    PdfWriter = _pdf_writer() if merged_path is not None else None
+    tickets = list(tickets)
+    total = len(tickets)
+    chunks = [tickets[i:i + chunk_size] for i in range(0, total, chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    parallel = workers > 1 and (merged_path is None or PdfWriter is not None)
+
+    def report(done):
+        if progress:
+            progress((done, total))
+
+    if merged_path is not None:
+        os.makedirs(os.path.dirname(merged_path) or ".", exist_ok=True)
+        if not parallel:
+            _render_pages(tickets, merged_path)
+            report(total)
+            return os.path.abspath(merged_path)
+
+    if not parallel:
+        paths = []
+        for chunk in chunks:
+            paths.extend(_render_files(chunk))
+            report(len(paths))
+        return paths
+
+    results = [None] * len(chunks)
+    done = 0
+    with tempfile.TemporaryDirectory(prefix="tickets-") as parts_dir:
+        # Spawned workers: forking a process that runs Qt threads is unsafe
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            if merged_path is None:
+                futures = {pool.submit(_render_files, chunk): i for i, chunk in enumerate(chunks)}
+            else:
+                futures = {
+                    pool.submit(_render_pages, chunk, os.path.join(parts_dir, f"part-{i:05d}.pdf")): i
+                    for i, chunk in enumerate(chunks)
+                }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += len(chunks[i])
+                report(done)
+
+        if merged_path is None:
+            return [path for paths in results for path in paths]
+
+        writer = PdfWriter()
+        for part in results:
+            writer.append(part)
+        with open(merged_path, "wb") as f:
+            writer.write(f)
+        return os.path.abspath(merged_path)
@@ -0,0 +1,267 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import inf
+from typing import Optional, Tuple
+
+from models import Flight
+
+
+@dataclass(slots=True, frozen=True)
+class Itinerary:
+    """One or more connecting flights from an origin to a destination"""
+    legs: Tuple[Flight, ...]
+
+    @property
+    def id(self):
+        # Stable key for list models; a direct flight keeps its own id
+        if len(self.legs) == 1:
+            return self.legs[0].id
+        return "+".join(str(leg.id) for leg in self.legs)
+
+    @property
+    def departureAirportId(self):
+        return self.legs[0].departureAirportId
+
+    @property
+    def arrivalAirportId(self):
+        return self.legs[-1].arrivalAirportId
+
+    @property
+    def departureAt(self):
+        return self.legs[0].departureAt
+
+    @property
+    def arrivalAt(self):
+        return self.legs[-1].arrivalAt
+
+    @property
+    def price(self):
+        return sum(leg.price for leg in self.legs)
+
+    @property
+    def stops(self):
+        return len(self.legs) - 1
+
+    @property
+    def duration(self):
+        return self.arrivalAt - self.departureAt
+
+
+class RoutePlanner:
+    """Connection search over a set of flights.
+
+    Airports are nodes and flights are time-dependent edges: a flight can
+    follow another one if it leaves the airport the first one lands at at
+    least ``min_connection`` and at most ``max_layover`` after landing.
+    Itineraries have at most ``max_legs`` flights.
+
+    Three queries are supported, all starting from flights that leave the
+    origin inside a departure window:
+
+    - earliest_arrival: Connection Scan Algorithm over the flights sorted
+      by departure time, O(flights in the window) per query.
+    - cheapest: Dijkstra over (flight, legs) states ordered by total price,
+      dropping states that a cheaper one with no more legs already covers.
+    - fewest_legs: breadth-first search over flights; ties are broken by
+      the earliest arrival.
+
+    Building the planner sorts the flights once, so one planner can answer
+    many queries. Flights without parsed times are ignored.
+    """
+
+    def __init__(self, flights, min_connection=timedelta(minutes=45),
+                 max_layover=timedelta(hours=24), max_legs=3):
+        self.min_connection = min_connection
+        self.max_layover = max_layover
+        self.max_legs = max_legs
+
+        usable = [f for f in flights if f.departureAt is not None and f.arrivalAt is not None
+                  and f.arrivalAt > f.departureAt and f.departureAirportId != f.arrivalAirportId]
+        usable.sort(key=lambda f: (f.departureAt, f.id))
+        # Connections sorted by departure, for the connection scan
+        self._connections = usable
+        self._connection_times = [f.departureAt for f in usable]
+
+        # Outgoing flights per airport sorted by departure, for the graph searches
+        outgoing = defaultdict(list)
+        for flight in usable:
+            outgoing[flight.departureAirportId].append(flight)
+        self._outgoing = dict(outgoing)
+        self._outgoing_times = {airport: [f.departureAt for f in out] for airport, out in self._outgoing.items()}
+
+    def __len__(self):
+        return len(self._connections)
+
+    # === Helpers ===
+
+    def _departures(self, airport_id, earliest, latest):
+        """Flights leaving airport_id with earliest <= departure <= latest"""
+        flights = self._outgoing.get(airport_id)
+        if not flights:
+            return []
+        times = self._outgoing_times[airport_id]
+        return flights[bisect_left(times, earliest):bisect_right(times, latest)]
+
+    def _connections_after(self, flight):
+        return self._departures(
+            flight.arrivalAirportId,
+            flight.arrivalAt + self.min_connection,
+            flight.arrivalAt + self.max_layover,
+        )
+
+    @staticmethod
+    def _window(depart_from, depart_until):
+        if depart_until is None:
+            depart_until = datetime.combine(depart_from.date(), datetime.max.time())
+        return depart_from, depart_until
+
+    # === Queries ===
+
+    def earliest_arrival(self, from_id, to_id, depart_from, depart_until=None) -> Optional[Itinerary]:
+        """Itinerary reaching to_id as early as possible"""
+        depart_from, depart_until = self._window(depart_from, depart_until)
+        # airport -> {legs: (sorted arrival times, flights)} of flights that can be reached
+        reached = {}
+        parent = {}  # flight id -> previous leg, None for a first leg
+        best = None
+
+        start = bisect_left(self._connection_times, depart_from)
+        for flight in self._connections[start:]:
+            if best is not None and flight.departureAt >= best.arrivalAt:
+                break
+            if flight.arrivalAirportId == from_id:
+                continue
+
+            if flight.departureAirportId == from_id:
+                if flight.departureAt > depart_until:
+                    continue
+                legs = 1
+                parent[flight.id] = None
+            else:
+                # Find a reached flight landing inside this flight's connection window,
+                # preferring the fewest legs and then the shortest layover
+                by_legs = reached.get(flight.departureAirportId)
+                if not by_legs:
+                    continue
+                earliest = flight.departureAt - self.max_layover
+                latest = flight.departureAt - self.min_connection
+                legs = None
+                for previous_legs in sorted(by_legs):
+                    times, flights = by_legs[previous_legs]
+                    i = bisect_right(times, latest)
+                    if i and times[i - 1] >= earliest:
+                        legs = previous_legs + 1
+                        parent[flight.id] = flights[i - 1]
+                        break
+                if legs is None:
+                    continue
+
+            if flight.arrivalAirportId == to_id:
+                if best is None or flight.arrivalAt < best.arrivalAt:
+                    best = flight
+                continue
+            if legs < self.max_legs:
+                times, flights = reached.setdefault(flight.arrivalAirportId, {}).setdefault(legs, ([], []))
+                i = bisect_right(times, flight.arrivalAt)
+                times.insert(i, flight.arrivalAt)
+                flights.insert(i, flight)
+
+        if best is None:
+            return None
+        legs = []
+        flight = best
+        while flight is not None:
+            legs.append(flight)
+            flight = parent[flight.id]
+        return Itinerary(tuple(reversed(legs)))
+
+    def cheapest(self, from_id, to_id, depart_from, depart_until=None) -> Optional[Itinerary]:
+        """Itinerary with the lowest total price"""
+        depart_from, depart_until = self._window(depart_from, depart_until)
+        heap = []
+        counter = 0  # tie-breaker so paths are never compared
+        # Lowest cost pushed per (flight id, legs). Reaching a flight for at
+        # least that much with as many legs or more cannot lead anywhere
+        # cheaper, so such states are dropped before they reach the heap.
+        best = {}
+
+        def push(cost, legs, path):
+            nonlocal counter
+            flight_id = path[0].id
+            for fewer_legs in range(1, legs + 1):
+                if best.get((flight_id, fewer_legs), inf) <= cost:
+                    return
+            best[(flight_id, legs)] = cost
+            heapq.heappush(heap, (cost, legs, path[0].arrivalAt, counter, path))
+            counter += 1
+
+        # A path is linked as (last flight, path before it), so pushing a
+        # state does not copy the flights before it
+        for flight in self._departures(from_id, depart_from, depart_until):
+            push(flight.price, 1, (flight, None))
+
+        while heap:
+            cost, legs, _, _, path = heapq.heappop(heap)
+            flight = path[0]
+            if flight.arrivalAirportId == to_id:
+                return Itinerary(self._unlink(path))
+            if legs >= self.max_legs or best[(flight.id, legs)] < cost:
+                continue
+            # The last leg is only worth taking if it lands at the destination
+            last_leg = legs + 1 == self.max_legs
+            visited_airports = {leg.departureAirportId for leg in self._unlink(path)}
+            for following in self._connections_after(flight):
+                if last_leg and following.arrivalAirportId != to_id:
+                    continue
+                if following.arrivalAirportId in visited_airports:
+                    continue
+                push(cost + following.price, legs + 1, (following, path))
+        return None
+
+    @staticmethod
+    def _unlink(path):
+        """Flights of a linked (flight, previous) path, first leg first"""
+        legs = []
+        while path is not None:
+            flight, path = path
+            legs.append(flight)
+        return tuple(reversed(legs))
+
+    def fewest_legs(self, from_id, to_id, depart_from, depart_until=None) -> Optional[Itinerary]:
+        """Itinerary with the fewest flights, arriving earliest among those"""
+        depart_from, depart_until = self._window(depart_from, depart_until)
+        frontier = [(flight,) for flight in self._departures(from_id, depart_from, depart_until)
+                    if flight.arrivalAirportId != from_id]
+        seen = {path[-1].id for path in frontier}
+
+        for _ in range(self.max_legs):
+            arrived = [path for path in frontier if path[-1].arrivalAirportId == to_id]
+            if arrived:
+                return Itinerary(min(arrived, key=lambda p: (p[-1].arrivalAt, sum(f.price for f in p))))
+            next_frontier = []
+            for path in frontier:
+                visited_airports = {leg.departureAirportId for leg in path}
+                for following in self._connections_after(path[-1]):
+                    if following.id in seen or following.arrivalAirportId in visited_airports:
+                        continue
+                    seen.add(following.id)
+                    next_frontier.append(path + (following,))
+            frontier = next_frontier
+            if not frontier:
+                break
+        return None
+
+    def search(self, from_id, to_id, depart_from, depart_until=None):
+        """Return {"earliest": ..., "cheapest": ..., "fewest_legs": ...} itineraries"""
+        earliest = self.earliest_arrival(from_id, to_id, depart_from, depart_until)
+        if earliest is None:
+            # The other queries search the same connections, so they cannot succeed either
+            return {"earliest": None, "cheapest": None, "fewest_legs": None}
+        return {
+            "earliest": earliest,
+            "cheapest": self.cheapest(from_id, to_id, depart_from, depart_until),
+            "fewest_legs": self.fewest_legs(from_id, to_id, depart_from, depart_until),
+        }
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import threading
+
+from controllers.airport_controller import AirportController
+from controllers.flight_controller import FlightController
+from controllers.frequentFlyer_controller import FrequentFlyerController
+from models import encode_booking, encode_flight
+from services.worker import run_async
+
+# Bump when the boarding pass layout changes, so existing files are not reused
+TICKET_FORMAT = 3
+
+
+def flight_revision(flight):
+    """Short hash of a flight's fields; changes whenever the flight is edited"""
+    body = json.dumps(encode_flight(flight), sort_keys=True)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+
+
+class TicketService:
+    """Renders boarding passes off the GUI thread, once per booking and flight revision.
+
+    ``render`` is the blocking call for worker threads; ``request_ticket``
+    and ``request_tickets`` run it through run_async and report the PDF
+    path to ``on_result`` on the GUI thread.
+
+    A ticket is written to a path named after a hash of everything printed
+    on it (booking, flight, traveler and airport names; the issue time is
+    the booking date), so an identical ticket is never rendered twice, even
+    across restarts, and an edited flight gets a new file instead of
+    overwriting the old one. Paths are
+    also remembered by (booking id, flight revision), which skips the
+    traveler and airport lookups on a repeat request. Services are shared
+    per API base URL.
+    """
+
+    OUTPUT_DIR = "PDF_files"
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, api, output_dir=OUTPUT_DIR):
+        self.api = api
+        self.output_dir = output_dir
+        self.flights = FlightController(api)
+        self.airports = AirportController(api)
+        self.frequent_flyers = FrequentFlyerController(api)
+        self._paths = {}  # (booking id, flight revision) -> path
+        self._names = {}  # frequent flyer id -> full name
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_api(cls, api):
+        """Return the shared service for this API's base URL"""
+        with cls._registry_lock:
+            service = cls._registry.get(api.base_url)
+            if service is None:
+                service = cls(api)
+                cls._registry[api.base_url] = service
+            return service
+
+    def traveler_name(self, user_id):
+        with self._lock:
+            name = self._names.get(user_id)
+        if name is None:
+            name = self.frequent_flyers.get_full_name(user_id)
+            with self._lock:
+                self._names[user_id] = name
+        return name
+
+    def ticket_path(self, booking, flight, traveler_name, dep_airport_name, arr_airport_name):
+        """Content-addressed output path for a ticket"""
+        body = json.dumps([
+            TICKET_FORMAT, encode_booking(booking), encode_flight(flight),
+            traveler_name, dep_airport_name, arr_airport_name,
+        ], sort_keys=True)
+        digest = hashlib.sha256(body.encode("utf-8")).hexdigest()[:24]
+        return os.path.abspath(os.path.join(self.output_dir, f"ticket_{booking.id}_{digest}.pdf"))
+
+    def render(self, booking, flight=None):
+        """Return the path of the booking's boarding pass, rendering it if needed.
+
+        ``flight`` is fetched when it is not given, so a ticket always shows
+        the flight as it is now. Blocks; call it from a worker thread.
+        """
+        if flight is None:
+            flight = self.flights.get_flight_by_id(booking.flightId)
+        key = (booking.id, flight_revision(flight))
+        with self._lock:
+            path = self._paths.get(key)
+        if path and os.path.exists(path):
+            return path
+
+        ticket = (
+            booking, flight,
+            self.traveler_name(booking.frequentFlyerId),
+            self.airports.get_airport_name(flight.departureAirportId),
+            self.airports.get_airport_name(flight.arrivalAirportId),
+        )
+        path = self.ticket_path(*ticket)
+        if not os.path.exists(path):
+            # reportlab is only loaded once a ticket is actually rendered
+            from services.pdf_service import generate_ticket_pdf
+
+            # Write under a private name and rename, so a concurrent request
+            # for the same ticket never sees a half-written file
+            partial = f"{path}.{os.getpid()}-{threading.get_ident()}.part"
+            try:
+                generate_ticket_pdf(*ticket, filename=partial)
+                os.replace(partial, path)
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+        with self._lock:
+            self._paths[key] = path
+        return path
+
+    def render_all(self, bookings, flights=None):
+        """Render several tickets; ``flights`` maps flight id to Flight where known"""
+        flights = flights or {}
+        return [self.render(booking, flights.get(booking.flightId)) for booking in bookings]
+
+    def request_ticket(self, booking, flight=None, on_result=None, on_error=None):
+        """Render a ticket in the background; ``on_result(path)`` runs on the GUI thread"""
+        return run_async(self.render, booking, flight, on_result=on_result, on_error=on_error)
+
+    def request_tickets(self, bookings, flights=None, on_result=None, on_error=None):
+        """Render several tickets in the background; ``on_result(paths)`` runs on the GUI thread"""
+        return run_async(self.render_all, list(bookings), flights, on_result=on_result, on_error=on_error)
@@ -0,0 +1,77 @@
+import threading
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals used by Worker to report back to the GUI thread"""
+    result = Signal(object)
+    error = Signal(str)
+    progress = Signal(object)
+    finished = Signal()
+
+
+class Worker(QRunnable):
+    """Runs a blocking call (usually a controller/API call) on the thread pool.
+
+    If the wrapped function accepts a ``progress`` keyword, it receives a
+    callable that emits ``signals.progress`` so partial results can be
+    delivered while the call is still running.
+    """
+
+    def __init__(self, fn, *args, with_progress=False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        if with_progress:
+            self.kwargs["progress"] = self.signals.progress.emit
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+# Keep workers (and their signal objects) alive until they have finished,
+# otherwise queued signals can be dropped when Python collects them.
+_active_workers = set()
+_active_lock = threading.Lock()
+
+
+def _release(worker):
+    with _active_lock:
+        _active_workers.discard(worker)
+
+
+def run_async(fn, *args, on_result=None, on_error=None, on_progress=None,
+              on_finished=None, **kwargs):
+    """Run ``fn(*args, **kwargs)`` on the global QThreadPool.
+
+    Callbacks are invoked on the GUI thread through Qt signals:
+    ``on_result(value)``, ``on_error(message)``, ``on_progress(item)`` and
+    ``on_finished()``. Returns the Worker so callers can hold on to it.
+    """
+    worker = Worker(fn, *args, with_progress=on_progress is not None, **kwargs)
+    if on_result:
+        worker.signals.result.connect(on_result)
+    if on_error:
+        worker.signals.error.connect(on_error)
+    if on_progress:
+        worker.signals.progress.connect(on_progress)
+    if on_finished:
+        worker.signals.finished.connect(on_finished)
+    worker.signals.finished.connect(lambda w=worker: _release(w))
+
+    with _active_lock:
+        _active_workers.add(worker)
+    QThreadPool.globalInstance().start(worker)
+    return worker
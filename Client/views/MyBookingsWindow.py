@@ -7,9 +7,9 @@ from PySide6.QtGui import QCursor
 from controllers.booking_controller import BookingController
 from controllers.flight_controller import FlightController
 from controllers.airport_controller import AirportController
-from controllers.frequentFlyer_controller import FrequentFlyerController
-from services.pdf_service import generate_ticket_pdf
-import os, webbrowser
+from services.ticket_service import TicketService
+from services.worker import run_async
+import webbrowser
 
 class MyBookingsWindow(QMainWindow):
     def __init__(self, user_id, api):
@@ -18,6 +18,8 @@ class MyBookingsWindow(QMainWindow):
         self.booking_controller = BookingController(api)
         self.flight_controller = FlightController(api)
         self.airport_controller = AirportController(api)
+        self.tickets = TicketService.for_api(api)
+        self.bookings_load_id = 0  # Incremented by every load_bookings call
 
         self.setWindowTitle("My Bookings - IsraFlight")
         self.setFixedSize(1200, 800)
@@ -291,66 +293,138 @@ class MyBookingsWindow(QMainWindow):
         return card
 
     def get_airport_name(self, airport_id):
-        airports = self.airport_controller.get_all_airports()
-        for a in airports:
-            if a.get("id") == airport_id:
-                return a.get("name")
-        return "Unknown Airport"
+        return self.airport_controller.get_airport_name(airport_id)
 
     def generate_pdf(self, booking):
-        """Generate PDF ticket and open it safely"""
-        try:
-            flight = self.flight_controller.get_flight_by_id(booking.flightId)
-        except Exception:
-            QMessageBox.warning(self, "Error", "Flight not found")
-            return
+        """Open the booking's ticket, rendering it in the background if needed"""
+        self.tickets.request_ticket(booking, on_result=self.open_ticket, on_error=self.on_ticket_error)
 
-        ff_controller = FrequentFlyerController(self.booking_controller.api)
-        traveler_name = ff_controller.get_full_name(self.user_id)
-        dep_airport = self.get_airport_name(flight.departureAirportId)
-        arr_airport = self.get_airport_name(flight.arrivalAirportId)
+    def open_ticket(self, pdf_path):
+        webbrowser.open_new(pdf_path)
 
-        try:
-            pdf_path = generate_ticket_pdf(
-                booking, flight,
-                traveler_name=traveler_name,
-                dep_airport_name=dep_airport,
-                arr_airport_name=arr_airport
-            )
-            if pdf_path and os.path.exists(pdf_path):
-                webbrowser.open_new(pdf_path)
-            else:
-                QMessageBox.warning(self, "Error", "Failed to generate PDF or file not found")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not generate PDF:\n{e}")
+    def on_ticket_error(self, message):
+        QMessageBox.critical(self, "Error", f"Could not generate PDF:\n{message}")
 
     def load_bookings(self):
-        """Load all user bookings"""
-        bookings = self.booking_controller.list_user_bookings(self.user_id)
+        """Load all user bookings without blocking the UI.
+
+        The list saved on the last visit is drawn at once and revalidated in
+        the background; it is only redrawn if the server's answer differs.
+        Without a saved list the cards stream in as batches arrive. Batches
+        and results of an earlier load that is still running are ignored.
+        """
+        self.bookings_load_id += 1
+        load_id = self.bookings_load_id
+        self.shown_pairs = self.booking_controller.get_cached_bookings(self.user_id)
+        self.fetched_pairs = []
+        self.has_booking_cards = False
+        if self.shown_pairs:
+            self.add_booking_cards(self.shown_pairs)
+            self.bookings_layout.addStretch()
+        else:
+            self.show_bookings_message("Loading bookings...")
+        run_async(
+            self.fetch_bookings, load_id,
+            on_progress=self.on_bookings_batch,
+            on_result=self.finish_bookings,
+            on_error=lambda message: self.on_bookings_error(load_id, message),
+        )
 
-        # Clear previous
+    def fetch_bookings(self, load_id, progress):
+        """Fetch bookings and their flights in batches (runs on a worker thread).
+
+        Bookings arrive page by page; each batch of (booking, flight) pairs is
+        passed to ``progress`` as (load_id, batch) as soon as its flights
+        arrive, so cards render while later pages load. Returns (load_id,
+        booking count).
+        """
+        booking_count = 0
+        for bookings in self.booking_controller.iter_user_bookings(self.user_id):
+            # Warm the airport cache so building the cards needs no requests
+            if not booking_count:
+                self.airport_controller.get_all_airports()
+            booking_count += len(bookings)
+
+            bookings_by_flight = {}
+            for booking in bookings:
+                bookings_by_flight.setdefault(booking.flightId, []).append(booking)
+
+            for flights in self.flight_controller.iter_flights_by_ids(bookings_by_flight):
+                batch = [
+                    (booking, flight)
+                    for flight in flights
+                    for booking in bookings_by_flight[flight.id]
+                ]
+                if batch:
+                    progress((load_id, batch))
+        return load_id, booking_count
+
+    def clear_bookings(self):
+        """Remove every widget from the bookings list"""
         for i in reversed(range(self.bookings_layout.count())):
             item = self.bookings_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
 
-        if not bookings:
-            empty_label = QLabel("No bookings found.")
-            empty_label.setAlignment(Qt.AlignCenter)
-            empty_label.setStyleSheet("font-size: 18pt; color: #a0aec0; padding: 40px;")
-            self.bookings_layout.addWidget(empty_label)
-            return
-
-        for booking in bookings:
-            try:
-                flight = self.flight_controller.get_flight_by_id(booking.flightId)
-            except Exception:
-                continue
+    def show_bookings_message(self, text):
+        """Replace the bookings list with a single centered message"""
+        self.clear_bookings()
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("font-size: 18pt; color: #a0aec0; padding: 40px;")
+        self.bookings_layout.addWidget(label)
+
+    def add_booking_cards(self, batch):
+        """Append cards for a batch of (booking, flight) pairs as it arrives"""
+        if not self.has_booking_cards:
+            self.clear_bookings()
+            self.has_booking_cards = True
+        for booking, flight in batch:
             card = self.create_booking_card(booking, flight)
             self.bookings_layout.addWidget(card)
-            
+
+    def on_bookings_batch(self, page):
+        """Collect a fetched batch; draw it unless a snapshot is on screen"""
+        load_id, batch = page
+        if load_id != self.bookings_load_id:
+            return
+        self.fetched_pairs.extend(batch)
+        if not self.shown_pairs:
+            self.add_booking_cards(batch)
+
+    @staticmethod
+    def bookings_key(pairs):
+        return sorted((booking.id, booking, flight) for booking, flight in pairs)
+
+    def finish_bookings(self, result):
+        """Finish the list once every batch has been delivered"""
+        load_id, booking_count = result
+        if load_id != self.bookings_load_id:
+            return
+        # The complete list is the snapshot for the next visit
+        run_async(self.booking_controller.save_bookings_snapshot, self.user_id, list(self.fetched_pairs))
+        if self.shown_pairs:
+            if self.bookings_key(self.shown_pairs) == self.bookings_key(self.fetched_pairs):
+                return
+            # The snapshot was stale: redraw from what the server returned
+            self.has_booking_cards = False
+            self.clear_bookings()
+            if self.fetched_pairs:
+                self.add_booking_cards(self.fetched_pairs)
+        if not self.has_booking_cards:
+            self.show_bookings_message("No bookings found.")
+            return
         self.bookings_layout.addStretch()
 
+    def on_bookings_error(self, load_id, message):
+        """Show a load error in place of the bookings list"""
+        if load_id != self.bookings_load_id:
+            return
+        if self.shown_pairs:
+            # Keep showing the saved list while offline
+            return
+        self.show_bookings_message(f"Could not load bookings: {message}")
+
 
     # You'll need to implement these methods based on your application logic
     def open_update_form(self, flight):
@@ -367,7 +441,7 @@ class MyBookingsWindow(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             try:
-                self.booking_controller.delete_booking(booking_id)
+                self.booking_controller.delete_booking(booking_id, self.user_id)
                 QMessageBox.information(self, "Deleted", "Booking deleted successfully")
                 self.load_bookings()  # Refresh the list
             except Exception as e:
@@ -4,13 +4,10 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont, QCursor, QPainter, QPainterPath, QIcon
 from PySide6.QtCore import Qt
 
-from controllers.api_controller import ApiController
+from controllers.api_controller import get_api
 
 from controllers.plane_controller import PlaneController
-from .plane_window import PlaneWindow
-
 from controllers.flight_controller import FlightController
-from .flight_window import FlightWindow
 
 from controllers.airport_controller import AirportController
 
@@ -306,14 +303,17 @@ class AdminWindow(QMainWindow):
         
         return button
     
+    # The management windows are imported when first opened
     def on_planes_clicked(self):
-        api = ApiController(base_url="http://localhost:5126/api")
+        from .plane_window import PlaneWindow
+        api = get_api()
         planes_controller = PlaneController(api)
         planes_view = PlaneWindow(planes_controller, self)
         planes_view.show()
             
     def on_flights_clicked(self):
-        api = ApiController(base_url="http://localhost:5126/api")
+        from .flight_window import FlightWindow
+        api = get_api()
         flight_ctrl = FlightController(api)
         plane_ctrl = PlaneController(api)
         airport_ctrl = AirportController(api)
@@ -1,34 +1,45 @@
+from datetime import datetime, time, timedelta
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel, QPushButton,
-    QLineEdit, QDateEdit, QSpinBox, QComboBox, QMessageBox, QScrollArea,
+    QLineEdit, QDateEdit, QSpinBox, QComboBox, QMessageBox,
     QGraphicsDropShadowEffect, QSizePolicy
 )
 from PySide6.QtCore import QDate, Qt, QDateTime
 from PySide6.QtGui import QCursor
-from datetime import datetime
-from fpdf import FPDF
 
 from controllers.airport_controller import AirportController
-from controllers.api_controller import ApiController
+from controllers.api_controller import get_api
 from controllers.booking_controller import BookingController
 from controllers.flight_controller import FlightController
-from models import Flight, Airport
+from models import Flight, decode_airports
+from services.route_planner import Itinerary, RoutePlanner
+from services.ticket_service import TicketService
+from services.worker import run_async
+from views.flight_list_view import FlightListModel, FlightListView
 
 
 class BookFlightWindow(QMainWindow):
+    # Days after the departure date searched for connecting flights
+    CONNECTION_DAYS = 2
+
     def __init__(self, user_id):
         super().__init__()
         self.user_id = user_id
         self.selected_flight = None
 
         # Controllers
-        api = ApiController(base_url="http://localhost:5126/api")
+        api = get_api()
         self.booking_ctrl = BookingController(api)
         self.flight_ctrl = FlightController(api)
         self.airport_ctrl = AirportController(api)
+        self.tickets = TicketService.for_api(api)
 
-        # Airports
-        self.airports = [Airport(**a) for a in self.airport_ctrl.get_all_airports()]
+        # Airports: the stored list fills the combos at once, see refresh_airports
+        self.airports = decode_airports(self.airport_ctrl.get_cached_airports() or [])
+
+        # Flight search state, see search_flights
+        self.search_id = 0
 
         self.setWindowTitle("Book a Flight - IsraFlight")
         self.setFixedSize(1200, 800)
@@ -87,6 +98,8 @@ class BookFlightWindow(QMainWindow):
         # Apply styles
         self.setStyleSheet(self.get_stylesheet())
 
+        self.refresh_airports()
+
     def create_search_form(self):
         """Create a compact airline-style flight search bar"""
         form_container = QFrame()
@@ -95,7 +108,7 @@ class BookFlightWindow(QMainWindow):
         form_layout.setContentsMargins(20, 20, 20, 20)
         form_layout.setSpacing(15)
 
-        airport_names = [f"{a.city} ({a.code})" for a in self.airports]
+        airport_names = self.airport_names()
 
         # From Airport
         from_label = QLabel("From")
@@ -165,22 +178,20 @@ class BookFlightWindow(QMainWindow):
         header_layout = QVBoxLayout()
         results_title = QLabel("Available Flights")
         results_title.setObjectName("resultsTitle")
-        results_subtitle = QLabel("Choose your preferred flight")
-        results_subtitle.setObjectName("resultsSubtitle")
+        self.results_subtitle = QLabel("Choose your preferred flight")
+        self.results_subtitle.setObjectName("resultsSubtitle")
         header_layout.addWidget(results_title)
-        header_layout.addWidget(results_subtitle)
+        header_layout.addWidget(self.results_subtitle)
         results_layout.addLayout(header_layout)
 
-        # Flights Scroll Area
-        self.flights_scroll = QScrollArea()
-        self.flights_scroll.setWidgetResizable(True)
-        self.flights_scroll.setObjectName("flightsScrollArea")
-        self.flights_container = QWidget()
-        self.flights_layout = QVBoxLayout(self.flights_container)
-        self.flights_layout.setSpacing(12)
-        self.flights_layout.setContentsMargins(0, 0, 0, 0)
-        self.flights_scroll.setWidget(self.flights_container)
-        self.flights_scroll.setSizePolicy(
+        # Flights List (virtualized, only visible cards are painted)
+        self.flights_model = FlightListModel(self.describe_flight, self, references=(self.airport_ctrl.cache,))
+        self.flights_view = FlightListView([
+            ("book", "Book Flight", "#38a169", "#2f855a"),
+        ])
+        self.flights_view.setModel(self.flights_model)
+        self.flights_view.card_delegate.button_clicked.connect(self.on_card_button)
+        self.flights_view.setSizePolicy(
             QSizePolicy.Expanding,
             QSizePolicy.Expanding
         )
@@ -191,7 +202,7 @@ class BookFlightWindow(QMainWindow):
         )
 
 
-        results_layout.addWidget(self.flights_scroll)
+        results_layout.addWidget(self.flights_view)
         
 
         return results_container
@@ -206,218 +217,142 @@ class BookFlightWindow(QMainWindow):
             QMessageBox.warning(self, "Validation Error", "Please select valid departure and destination airports")
             return
 
-        flights = self.flight_ctrl.get_all_flights()
-        matched = [
-            f for f in flights
-            if f.departureAirportId == from_id
-            and f.arrivalAirportId == to_id
-            and datetime.fromisoformat(f.departureTime).date() == departure_date
-        ]
+        # Results from an earlier, still running search are ignored
+        self.search_id += 1
+        run_async(
+            self.find_flights, self.search_id, from_id, to_id, departure_date,
+            on_result=self.display_flights,
+            on_error=self.on_search_error,
+        )
+
+    def find_flights(self, search_id, from_id, to_id, departure_date):
+        """Search flights through the flight index (runs on a worker thread).
 
+        Without a direct match, connecting itineraries are planned over the
+        flights of the next few days; if there are none either, the result
+        is empty and the window says so.
+        """
+        matched = self.flight_ctrl.search_flights(from_id, to_id, departure_date)
         if not matched:
-            matched = flights
-            QMessageBox.information(self, "No Exact Matches", "No flights match your criteria. Showing all available flights.")
-
-        # Clear old results
-        for i in reversed(range(self.flights_layout.count())):
-            widget = self.flights_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        # Add new flight cards
-        for f in matched:
-            flight_card = self.create_flight_card(f)
-            self.flights_layout.addWidget(flight_card)
-        self.flights_layout.addStretch()
-
-        # Show results section
+            matched = self.find_connections(from_id, to_id, departure_date)
+        return search_id, matched
+
+    def find_connections(self, from_id, to_id, departure_date):
+        """Return the earliest, cheapest and fewest-legs itineraries (deduplicated)"""
+        flights = self.flight_ctrl.get_flights_departing(
+            departure_date, departure_date + timedelta(days=self.CONNECTION_DAYS))
+        planner = RoutePlanner(flights)
+        found = planner.search(from_id, to_id, datetime.combine(departure_date, time.min))
+        itineraries = {}
+        for itinerary in found.values():
+            if itinerary is not None:
+                itineraries.setdefault(itinerary.id, itinerary)
+        return sorted(itineraries.values(), key=lambda i: (i.arrivalAt, i.price))
+
+    def show_results(self, flights):
+        """Replace the results list and scroll back to the top"""
+        self.flights_model.set_flights(flights)
         self.results_section.show()
+        self.flights_view.scrollToTop()
 
-        # ✅ Scroll to the top of the results
-        self.flights_scroll.verticalScrollBar().setValue(0)
+    def display_flights(self, search_result):
+        """Show the flights found by search_flights"""
+        search_id, matched = search_result
+        if search_id != self.search_id:
+            return
+        self.show_results(matched)
+        if not matched:
+            self.results_subtitle.setText("No flights found for this route and date")
+            QMessageBox.information(self, "No Flights Found", "No direct or connecting flights match your criteria. Try another date or route.")
+            return
+        self.results_subtitle.setText("Choose your preferred flight")
+        if isinstance(matched[0], Itinerary):
+            QMessageBox.information(self, "No Direct Flights", "No direct flights match your criteria. Showing connecting flights.")
 
+    def on_search_error(self, message):
+        """Report a failed flight search"""
+        QMessageBox.warning(self, "Search Failed", f"Could not load flights:\n{message}")
 
-    def create_flight_card(self, flight: Flight):
-        """Create a modern flight card"""
-        card = QFrame()
-        card.setObjectName("flightCard")
-        
-        card.setMinimumHeight(160)   # adjust as you like
-        card.setMaximumHeight(160)   # lock height so it doesn’t shrink
-        card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        # Main card layout
-        main_layout = QVBoxLayout(card)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top section with flight info
-        top_section = QWidget()
-        top_layout = QHBoxLayout(top_section)
-        top_layout.setContentsMargins(24, 20, 24, 16)
-        top_layout.setSpacing(20)
-        
-        # Left: Flight Info
-        left_side = QWidget()
-        left_layout = QVBoxLayout(left_side)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(8)
-
-        flight_info = QLabel(f"IsraFlight • Flight {flight.id}")
-        flight_info.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: bold;
-        """)
-        left_layout.addWidget(flight_info)
-        
-        # Center - Route information
-        center_section = QWidget()
-        center_layout = QVBoxLayout(center_section)
-        center_layout.setContentsMargins(0, 0, 0, 0)
-        center_layout.setSpacing(12)
-        
-        # Route display
-        route_layout = QHBoxLayout()
-        route_layout.setSpacing(15)
-        
-        # Departure
-        dep_widget = QWidget()
-        dep_layout = QVBoxLayout(dep_widget)
-        dep_layout.setContentsMargins(0, 0, 0, 0)
-        dep_layout.setSpacing(2)
-        
-        dep_code_label = QLabel(str(flight.departureAirportId))
-        dep_code_label.setStyleSheet("""
-            font-size: 14pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        dep_city_label = QLabel(self.get_airport_name(flight.departureAirportId))
-        dep_city_label.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        dep_time_label = QLabel(datetime.fromisoformat(flight.departureTime).strftime('%H:%M'))
-        dep_time_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: 600;
-        """)
-        
-        dep_layout.addWidget(dep_code_label)
-        dep_layout.addWidget(dep_city_label)
-        dep_layout.addWidget(dep_time_label)
-        
-        # Plane icon/arrow
-        plane_label = QLabel("✈")
-        plane_label.setAlignment(Qt.AlignCenter)
-        plane_label.setStyleSheet("""
-            font-size: 16pt;
-            color: #64748b;
-            margin: 10px;
-        """)
-        
-        # Arrival
-        arr_widget = QWidget()
-        arr_layout = QVBoxLayout(arr_widget)
-        arr_layout.setContentsMargins(0, 0, 0, 0)
-        arr_layout.setSpacing(2)
-
-        arr_code_label = QLabel(str(flight.arrivalAirportId))
-        arr_code_label.setStyleSheet("""
-            font-size: 14pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        arr_city_label = QLabel(self.get_airport_name(flight.arrivalAirportId))
-        arr_city_label.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        arr_time_label = QLabel(datetime.fromisoformat(flight.arrivalTime).strftime('%H:%M'))
-        arr_time_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: 600;
-        """)
-
-        arr_layout.addWidget(arr_code_label)
-        arr_layout.addWidget(arr_city_label)
-        arr_layout.addWidget(arr_time_label)
-        
-        route_layout.addWidget(dep_widget)
-        route_layout.addWidget(plane_label)
-        route_layout.addWidget(arr_widget)
-        center_layout.addLayout(route_layout)
+
+    def on_card_button(self, key, flight):
+        """Handle clicks on a card's Book button"""
+        if key == "book":
+            self.book_flight(flight)
+
+    def describe_flight(self, flight):
+        """Build the texts shown on a flight card (called only for painted rows)"""
+        if isinstance(flight, Itinerary):
+            return self.describe_itinerary(flight)
 
         # Aircraft info
         if hasattr(flight, 'plane') and flight.plane:
-            plane_info = QLabel(f"Aircraft: {getattr(flight.plane, 'name', 'Unknown')}")
+            aircraft = f"Aircraft: {getattr(flight.plane, 'name', 'Unknown')}"
         else:
-            plane_info = QLabel("Aircraft: Unknown")
-        plane_info.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        center_layout.addWidget(plane_info)
-
-        # Right side - Price and book button
-        right_side = QWidget()
-        right_layout = QVBoxLayout(right_side)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(8)
-        right_layout.setAlignment(Qt.AlignTop)
-
-        # Price
-        price_label = QLabel(f"${flight.price:,.2f}")
-        price_label.setStyleSheet("""
-            font-size: 18pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        price_label.setAlignment(Qt.AlignRight)
-        right_layout.addWidget(price_label)
-
-        # Book button
-        book_btn = QPushButton("Book Flight")
-        book_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #48bb78, stop:1 #38a169);
-                color: white;
-                padding: 10px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                border: none;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #38a169, stop:1 #2f855a);
-            }
-        """)
-        book_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        book_btn.clicked.connect(lambda: self.book_flight(flight))
-        right_layout.addWidget(book_btn)
-
-        # Add all sections to top layout
-        top_layout.addWidget(left_side)
-        top_layout.addWidget(center_section)
-        top_layout.addWidget(right_side)
-        
-        # Add top section to main card layout
-        main_layout.addWidget(top_section)
-
-        return card
+            aircraft = "Aircraft: Unknown"
+
+        return {
+            "title": f"IsraFlight • Flight {flight.id}",
+            "dep_code": str(flight.departureAirportId),
+            "dep_city": self.get_airport_name(flight.departureAirportId),
+            "dep_time": flight.departureAt.strftime('%H:%M') if flight.departureAt else str(flight.departureTime),
+            "arr_code": str(flight.arrivalAirportId),
+            "arr_city": self.get_airport_name(flight.arrivalAirportId),
+            "arr_time": flight.arrivalAt.strftime('%H:%M') if flight.arrivalAt else str(flight.arrivalTime),
+            "aircraft": aircraft,
+            "price": f"${flight.price:,.2f}",
+        }
+
+    def describe_itinerary(self, itinerary: Itinerary):
+        """Card texts for a connecting itinerary: first origin to final destination"""
+        flights = " + ".join(str(leg.id) for leg in itinerary.legs)
+        via = ", ".join(self.get_airport_name(leg.arrivalAirportId) for leg in itinerary.legs[:-1])
+        stops = f"{itinerary.stops} stop" + ("s" if itinerary.stops > 1 else "")
+        hours, minutes = divmod(int(itinerary.duration.total_seconds()) // 60, 60)
+        return {
+            "title": f"IsraFlight • Flights {flights}",
+            "dep_code": str(itinerary.departureAirportId),
+            "dep_city": self.get_airport_name(itinerary.departureAirportId),
+            "dep_time": itinerary.departureAt.strftime('%H:%M'),
+            "arr_code": str(itinerary.arrivalAirportId),
+            "arr_city": self.get_airport_name(itinerary.arrivalAirportId),
+            "arr_time": itinerary.arrivalAt.strftime('%d/%m %H:%M'),
+            "aircraft": f"{stops} via {via} • {hours}h {minutes:02d}m",
+            "price": f"${itinerary.price:,.2f}",
+        }
+
+    def airport_names(self):
+        return [f"{a.city} ({a.code})" for a in self.airports]
+
+    def refresh_airports(self):
+        """Bring the airport list up to date in the background"""
+        run_async(self.airport_ctrl.get_all_airports, on_result=self.set_airports, on_error=self.on_airports_error)
+
+    def set_airports(self, airports):
+        """Refill the airport combos, keeping the airports already selected"""
+        airports = decode_airports(airports)
+        if airports == self.airports:
+            return
+        selected = (self.get_airport_id(self.from_input), self.get_airport_id(self.to_input))
+        self.airports = airports
+        names = self.airport_names()
+        for combo, airport_id in zip((self.from_input, self.to_input), selected):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(names)
+            index = next((i for i, a in enumerate(airports) if a.id == airport_id), 0)
+            combo.setCurrentIndex(index)
+            combo.blockSignals(False)
+
+    def on_airports_error(self, message):
+        if not self.airports:
+            QMessageBox.warning(self, "Error", f"Could not load airports: {message}")
 
     def get_airport_name(self, airport_id):
-        """Get airport name from ID"""
-        for a in self.airports:
-            if a.id == airport_id:
-                return f"{a.city} ({a.code})"
-        return str(airport_id)
+        """Get airport name from ID (cards are painted with it, so it never makes a request)"""
+        airport = self.airport_ctrl.get_cached_airport(airport_id)
+        if not airport:
+            return str(airport_id)
+        return f"{airport.get('city')} ({airport.get('code')})"
 
     def get_airport_id(self, combo: QComboBox):
         """Get airport ID from combo selection"""
@@ -426,19 +361,14 @@ class BookFlightWindow(QMainWindow):
             return self.airports[index].id
         return -1
 
-    def book_flight(self, flight: Flight):
-        """Book the selected flight"""
+    def book_flight(self, flight):
+        """Book the selected flight, or every leg of a connecting itinerary"""
+        legs = flight.legs if isinstance(flight, Itinerary) else (flight,)
+        bookings = []
         try:
             # Attempt to create booking via backend
-            booking = self.booking_ctrl.create_booking(self.user_id, flight.id)
-            QMessageBox.information(
-                self,
-                "Booking Successful",
-                f"Booking ID: {booking.id}\nFlight: {booking.flightId}"
-            )
-            self.generate_pdf_ticket(booking)
-            self.close()
-
+            for leg in legs:
+                bookings.append(self.booking_ctrl.create_booking(self.user_id, leg.id))
         except Exception as e:
             # Try to parse backend JSON error
             import json
@@ -453,21 +383,35 @@ class BookFlightWindow(QMainWindow):
             except Exception:
                 message = str(e)  # fallback if parsing fails
 
+            if bookings:
+                # A later leg was rejected: an itinerary is booked whole or not at all
+                message += "\n\n" + self.cancel_bookings(bookings)
             QMessageBox.warning(self, "Booking Failed", message)
+            return
 
-    def generate_pdf_ticket(self, booking):
-        """Generate PDF ticket"""
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=14)
-        pdf.cell(0, 10, f"Booking ID: {booking.id}", ln=True)
-        pdf.cell(0, 10, f"Flight ID: {booking.flightId}", ln=True)
-        pdf.cell(0, 10, f"From: {self.from_input.currentText()}", ln=True)
-        pdf.cell(0, 10, f"To: {self.to_input.currentText()}", ln=True)
-        pdf.cell(0, 10, f"Date: {self.date_input.date().toString('yyyy-MM-dd')}", ln=True)
-        pdf.cell(0, 10, f"Passengers: {self.passengers_input.value()}", ln=True)
-        pdf.cell(0, 10, f"Class: {self.class_input.currentText()}", ln=True)
-        pdf.output("ticket.pdf")
+        QMessageBox.information(
+            self,
+            "Booking Successful",
+            "\n".join(f"Booking ID: {booking.id}\nFlight: {booking.flightId}" for booking in bookings)
+        )
+        # Render the tickets now so My Bookings can open them at once
+        self.tickets.request_tickets(bookings, {leg.id: leg for leg in legs})
+        self.close()
+
+    def cancel_bookings(self, bookings):
+        """Delete the bookings made for the earlier legs of an itinerary that
+        could not be booked; returns what happened to them, for the user"""
+        kept = []
+        for booking in bookings:
+            try:
+                self.booking_ctrl.delete_booking(booking.id, user_id=self.user_id)
+            except Exception:
+                kept.append(booking)
+        if not kept:
+            return "The connecting flights booked before it were cancelled."
+        return "These connecting flights are still booked, you can cancel them in My Bookings:\n" + "\n".join(
+            f"Booking ID: {booking.id} (Flight {booking.flightId})" for booking in kept
+        )
 
     def get_stylesheet(self):
         return """
@@ -567,22 +511,12 @@ class BookFlightWindow(QMainWindow):
             QLabel#resultsTitle { font-size: 20pt; font-weight: bold; color: #1a202c; }
             QLabel#resultsSubtitle { font-size: 12pt; color: #718096; }
             
-            QScrollArea#flightsScrollArea { border: none; background-color: transparent; }
-            QScrollArea#flightsScrollArea QScrollBar:vertical {
+            QListView#flightsListView { border: none; background-color: transparent; }
+            QListView#flightsListView QScrollBar:vertical {
                 border: none; background-color: #f1f5f9; width: 12px; border-radius: 6px;
             }
-            QScrollArea#flightsScrollArea QScrollBar::handle:vertical {
+            QListView#flightsListView QScrollBar::handle:vertical {
                 background-color: #cbd5e1; border-radius: 6px; min-height: 20px;
             }
-            QScrollArea#flightsScrollArea QScrollBar::handle:vertical:hover { background-color: #94a3b8; }
-            
-            QFrame#flightCard {
-                background: white;
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-            }
-            QFrame#flightCard:hover {
-                border-color: #cbd5e1;
-                background: #fefefe;
-            }
+            QListView#flightsListView QScrollBar::handle:vertical:hover { background-color: #94a3b8; }
         """
\ No newline at end of file
@@ -0,0 +1,339 @@
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize, QEvent, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QFontMetrics
+
+from services.worker import run_async
+
+
+FlightRole = Qt.UserRole + 1
+CardRole = Qt.UserRole + 2
+
+
+class FlightListModel(QAbstractListModel):
+    """List model holding Flight objects for a FlightListView.
+
+    ``describe(flight)`` turns a flight into the dict of texts drawn on its
+    card. It is only called for rows that are actually painted and the
+    result is cached, so building the model costs nothing per flight.
+
+    Rows are keyed by flight id: ``upsert_flight``, ``remove_flight`` and
+    ``apply_changes`` touch only the affected rows, so the view keeps its
+    scroll position and repaints a single card after an edit.
+
+    ``references`` are the ReferenceCaches ``describe`` reads with ``peek``.
+    Ids it missed are fetched on a worker after the paint, and the cards
+    are described again once they arrive. Ids still pending after a fetch
+    (missed meanwhile, or failed) are retried after REFERENCE_RETRY_MS.
+    """
+
+    REFERENCE_RETRY_MS = 2000
+
+    def __init__(self, describe, parent=None, references=()):
+        super().__init__(parent)
+        self.describe = describe
+        self.references = tuple(references)
+        self._fetching = False
+        self._flights = []
+        self._cards = {}
+        self._rows = {}  # flight id -> row, rebuilt lazily after removals
+        self._rows_valid = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._flights)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._flights):
+            return None
+        flight = self._flights[index.row()]
+        if role == FlightRole:
+            return flight
+        if role == CardRole:
+            card = self._cards.get(flight.id)
+            if card is None:
+                card = self.describe(flight)
+                self._cards[flight.id] = card
+                self._fetch_references()
+            return card
+        if role == Qt.DisplayRole:
+            return f"Flight {flight.id}"
+        return None
+
+    def set_flights(self, flights):
+        """Replace every row with the given flights"""
+        self.beginResetModel()
+        self._flights = list(flights)
+        self._cards = {}
+        self._rows_valid = False
+        self.endResetModel()
+
+    def append_flights(self, flights):
+        """Append rows at the end of the list.
+
+        Flights that are already shown (e.g. patched in by a mutation while
+        the catalogue was still streaming) keep their row and are skipped.
+        """
+        if self._flights:
+            flights = [flight for flight in flights if self.row_of(flight.id) is None]
+        if not flights:
+            return
+        start = len(self._flights)
+        self.beginInsertRows(QModelIndex(), start, start + len(flights) - 1)
+        self._flights.extend(flights)
+        if self._rows_valid:
+            for row, flight in enumerate(flights, start):
+                self._rows[flight.id] = row
+        self.endInsertRows()
+
+    def flight_at(self, row):
+        return self._flights[row]
+
+    def row_of(self, flight_id):
+        """Row showing flight_id, or None"""
+        if not self._rows_valid:
+            self._rows = {flight.id: row for row, flight in enumerate(self._flights)}
+            self._rows_valid = True
+        return self._rows.get(flight_id)
+
+    def upsert_flight(self, flight):
+        """Replace the row with flight's id in place, or append it if it is new"""
+        row = self.row_of(flight.id)
+        if row is None:
+            self.append_flights([flight])
+            return
+        self._flights[row] = flight
+        self._cards.pop(flight.id, None)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_flight(self, flight_id):
+        """Remove the row with flight_id; returns False if it is not shown"""
+        row = self.row_of(flight_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._flights[row]
+        self._cards.pop(flight_id, None)
+        if row == len(self._flights):
+            self._rows.pop(flight_id, None)
+        else:
+            # Later rows shifted up; reindex on the next lookup
+            self._rows_valid = False
+        self.endRemoveRows()
+        return True
+
+    def apply_changes(self, upserted=(), removed_ids=()):
+        """Apply a delta (e.g. a mutation response or a changes feed).
+
+        Removals go row by row; replaced rows are repainted with a single
+        dataChanged over their span and new flights appended in one insert,
+        so a large delta costs the view one update instead of one per row.
+        """
+        for flight_id in removed_ids:
+            self.remove_flight(flight_id)
+        added = []
+        first = last = None
+        for flight in upserted:
+            row = self.row_of(flight.id)
+            if row is None:
+                added.append(flight)
+                continue
+            self._flights[row] = flight
+            self._cards.pop(flight.id, None)
+            first = row if first is None else min(first, row)
+            last = row if last is None else max(last, row)
+        if first is not None:
+            self.dataChanged.emit(self.index(first), self.index(last))
+        if added:
+            self.append_flights(added)
+
+    def _fetch_references(self):
+        if self._fetching or not any(cache.has_pending() for cache in self.references):
+            return
+        self._fetching = True
+        run_async(self._fetch_pending, on_result=self._references_fetched, on_finished=self._references_done)
+
+    def _fetch_pending(self):
+        # Runs on a worker; every cache is asked, even after one found something
+        return [cache.fetch_pending() for cache in self.references]
+
+    def _references_fetched(self, found):
+        if any(found):
+            self.refresh_cards()
+
+    def _references_done(self):
+        self._fetching = False
+        # Not at once: a failed lookup would otherwise be retried in a loop while offline
+        QTimer.singleShot(self.REFERENCE_RETRY_MS, self, self._fetch_references)
+
+    def refresh_cards(self):
+        """Describe every card again (e.g. after plane or airport names changed)"""
+        self._cards = {}
+        if self._flights:
+            self.dataChanged.emit(self.index(0), self.index(len(self._flights) - 1), [CardRole])
+
+
+class FlightCardDelegate(QStyledItemDelegate):
+    """Paints a flight row as a card with the same look as the old QFrame cards.
+
+    ``buttons`` is a list of (key, text, color, hover_color) tuples drawn at
+    the bottom right of the card; clicking one emits ``button_clicked``
+    with the key and the row's flight.
+    """
+
+    button_clicked = Signal(str, object)
+
+    CARD_HEIGHT = 160
+    SPACING = 12
+
+    def __init__(self, buttons, parent=None):
+        super().__init__(parent)
+        self.buttons = buttons
+        self._hover_button = None
+
+        self.title_font = self._font(11, QFont.Bold)
+        self.code_font = self._font(14, QFont.Bold)
+        self.city_font = self._font(10)
+        self.time_font = self._font(11, QFont.DemiBold)
+        self.icon_font = self._font(16)
+        self.price_font = self._font(18, QFont.Bold)
+        self.button_font = self._font(11, QFont.Bold)
+
+    @staticmethod
+    def _font(point_size, weight=QFont.Normal):
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setWeight(weight)
+        return font
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.CARD_HEIGHT + self.SPACING)
+
+    def _card_rect(self, option):
+        return QRectF(option.rect).adjusted(0.5, 0.5, -4.5, -self.SPACING - 0.5)
+
+    def _button_rects(self, card_rect):
+        """Return [(key, rect)] for the action buttons, laid out right to left"""
+        metrics = QFontMetrics(self.button_font)
+        rects = []
+        right = card_rect.right() - 24
+        top = card_rect.top() + 20 + 44
+        for key, text, _, _ in reversed(self.buttons):
+            width = max(82, metrics.horizontalAdvance(text) + 32)
+            rect = QRectF(right - width, top, width, 36)
+            rects.append((key, rect))
+            right -= width + 8
+        rects.reverse()
+        return rects
+
+    def paint(self, painter, option, index):
+        card = index.data(CardRole)
+        if card is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+
+        rect = self._card_rect(option)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        # Card background
+        path = QPainterPath()
+        path.addRoundedRect(rect, 12, 12)
+        painter.fillPath(path, QColor("#fefefe" if hovered else "white"))
+        painter.setPen(QPen(QColor("#cbd5e1" if hovered else "#e2e8f0"), 1))
+        painter.drawPath(path)
+
+        left = rect.left() + 24
+        top = rect.top() + 20
+
+        # Left: flight title
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#1a202c"))
+        painter.drawText(QRectF(left, top, 220, 24), Qt.AlignLeft | Qt.AlignVCenter, card["title"])
+
+        # Center: route
+        route_left = left + 240
+        self._paint_endpoint(painter, route_left, top, card["dep_code"], card["dep_city"], card["dep_time"])
+        painter.setFont(self.icon_font)
+        painter.setPen(QColor("#64748b"))
+        painter.drawText(QRectF(route_left + 150, top + 10, 50, 40), Qt.AlignCenter, "✈")
+        self._paint_endpoint(painter, route_left + 210, top, card["arr_code"], card["arr_city"], card["arr_time"])
+
+        if card.get("aircraft"):
+            painter.setFont(self.city_font)
+            painter.setPen(QColor("#64748b"))
+            painter.drawText(QRectF(route_left, top + 86, 360, 20), Qt.AlignLeft | Qt.AlignVCenter, card["aircraft"])
+
+        # Right: price and buttons
+        painter.setFont(self.price_font)
+        painter.setPen(QColor("#1a202c"))
+        painter.drawText(QRectF(rect.right() - 244, top, 220, 36), Qt.AlignRight | Qt.AlignVCenter, card["price"])
+
+        painter.setFont(self.button_font)
+        for (key, text, color, hover_color), (_, button_rect) in zip(self.buttons, self._button_rects(rect)):
+            is_hover = self._hover_button == (index.row(), key)
+            button_path = QPainterPath()
+            button_path.addRoundedRect(button_rect, 6, 6)
+            painter.fillPath(button_path, QColor(hover_color if is_hover else color))
+            painter.setPen(QColor("white"))
+            painter.drawText(button_rect, Qt.AlignCenter, text)
+
+        painter.restore()
+
+    def _paint_endpoint(self, painter, x, y, code, city, time_text):
+        painter.setFont(self.code_font)
+        painter.setPen(QColor("#1a202c"))
+        painter.drawText(QRectF(x, y, 150, 28), Qt.AlignLeft | Qt.AlignVCenter, code)
+        painter.setFont(self.city_font)
+        painter.setPen(QColor("#64748b"))
+        painter.drawText(QRectF(x, y + 28, 150, 20), Qt.AlignLeft | Qt.AlignVCenter, city)
+        painter.setFont(self.time_font)
+        painter.setPen(QColor("#1a202c"))
+        painter.drawText(QRectF(x, y + 50, 150, 22), Qt.AlignLeft | Qt.AlignVCenter, time_text)
+
+    def _button_at(self, option, pos):
+        for key, rect in self._button_rects(self._card_rect(option)):
+            if rect.contains(pos):
+                return key
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            key = self._button_at(option, event.position())
+            hover = (index.row(), key) if key else None
+            if hover != self._hover_button:
+                self._hover_button = hover
+                view = self.parent()
+                if view is not None:
+                    view.viewport().setCursor(Qt.PointingHandCursor if key else Qt.ArrowCursor)
+                    view.viewport().update()
+        elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            key = self._button_at(option, event.position())
+            if key:
+                self.button_clicked.emit(key, index.data(FlightRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class FlightListView(QListView):
+    """Scrollable list of flight cards that only paints the visible rows"""
+
+    def __init__(self, buttons, parent=None):
+        super().__init__(parent)
+        self.card_delegate = FlightCardDelegate(buttons, self)
+        self.setItemDelegate(self.card_delegate)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(20)
+        self.setObjectName("flightsListView")
+
+    def leaveEvent(self, event):
+        self.card_delegate._hover_button = None
+        self.viewport().unsetCursor()
+        self.viewport().update()
+        super().leaveEvent(event)
@@ -1,10 +1,12 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QDateTimeEdit, QComboBox, QDoubleSpinBox, QMessageBox
+    QFrame, QDateTimeEdit, QComboBox, QDoubleSpinBox, QMessageBox
 )
 from PySide6.QtCore import Qt, QDateTime
 from PySide6.QtGui import QCursor, QFont
 from models import Flight
+from views.flight_list_view import FlightListModel, FlightListView
+from services.worker import run_async
 
 
 class FlightWindow(QMainWindow):
@@ -16,6 +18,7 @@ class FlightWindow(QMainWindow):
         self.plane_controller = plane_controller
         self.airport_controller = airport_controller
         self.current_form = None  # Track current form (add/update)
+        self.flights_load_id = 0  # Incremented by every load_flights call
 
         # === Central Layout ===
         central_widget = QWidget()
@@ -92,16 +95,28 @@ class FlightWindow(QMainWindow):
 
         self.main_layout.addWidget(header_section)
 
-        # === Flights Scroll Area ===
-        self.flights_area = QScrollArea()
-        self.flights_area.setWidgetResizable(True)
-        self.flights_area.setObjectName("flightsScrollArea")
-        self.flights_container = QWidget()
-        self.flights_layout = QVBoxLayout(self.flights_container)
-        self.flights_layout.setSpacing(12)
-        self.flights_layout.setContentsMargins(0, 0, 0, 0)
-        self.flights_area.setWidget(self.flights_container)
-        self.main_layout.addWidget(self.flights_area)
+        # === Flights List (virtualized, only visible cards are painted) ===
+        self.flights_message = QLabel()
+        self.flights_message.setAlignment(Qt.AlignCenter)
+        self.flights_message.setStyleSheet("""
+            font-size: 16pt;
+            color: #a0aec0;
+            padding: 40px;
+        """)
+        self.flights_message.hide()
+        self.main_layout.addWidget(self.flights_message)
+
+        self.flights_model = FlightListModel(
+            self.describe_flight, self,
+            references=(self.plane_controller.cache, self.airport_controller.cache),
+        )
+        self.flights_view = FlightListView([
+            ("edit", "Edit", "#1a202c", "#2d3748"),
+            ("delete", "Delete", "#dc3545", "#c82333"),
+        ])
+        self.flights_view.setModel(self.flights_model)
+        self.flights_view.card_delegate.button_clicked.connect(self.on_card_button)
+        self.main_layout.addWidget(self.flights_view)
 
         # Load flights
         self.load_flights()
@@ -182,25 +197,25 @@ class FlightWindow(QMainWindow):
                     stop:0 #2d3748, stop:1 #4a5568);
             }
             
-            QScrollArea#flightsScrollArea {
+            QListView#flightsListView {
                 border: none;
                 background-color: transparent;
             }
             
-            QScrollArea#flightsScrollArea QScrollBar:vertical {
+            QListView#flightsListView QScrollBar:vertical {
                 border: none;
                 background-color: #f1f5f9;
                 width: 12px;
                 border-radius: 6px;
             }
             
-            QScrollArea#flightsScrollArea QScrollBar::handle:vertical {
+            QListView#flightsListView QScrollBar::handle:vertical {
                 background-color: #cbd5e1;
                 border-radius: 6px;
                 min-height: 20px;
             }
             
-            QScrollArea#flightsScrollArea QScrollBar::handle:vertical:hover {
+            QListView#flightsListView QScrollBar::handle:vertical:hover {
                 background-color: #94a3b8;
             }
             
@@ -276,260 +291,144 @@ class FlightWindow(QMainWindow):
         """
 
     def load_flights(self):
-        """Load and display all flights"""
-        # Clear existing flights
-        for i in reversed(range(self.flights_layout.count())):
-            item = self.flights_layout.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Load flights from controller
-        flights = self.flight_controller.get_all_flights()
-        
-        if not flights:
-            # Show empty state
-            empty_label = QLabel("No flights scheduled yet")
-            empty_label.setAlignment(Qt.AlignCenter)
-            empty_label.setStyleSheet("""
-                font-size: 16pt;
-                color: #a0aec0;
-                padding: 40px;
-            """)
-            self.flights_layout.addWidget(empty_label)
+        """Load and display all flights without blocking the UI"""
+        self.show_flights_message("Loading flights...")
+        self.has_flight_rows = False
+        # Pages from an earlier, still running load are ignored
+        self.flights_load_id += 1
+        run_async(
+            self.fetch_flights, self.flights_load_id,
+            on_progress=self.append_flights,
+            on_result=self.finish_flights,
+            on_error=self.on_flights_error,
+        )
+
+    def fetch_flights(self, load_id, progress):
+        """Stream (load_id, flights) pages to ``progress`` (runs on a worker thread).
+
+        With a stored snapshot of flights, planes and airports the pages are
+        drawn from disk without waiting on the network, and the result
+        hands them to finish_flights for revalidation.
+        """
+        stale = (self.flight_controller.has_flight_snapshot()
+                 and self.plane_controller.get_cached_planes() is not None
+                 and self.airport_controller.get_cached_airports() is not None)
+        if not stale:
+            # Warm the plane/airport caches so drawing the cards needs no requests
+            self.plane_controller.get_all_planes()
+            self.airport_controller.get_all_airports()
+        flight_count = 0
+        listed = [] if stale else None
+        for flights in self.flight_controller.iter_flight_pages(revalidate=not stale):
+            flight_count += len(flights)
+            if stale:
+                listed.extend(flights)
+            progress((load_id, flights))
+        return load_id, flight_count, listed
+
+    def revalidate_flights(self, load_id, listed):
+        """Bring a snapshot up to date (runs on a worker thread); returns the flight delta"""
+        upserted, removed_ids = self.flight_controller.sync_flights(listed)
+        self.plane_controller.get_all_planes()
+        self.airport_controller.get_all_airports()
+        return load_id, upserted, removed_ids
+
+    def show_flights_message(self, text):
+        """Replace the flights list with a single centered message"""
+        self.flights_model.set_flights([])
+        self.flights_view.hide()
+        self.flights_message.setText(text)
+        self.flights_message.show()
+
+    def append_flights(self, page):
+        """Add a page of flights to the list view as it arrives"""
+        load_id, flights = page
+        if load_id != self.flights_load_id:
             return
-        
-        # Create flight cards
-        for flight in flights:
-            card = self.create_flight_card(flight)
-            self.flights_layout.addWidget(card)
-
-    def create_flight_card(self, flight: Flight):
-        """Create a modern flight card similar to booking websites"""
-        # Fetch related data
-        plane_data = self.plane_controller.get_plane_by_id(flight.planeId) or {}
-        dep_airport = self.airport_controller.get_airport_by_id(flight.departureAirportId) or {}
-        arr_airport = self.airport_controller.get_airport_by_id(flight.arrivalAirportId) or {}
+        if not self.has_flight_rows:
+            self.has_flight_rows = True
+            self.flights_message.hide()
+            self.flights_model.set_flights(flights)
+            self.flights_view.show()
+            return
+        self.flights_model.append_flights(flights)
+
+    def finish_flights(self, result):
+        """Show the empty state once every page has arrived"""
+        load_id, flight_count, listed = result
+        if load_id != self.flights_load_id:
+            return
+        if listed is not None:
+            run_async(self.revalidate_flights, load_id, listed, on_result=self.finish_revalidation)
+        elif not flight_count and not self.flights_model.rowCount():
+            self.show_flights_message("No flights scheduled yet")
+
+    def finish_revalidation(self, result):
+        """Patch the snapshot rows with what changed on the server meanwhile"""
+        load_id, upserted, removed_ids = result
+        if load_id != self.flights_load_id:
+            return
+        # Plane and airport names may have changed too
+        self.flights_model.refresh_cards()
+        self.apply_flight_changes(upserted, removed_ids)
+        if not self.flights_model.rowCount():
+            self.show_flights_message("No flights scheduled yet")
+
+    def apply_flight_changes(self, upserted=(), removed_ids=()):
+        """Patch the shown rows after a mutation instead of reloading every flight"""
+        if not self.has_flight_rows:
+            if not upserted:
+                return
+            # The list was empty (or its first page has not arrived yet)
+            self.has_flight_rows = True
+            self.flights_message.hide()
+            self.flights_view.show()
+        self.flights_model.apply_changes(upserted, removed_ids)
+        if not self.flights_model.rowCount():
+            self.has_flight_rows = False
+            self.show_flights_message("No flights scheduled yet")
+
+    def on_flights_error(self, message):
+        """Show a load error in place of the flights list"""
+        self.show_flights_message(f"Could not load flights: {message}")
+
+    def on_card_button(self, key, flight):
+        """Dispatch clicks on a card's Edit/Delete buttons"""
+        if key == "edit":
+            self.open_update_form(flight)
+        elif key == "delete":
+            self.delete_flight(flight.id)
+
+    def describe_flight(self, flight: Flight):
+        """Build the texts shown on a flight card (called only for painted rows)"""
+        # Related data comes from the plane/airport reference caches without
+        # a request; misses show placeholders until the model fetches them
+        plane_data = self.plane_controller.get_cached_plane(flight.planeId) or {}
+        dep_airport = self.airport_controller.get_cached_airport(flight.departureAirportId) or {}
+        arr_airport = self.airport_controller.get_cached_airport(flight.arrivalAirportId) or {}
 
         # Extract display names
         plane_name = plane_data.get('Nickname', plane_data.get('nickname', f"Plane {flight.planeId}"))
-        dep_code = dep_airport.get('Code', dep_airport.get('code', 'UNK'))
-        arr_code = arr_airport.get('Code', arr_airport.get('code', 'UNK'))
-        dep_city = dep_airport.get('City', dep_airport.get('city', 'Unknown'))
-        arr_city = arr_airport.get('City', arr_airport.get('city', 'Unknown'))
 
-        # Parse datetime strings
-        try:
-            dep_time = QDateTime.fromString(flight.departureTime, Qt.ISODate)
-            arr_time = QDateTime.fromString(flight.arrivalTime, Qt.ISODate)
-            dep_display = dep_time.toString("MMM dd, hh:mm")
-            arr_display = arr_time.toString("MMM dd, hh:mm")
-        except:
+        # Datetimes are parsed once when the flight is decoded
+        if flight.departureAt and flight.arrivalAt:
+            dep_display = flight.departureAt.strftime("%b %d, %H:%M")
+            arr_display = flight.arrivalAt.strftime("%b %d, %H:%M")
+        else:
             dep_display = str(flight.departureTime)[:16]
             arr_display = str(flight.arrivalTime)[:16]
 
-        # Create card
-        card = QFrame()
-        card.setObjectName("flightCard")
-        card.setStyleSheet("""
-            QFrame#flightCard {
-                background: white;
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                padding: 0px;
-            }
-            QFrame#flightCard:hover {
-                border-color: #cbd5e1;
-                background: #fefefe;
-            }
-        """)
-
-        # Main layout
-        main_layout = QVBoxLayout(card)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Top section with flight info
-        top_section = QWidget()
-        top_layout = QHBoxLayout(top_section)
-        top_layout.setContentsMargins(24, 20, 24, 16)
-        top_layout.setSpacing(20)
-
-        # Left side - Flight details
-        left_side = QWidget()
-        left_layout = QVBoxLayout(left_side)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(8)
-
-        # Flight ID and Plane
-        flight_info = QLabel(f"IsraFlight • Flight ID: {flight.id}")
-        flight_info.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: bold;
-        """)
-        left_layout.addWidget(flight_info)
-
-        top_layout.addWidget(left_side)
-
-        # Center - Route information
-        center_section = QWidget()
-        center_layout = QVBoxLayout(center_section)
-        center_layout.setContentsMargins(0, 0, 0, 0)
-        center_layout.setSpacing(12)
-
-        # Route display
-        route_layout = QHBoxLayout()
-        route_layout.setSpacing(15)
-
-        # Departure
-        dep_widget = QWidget()
-        dep_layout = QVBoxLayout(dep_widget)
-        dep_layout.setContentsMargins(0, 0, 0, 0)
-        dep_layout.setSpacing(2)
-
-        dep_code_label = QLabel(dep_code)
-        dep_code_label.setStyleSheet("""
-            font-size: 14pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        dep_city_label = QLabel(dep_city)
-        dep_city_label.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        dep_time_label = QLabel(dep_display)
-        dep_time_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: 600;
-        """)
-
-        dep_layout.addWidget(dep_code_label)
-        dep_layout.addWidget(dep_city_label)
-        dep_layout.addWidget(dep_time_label)
-
-        # Plane icon/arrow
-        plane_label = QLabel("✈")
-        plane_label.setAlignment(Qt.AlignCenter)
-        plane_label.setStyleSheet("""
-            font-size: 16pt;
-            color: #64748b;
-            margin: 10px;
-        """)
-
-        # Arrival
-        arr_widget = QWidget()
-        arr_layout = QVBoxLayout(arr_widget)
-        arr_layout.setContentsMargins(0, 0, 0, 0)
-        arr_layout.setSpacing(2)
-
-        arr_code_label = QLabel(arr_code)
-        arr_code_label.setStyleSheet("""
-            font-size: 14pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        arr_city_label = QLabel(arr_city)
-        arr_city_label.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        arr_time_label = QLabel(arr_display)
-        arr_time_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #1a202c;
-            font-weight: 600;
-        """)
-
-        arr_layout.addWidget(arr_code_label)
-        arr_layout.addWidget(arr_city_label)
-        arr_layout.addWidget(arr_time_label)
-
-        route_layout.addWidget(dep_widget)
-        route_layout.addWidget(plane_label)
-        route_layout.addWidget(arr_widget)
-        center_layout.addLayout(route_layout)
-
-        # Plane name
-        plane_label_widget = QLabel(f"Aircraft: {plane_name}")
-        plane_label_widget.setStyleSheet("""
-            font-size: 10pt;
-            color: #64748b;
-        """)
-        center_layout.addWidget(plane_label_widget)
-
-        top_layout.addWidget(center_section)
-
-        # Right side - Price and actions
-        right_side = QWidget()
-        right_layout = QVBoxLayout(right_side)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(8)
-        right_layout.setAlignment(Qt.AlignTop)
-
-        # Price
-        price_label = QLabel(f"${flight.price:.2f}")
-        price_label.setStyleSheet("""
-            font-size: 18pt;
-            font-weight: bold;
-            color: #1a202c;
-        """)
-        price_label.setAlignment(Qt.AlignRight)
-        right_layout.addWidget(price_label)
-
-        # Action buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(8)
-
-        update_btn = QPushButton("Edit")
-        update_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a202c, stop:1 #2d3748);
-                color: white;
-                padding: 8px 16px;
-                font-size: 11pt;
-                font-weight: bold;
-                border-radius: 6px;
-                border: none;
-                min-width: 50px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2d3748, stop:1 #4a5568);
-            }
-        """)
-        update_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        update_btn.clicked.connect(lambda: self.open_update_form(flight))
-
-        delete_btn = QPushButton("Delete")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background: #dc3545;
-                color: white;
-                padding: 8px 16px;
-                font-size: 11pt;
-                font-weight: bold;
-                border-radius: 6px;
-                border: none;
-                min-width: 50px;
-            }
-            QPushButton:hover {
-                background: #c82333;
-            }
-        """)
-        delete_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        delete_btn.clicked.connect(lambda: self.delete_flight(flight.id))
-
-        button_layout.addWidget(update_btn)
-        button_layout.addWidget(delete_btn)
-        right_layout.addLayout(button_layout)
-
-        top_layout.addWidget(right_side)
-        main_layout.addWidget(top_section)
-
-        return card
+        return {
+            "title": f"IsraFlight • Flight ID: {flight.id}",
+            "dep_code": dep_airport.get('Code', dep_airport.get('code', 'UNK')),
+            "dep_city": dep_airport.get('City', dep_airport.get('city', 'Unknown')),
+            "dep_time": dep_display,
+            "arr_code": arr_airport.get('Code', arr_airport.get('code', 'UNK')),
+            "arr_city": arr_airport.get('City', arr_airport.get('city', 'Unknown')),
+            "arr_time": arr_display,
+            "aircraft": f"Aircraft: {plane_name}",
+            "price": f"${flight.price:.2f}",
+        }
 
     def toggle_add_flight_form(self):
         """Toggle the add flight form"""
@@ -752,11 +651,11 @@ class FlightWindow(QMainWindow):
                 QMessageBox.warning(self, "Error", "Arrival time must be after departure time.")
                 return
 
-            success = self.flight_controller.create_flight(flight_data)
-            if success:
+            created = self.flight_controller.create_flight(flight_data)
+            if created:
                 QMessageBox.information(self, "Success", "Flight created successfully!")
                 self.close_form()
-                self.load_flights()
+                self.apply_flight_changes(upserted=[created] if isinstance(created, Flight) else ())
             else:
                 QMessageBox.warning(self, "Error", "Failed to create flight.")
                 
@@ -785,11 +684,11 @@ class FlightWindow(QMainWindow):
                 QMessageBox.warning(self, "Error", "Arrival time must be after departure time.")
                 return
 
-            success = self.flight_controller.update_flight(flight.id, updated_data)
-            if success:
+            updated = self.flight_controller.update_flight(flight.id, updated_data)
+            if updated:
                 QMessageBox.information(self, "Success", "Flight updated successfully!")
                 self.close_form()
-                self.load_flights()
+                self.apply_flight_changes(upserted=[updated])
             else:
                 QMessageBox.warning(self, "Error", "Failed to update flight.")
                 
@@ -810,7 +709,7 @@ class FlightWindow(QMainWindow):
                 success = self.flight_controller.delete_flight(flight_id)
                 if success:
                     QMessageBox.information(self, "Success", "Flight deleted successfully!")
-                    self.load_flights()
+                    self.apply_flight_changes(removed_ids=[flight_id])
                 else:
                     QMessageBox.warning(self, "Error", "Failed to delete flight.")
             except Exception as e:
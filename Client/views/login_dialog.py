@@ -4,10 +4,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont, QCursor, QPainter, QPainterPath, QIcon
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect
 from controllers.auth_controller import AuthController 
-from controllers.admin_controller import AdminController
-from views.admin_window import AdminWindow
-from views.register_dialog import RegisterDialog
-from views.user_window import UserWindow
 
 
 class LoginDialog(QDialog):
@@ -329,6 +325,7 @@ class LoginDialog(QDialog):
         """Handle registration link click"""
         print("🔗 Registration link clicked - opening signup flow...")
 
+        from views.register_dialog import RegisterDialog
         dlg = RegisterDialog(self.api)  
         dlg.exec()  
 
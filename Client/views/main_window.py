@@ -1,12 +1,6 @@
 from PySide6.QtCore import Qt, QRect
 from PySide6.QtGui import QFont, QCursor, QPixmap
 from PySide6.QtWidgets import (QLabel, QPushButton, QMainWindow, QGraphicsDropShadowEffect, QWidget)
-from controllers.auth_controller import AuthController
-from controllers.api_controller import ApiController
-from views.login_dialog import LoginDialog
-from views.user_window import UserWindow
-from views.admin_window import AdminWindow
-from controllers.admin_controller import AdminController
 
 
 class MainWindow(QMainWindow):
@@ -197,7 +191,13 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
     
     def open_login_dialog(self):
-        api = ApiController(base_url="http://localhost:5126/api")
+        # Imported on first use: the landing page needs neither the HTTP
+        # stack nor the other windows, so startup does not load them
+        from controllers.api_controller import get_api
+        from controllers.auth_controller import AuthController
+        from views.login_dialog import LoginDialog
+
+        api = get_api()
         auth_controller = AuthController(api=api)
         dialog = LoginDialog(auth_controller, api)
         # dialog.setParent(self)
@@ -207,9 +207,12 @@ class MainWindow(QMainWindow):
             print("✅ Login successful!", user)
 
             if user.Role.lower() == "admin":
+                from controllers.admin_controller import AdminController
+                from views.admin_window import AdminWindow
                 self.admin_window = AdminWindow(AdminController(api))
                 self.admin_window.show()
             else:
+                from views.user_window import UserWindow
                 self.user_window = UserWindow(user)
                 self.user_window.show()
 
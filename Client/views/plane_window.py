@@ -1,10 +1,10 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QScrollArea, QPushButton, QGridLayout, QFrame, QHBoxLayout, QMessageBox, QLineEdit, QMainWindow)
 from PySide6.QtGui import QPixmap, QFont, QCursor
-from PySide6.QtCore import Qt
-import requests
-from io import BytesIO
+from PySide6.QtCore import Qt, QTimer
 
 from models import Plane  
+from services.worker import run_async
+from services.image_loader import ImageLoader
 from dataclasses import asdict
 
 
@@ -12,6 +12,7 @@ class PlaneWindow(QMainWindow):
     def __init__(self, plane_controller, parent=None):
         super().__init__(parent)
         self.controller = plane_controller
+        self.image_loader = ImageLoader.instance()
         self.editing_cards = set()  # Track which cards are in edit mode
 
         self.setWindowTitle("plane Management")
@@ -202,15 +203,17 @@ class PlaneWindow(QMainWindow):
         self.load_planes()
 
     def load_planes(self):
-        """Load all planes from controller and display them"""
+        """Load all planes from controller without blocking the UI"""
         # Clear old items
         for i in reversed(range(self.grid.count())):
             widget = self.grid.itemAt(i).widget()
             if widget:
                 widget.setParent(None)
 
-        planes = self.controller.get_all_planes()
+        run_async(self.controller.get_all_planes, on_result=self.display_planes, on_error=self.on_planes_error)
 
+    def display_planes(self, planes):
+        """Display the fetched planes as a grid of cards"""
         if not planes:
             QMessageBox.warning(self, "Error", "No planes found or API error.")
             return
@@ -229,6 +232,10 @@ class PlaneWindow(QMainWindow):
             except Exception as e:
                 print(f"Failed to load plane card: {e}")
 
+    def on_planes_error(self, message):
+        """Report a failure to load planes"""
+        QMessageBox.warning(self, "Error", f"Failed to load planes: {message}")
+
     def normalize_plane_data(self, plane):
         """Normalize plane data field names to consistent lowercase format"""
         normalized = {}
@@ -475,12 +482,14 @@ class PlaneWindow(QMainWindow):
         self.create_edit_mode(card)
 
     def update_image_preview(self, card, url):
-        """Update image preview when URL changes"""
-        if url.strip():
-            self.load_image(card.img_label, url.strip())
-        else:
-            card.img_label.setText("No Image")
-            card.img_label.setStyleSheet("color: #666; font-style: italic;")
+        """Update image preview once the user stops typing the URL"""
+        card.preview_url = url.strip()
+        if not hasattr(card, "preview_timer"):
+            card.preview_timer = QTimer(card)
+            card.preview_timer.setSingleShot(True)
+            card.preview_timer.setInterval(400)
+            card.preview_timer.timeout.connect(lambda: self.load_image(card.img_label, card.preview_url))
+        card.preview_timer.start()
 
     def save_plane_changes(self, card):
         """Save changes to an existing plane"""
@@ -591,24 +600,8 @@ class PlaneWindow(QMainWindow):
             self.grid.addWidget(widget, row + 1, col, rowspan, colspan)
 
     def load_image(self, img_label, image_url):
-        """Load and display an image from URL"""
-        if image_url:
-            try:
-                response = requests.get(image_url)
-                if response.status_code == 200:
-                    image_data = BytesIO(response.content)
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data.read())
-                    img_label.setPixmap(pixmap.scaled(270, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                else:
-                    img_label.setText("Image failed to load")
-                    img_label.setStyleSheet("color: #666; font-style: italic;")
-            except Exception as e:
-                img_label.setText("Image error")
-                img_label.setStyleSheet("color: #666; font-style: italic;")
-        else:
-            img_label.setText("No Image")
-            img_label.setStyleSheet("color: #666; font-style: italic;")
+        """Load and display an image from URL without blocking the UI"""
+        self.image_loader.load_into(img_label, image_url, 270, 140)
 
     def delete_plane(self, plane_id):
         """Delete a plane"""
@@ -5,10 +5,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QCursor, QPainter, QPainterPath
 from PySide6.QtCore import Qt
 
-from controllers.api_controller import ApiController
-from views.bookaflight import BookFlightWindow
-from views.MyBookingsWindow import MyBookingsWindow
-from views.arrivals_window import ArrivalsWindow
+from controllers.api_controller import get_api
 
 
 class UserWindow(QMainWindow):
@@ -312,17 +309,22 @@ class UserWindow(QMainWindow):
 
         return button
 
+    # Each window is imported when it is first opened, so logging in does
+    # not load the PDF and route planning code
     def on_book_flight(self):
+        from views.bookaflight import BookFlightWindow
         self.book_flight_window = BookFlightWindow(self.user_id)
         self.book_flight_window.show()
 
     def on_my_bookings(self):
-        api = ApiController(base_url="http://localhost:5126/api")
+        from views.MyBookingsWindow import MyBookingsWindow
+        api = get_api()
         self.my_bookings_window = MyBookingsWindow(self.user_id, api)
         self.my_bookings_window.show()
 
     def view_arrivals(self):
-        api = ApiController(base_url="http://localhost:5126/api")
+        from views.arrivals_window import ArrivalsWindow
+        api = get_api()
         self.arrivals_window = ArrivalsWindow(api)
         
         # Initialize the controller
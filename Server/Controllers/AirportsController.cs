@@ -1,6 +1,7 @@
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using Server.Data;
+using Server.Filters;
 using Server.Models;
 
 namespace Server.Controllers
@@ -14,10 +15,12 @@ namespace Server.Controllers
 
         // GET: api/airports
         [HttpGet]
+        [ETag]
         public IEnumerable<Airport> Get() => _db.Airports.ToList();
 
         // GET: api/airports/5
         [HttpGet("{id}")]
+        [ETag]
         public async Task<ActionResult<Airport>> GetAirport(int id)
         {
             var airport = await _db.Airports.FindAsync(id);
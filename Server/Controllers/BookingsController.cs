@@ -41,6 +41,34 @@ namespace Server.Controllers
         }
 
 
+        // GET: api/bookings/page?afterId=0&limit=500&userId=7
+        // Keyset pagination ordered by id, optionally for one frequent flyer
+        [HttpGet("page")]
+        public async Task<ActionResult<IEnumerable<Booking>>> GetPage(
+            [FromQuery] int? userId,
+            [FromQuery] int afterId = 0,
+            [FromQuery] int limit = Paging.DefaultLimit)
+        {
+            try
+            {
+                IQueryable<Booking> query = _db.Bookings.Where(b => b.Id > afterId);
+
+                if (userId.HasValue)
+                {
+                    query = query.Where(b => b.FrequentFlyerId == userId.Value);
+                }
+
+                return Ok(await query
+                    .OrderBy(b => b.Id)
+                    .Take(Paging.ClampLimit(limit))
+                    .ToListAsync());
+            }
+            catch (Exception)
+            {
+                return StatusCode(500, "Error retrieving bookings");
+            }
+        }
+
         // GET: api/bookings/5
         [HttpGet("{id}")]
         public async Task<ActionResult<Booking>> GetBooking(int id)
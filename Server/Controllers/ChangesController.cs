@@ -0,0 +1,78 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.EntityFrameworkCore;
+using Server.Data;
+using Server.Models;
+
+namespace Server.Controllers
+{
+    // Change feed for the flights, planes and airports tables.
+    // A client downloads the tables once, remembers the version it started
+    // from (api/changes/version) and then only asks for what changed since.
+    [ApiController]
+    [Route("api/[controller]")]
+    public class ChangesController : ControllerBase
+    {
+        private readonly AppDbContext _db;
+        public ChangesController(AppDbContext db) { _db = db; }
+
+        // GET: api/changes/version
+        // Latest change version; read it before a full download
+        [HttpGet("version")]
+        public async Task<IActionResult> GetVersion()
+        {
+            return Ok(new { version = await LatestVersion() });
+        }
+
+        // GET: api/changes?since=120&limit=500
+        // Current state of every entity changed after version "since", in
+        // batches of at most "limit" log entries. Keep calling with the
+        // returned version while hasMore is true.
+        [HttpGet]
+        public async Task<ActionResult<ChangeSet>> Get(
+            [FromQuery] long since = 0,
+            [FromQuery] int limit = Paging.DefaultLimit)
+        {
+            var latest = await LatestVersion();
+            if (since > latest)
+            {
+                // The client synced against another (or a recreated) database
+                return new ChangeSet { Version = latest, Reset = true };
+            }
+
+            limit = Paging.ClampLimit(limit);
+            var entries = await _db.ChangeLog
+                .AsNoTracking()
+                .Where(c => c.Version > since)
+                .OrderBy(c => c.Version)
+                .Take(limit + 1)
+                .ToListAsync();
+
+            var changes = new ChangeSet { HasMore = entries.Count > limit };
+            if (changes.HasMore)
+                entries.RemoveAt(limit);
+            changes.Version = entries.Count > 0 ? entries[^1].Version : since;
+
+            // Only the latest state matters: load the touched rows as they are
+            // now, and whatever is gone has been deleted
+            var flightIds = TouchedIds(entries, ChangeLogEntry.Flights);
+            changes.Flights = await _db.Flights.AsNoTracking().Where(f => flightIds.Contains(f.Id)).ToListAsync();
+            changes.Deleted.Flights = flightIds.Except(changes.Flights.Select(f => f.Id)).ToList();
+
+            var planeIds = TouchedIds(entries, ChangeLogEntry.Planes);
+            changes.Planes = await _db.Planes.AsNoTracking().Where(p => planeIds.Contains(p.Id)).ToListAsync();
+            changes.Deleted.Planes = planeIds.Except(changes.Planes.Select(p => p.Id)).ToList();
+
+            var airportIds = TouchedIds(entries, ChangeLogEntry.Airports);
+            changes.Airports = await _db.Airports.AsNoTracking().Where(a => airportIds.Contains(a.Id)).ToListAsync();
+            changes.Deleted.Airports = airportIds.Except(changes.Airports.Select(a => a.Id)).ToList();
+
+            return changes;
+        }
+
+        private async Task<long> LatestVersion() =>
+            await _db.ChangeLog.MaxAsync(c => (long?)c.Version) ?? 0;
+
+        private static List<int> TouchedIds(List<ChangeLogEntry> entries, string entity) =>
+            entries.Where(c => c.Entity == entity).Select(c => c.EntityId).Distinct().ToList();
+    }
+}
@@ -1,6 +1,7 @@
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using Server.Data;
+using Server.Filters;
 using Server.Models;
 using Server.Services;
 
@@ -13,6 +14,8 @@ namespace Server.Controllers
         private readonly AppDbContext _db;
         private readonly FlightsService _flightsService;
 
+        private const int SearchDefaultLimit = 100;
+
         public FlightsController(AppDbContext db, FlightsService flightsService)
         {
             _db = db;
@@ -24,11 +27,129 @@ namespace Server.Controllers
         // ============================
 
         // GET: api/flights
+        // GET: api/flights?ids=1,2,3  (batch lookup of specific flights)
+        // GET: api/flights?departureAirportId=1&arrivalAirportId=2&date=2025-09-01
         [HttpGet]
-        public IEnumerable<Flight> Get() => _db.Flights.ToList();
+        [ETag]
+        public IEnumerable<Flight> Get(
+            [FromQuery] string? ids,
+            [FromQuery] int? departureAirportId,
+            [FromQuery] int? arrivalAirportId,
+            [FromQuery] DateTime? date)
+        {
+            IQueryable<Flight> query = _db.Flights;
+
+            if (!string.IsNullOrWhiteSpace(ids))
+            {
+                var idList = ids
+                    .Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+                    .Select(s => int.TryParse(s, out var id) ? id : (int?)null)
+                    .Where(id => id.HasValue)
+                    .Select(id => id!.Value)
+                    .Distinct()
+                    .ToList();
+
+                query = query.Where(f => idList.Contains(f.Id));
+            }
+
+            if (departureAirportId.HasValue)
+                query = query.Where(f => f.DepartureAirportId == departureAirportId.Value);
+
+            if (arrivalAirportId.HasValue)
+                query = query.Where(f => f.ArrivalAirportId == arrivalAirportId.Value);
+
+            if (date.HasValue)
+            {
+                var dayStart = date.Value.Date;
+                var dayEnd = dayStart.AddDays(1);
+                query = query.Where(f => f.DepartureTime >= dayStart && f.DepartureTime < dayEnd);
+            }
+
+            return query.ToList();
+        }
+
+        // GET: api/flights/search?departureAirportId=1&arrivalAirportId=2
+        //     &departureFrom=2025-09-01&departureTo=2025-09-02&minPrice=100&maxPrice=500
+        //     &sort=price&limit=100
+        // Every filter is optional. departureTo is exclusive. sort is one of
+        // departure, arrival or price, with a leading "-" for descending order.
+        [HttpGet("search")]
+        [ETag]
+        public async Task<ActionResult<IEnumerable<Flight>>> Search(
+            [FromQuery] int? departureAirportId,
+            [FromQuery] int? arrivalAirportId,
+            [FromQuery] DateTime? departureFrom,
+            [FromQuery] DateTime? departureTo,
+            [FromQuery] decimal? minPrice,
+            [FromQuery] decimal? maxPrice,
+            [FromQuery] string sort = "departure",
+            [FromQuery] int limit = SearchDefaultLimit)
+        {
+            if (departureFrom.HasValue && departureTo.HasValue && departureTo <= departureFrom)
+                return BadRequest(new { error = "departureTo must be after departureFrom" });
+
+            if (minPrice.HasValue && maxPrice.HasValue && maxPrice < minPrice)
+                return BadRequest(new { error = "maxPrice must not be below minPrice" });
+
+            IQueryable<Flight> query = _db.Flights.AsNoTracking();
+
+            if (departureAirportId.HasValue)
+                query = query.Where(f => f.DepartureAirportId == departureAirportId.Value);
+
+            if (arrivalAirportId.HasValue)
+                query = query.Where(f => f.ArrivalAirportId == arrivalAirportId.Value);
+
+            if (departureFrom.HasValue)
+                query = query.Where(f => f.DepartureTime >= departureFrom.Value);
+
+            if (departureTo.HasValue)
+                query = query.Where(f => f.DepartureTime < departureTo.Value);
+
+            if (minPrice.HasValue)
+                query = query.Where(f => f.Price >= minPrice.Value);
+
+            if (maxPrice.HasValue)
+                query = query.Where(f => f.Price <= maxPrice.Value);
+
+            var descending = sort.StartsWith('-');
+            IOrderedQueryable<Flight> ordered = sort.TrimStart('-').ToLowerInvariant() switch
+            {
+                "departure" => descending ? query.OrderByDescending(f => f.DepartureTime) : query.OrderBy(f => f.DepartureTime),
+                "arrival" => descending ? query.OrderByDescending(f => f.ArrivalTime) : query.OrderBy(f => f.ArrivalTime),
+                "price" => descending ? query.OrderByDescending(f => f.Price) : query.OrderBy(f => f.Price),
+                _ => null!
+            };
+            if (ordered == null)
+                return BadRequest(new { error = "sort must be departure, arrival or price, optionally prefixed with '-'" });
+
+            return Ok(await ordered
+                .ThenBy(f => f.Id)
+                .Take(Paging.ClampLimit(limit))
+                .ToListAsync());
+        }
+
+        // GET: api/flights/page?afterId=0&limit=500
+        // Keyset pagination ordered by id, for loading the catalogue incrementally
+        [HttpGet("page")]
+        [ETag]
+        public async Task<IEnumerable<Flight>> GetPage(
+            [FromQuery] int afterId = 0,
+            [FromQuery] int limit = Paging.DefaultLimit)
+        {
+            return await _db.Flights
+                .Where(f => f.Id > afterId)
+                .OrderBy(f => f.Id)
+                .Take(Paging.ClampLimit(limit))
+                .ToListAsync();
+        }
+
+        // GET: api/flights/count
+        [HttpGet("count")]
+        public async Task<ActionResult<int>> Count() => await _db.Flights.CountAsync();
 
         // GET: api/flights/5
         [HttpGet("{id}")]
+        [ETag]
         public async Task<ActionResult<Flight>> GetFlight(int id)
         {
             var flight = await _db.Flights.FindAsync(id);
@@ -0,0 +1,13 @@
+namespace Server.Controllers
+{
+    // Shared limits for the keyset-paginated "page" endpoints.
+    // Clients pass the last id they received as afterId and stop when a
+    // page comes back shorter than the requested limit.
+    public static class Paging
+    {
+        public const int DefaultLimit = 500;
+        public const int MaxLimit = 2000;
+
+        public static int ClampLimit(int limit) => Math.Clamp(limit, 1, MaxLimit);
+    }
+}
@@ -1,6 +1,7 @@
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.EntityFrameworkCore;
 using Server.Data;
+using Server.Filters;
 using Server.Models;
 
 namespace Server.Controllers
@@ -22,14 +23,31 @@ namespace Server.Controllers
         // GET: api/planes
         // Returns a list of all planes
         [HttpGet]
+        [ETag]
         public async Task<IEnumerable<Plane>> Get()
         {
             return await _db.Planes.ToListAsync();
         }
 
+        // GET: api/planes/page?afterId=0&limit=500
+        // Keyset pagination ordered by id
+        [HttpGet("page")]
+        [ETag]
+        public async Task<IEnumerable<Plane>> GetPage(
+            [FromQuery] int afterId = 0,
+            [FromQuery] int limit = Paging.DefaultLimit)
+        {
+            return await _db.Planes
+                .Where(p => p.Id > afterId)
+                .OrderBy(p => p.Id)
+                .Take(Paging.ClampLimit(limit))
+                .ToListAsync();
+        }
+
         // GET: api/planes/{id}
         // Returns a single plane by ID
         [HttpGet("{id}")]
+        [ETag]
         public async Task<IActionResult> GetById(int id)
         {
             var plane = await _db.Planes.FindAsync(id);
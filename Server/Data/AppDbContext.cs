@@ -1,4 +1,5 @@
 using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
 using Server.Models;
 
 namespace Server.Data
@@ -19,7 +20,150 @@ namespace Server.Data
         public DbSet<Ticket> Tickets => Set<Ticket>();
         public DbSet<Admin> Admins => Set<Admin>();
         public DbSet<Auth> Auths => Set<Auth>();
+        public DbSet<ChangeLogEntry> ChangeLog => Set<ChangeLogEntry>();
 
+        /// Serializes change-logged saves so versions are committed in order and
+        /// a client reading api/changes never skips a version committed later.
+        /// The lock is held until the save's own transaction commits. A save inside
+        /// a transaction the caller opened releases it before that transaction
+        /// commits, so such saves do not get this ordering guarantee.
+        private static readonly SemaphoreSlim ChangeLogLock = new(1, 1);
 
+        /// Configures indexes used by the flight search endpoint.
+        protected override void OnModelCreating(ModelBuilder modelBuilder)
+        {
+            base.OnModelCreating(modelBuilder);
+
+            // Route + departure window lookups (api/flights/search with both airports)
+            modelBuilder.Entity<Flight>()
+                .HasIndex(f => new { f.DepartureAirportId, f.ArrivalAirportId, f.DepartureTime });
+
+            // Date-range searches without a route, and ordering by departure
+            modelBuilder.Entity<Flight>()
+                .HasIndex(f => f.DepartureTime);
+
+            modelBuilder.Entity<ChangeLogEntry>(entity =>
+            {
+                entity.ToTable("ChangeLog");
+                entity.HasKey(c => c.Version);
+                entity.Property(c => c.Entity).HasMaxLength(32);
+                entity.Property(c => c.Operation).HasMaxLength(16);
+            });
+        }
+
+        /// Saves and records every flight, plane and airport change in the ChangeLog table.
+        public override int SaveChanges(bool acceptAllChangesOnSuccess)
+        {
+            var pending = PendingChanges();
+            if (pending.Count == 0)
+                return base.SaveChanges(acceptAllChangesOnSuccess);
+
+            ChangeLogLock.Wait();
+            try
+            {
+                using var transaction = Database.CurrentTransaction == null ? Database.BeginTransaction() : null;
+                var result = base.SaveChanges(false);
+                var saved = SetAsideSaved();
+                try
+                {
+                    // Ids of added rows are only known after the first save
+                    ChangeLog.AddRange(pending.Select(ToLogEntry));
+                    base.SaveChanges(false);
+                }
+                finally
+                {
+                    Restore(saved);
+                }
+                transaction?.Commit();
+                if (acceptAllChangesOnSuccess)
+                    ChangeTracker.AcceptAllChanges();
+                return result;
+            }
+            finally
+            {
+                ChangeLogLock.Release();
+            }
+        }
+
+        /// Async counterpart of SaveChanges(bool).
+        public override async Task<int> SaveChangesAsync(bool acceptAllChangesOnSuccess, CancellationToken cancellationToken = default)
+        {
+            var pending = PendingChanges();
+            if (pending.Count == 0)
+                return await base.SaveChangesAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+            await ChangeLogLock.WaitAsync(cancellationToken);
+            try
+            {
+                await using var transaction = Database.CurrentTransaction == null
+                    ? await Database.BeginTransactionAsync(cancellationToken)
+                    : null;
+                var result = await base.SaveChangesAsync(false, cancellationToken);
+                var saved = SetAsideSaved();
+                try
+                {
+                    ChangeLog.AddRange(pending.Select(ToLogEntry));
+                    await base.SaveChangesAsync(false, cancellationToken);
+                }
+                finally
+                {
+                    Restore(saved);
+                }
+                if (transaction != null)
+                    await transaction.CommitAsync(cancellationToken);
+                if (acceptAllChangesOnSuccess)
+                    ChangeTracker.AcceptAllChanges();
+                return result;
+            }
+            finally
+            {
+                ChangeLogLock.Release();
+            }
+        }
+
+        /// Marks the entries written by the first save Unchanged, so the save of the
+        /// ChangeLog rows does not write them again. Their states are restored afterwards,
+        /// and accepted only if the caller asked for it (acceptAllChangesOnSuccess).
+        private List<(EntityEntry Entry, EntityState State)> SetAsideSaved()
+        {
+            var saved = ChangeTracker.Entries()
+                .Where(e => e.State is EntityState.Added or EntityState.Modified or EntityState.Deleted)
+                .Select(e => (e, e.State))
+                .ToList();
+            foreach (var (entry, _) in saved)
+                entry.State = EntityState.Unchanged;
+            return saved;
+        }
+
+        private static void Restore(List<(EntityEntry Entry, EntityState State)> saved)
+        {
+            foreach (var (entry, state) in saved)
+                entry.State = state;
+        }
+
+        private List<(object Entity, EntityState State)> PendingChanges() =>
+            ChangeTracker.Entries()
+                .Where(e => e.State is EntityState.Added or EntityState.Modified or EntityState.Deleted)
+                .Where(e => e.Entity is Flight or Plane or Airport)
+                .Select(e => (e.Entity, e.State))
+                .ToList();
+
+        private static ChangeLogEntry ToLogEntry((object Entity, EntityState State) change)
+        {
+            var (entity, id) = change.Entity switch
+            {
+                Flight f => (ChangeLogEntry.Flights, f.Id),
+                Plane p => (ChangeLogEntry.Planes, p.Id),
+                Airport a => (ChangeLogEntry.Airports, a.Id),
+                _ => throw new InvalidOperationException($"{change.Entity.GetType().Name} is not change-logged")
+            };
+            return new ChangeLogEntry
+            {
+                Entity = entity,
+                EntityId = id,
+                Operation = change.State.ToString(),
+                ChangedAt = DateTime.UtcNow
+            };
+        }
     }
 }
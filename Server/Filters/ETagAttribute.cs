@@ -0,0 +1,43 @@
+using System.Security.Cryptography;
+using System.Text.Json;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Filters;
+using Microsoft.Extensions.Options;
+
+namespace Server.Filters
+{
+    /// Adds a strong ETag (a hash of the JSON body) to successful GET responses
+    /// and answers a matching If-None-Match with 304 Not Modified, so clients
+    /// can revalidate cached collections without downloading them again.
+    public class ETagAttribute : ResultFilterAttribute
+    {
+        public override void OnResultExecuting(ResultExecutingContext context)
+        {
+            var request = context.HttpContext.Request;
+            if (!HttpMethods.IsGet(request.Method) ||
+                context.Result is not ObjectResult result ||
+                result.Value == null ||
+                (result.StatusCode ?? StatusCodes.Status200OK) != StatusCodes.Status200OK)
+            {
+                return;
+            }
+
+            // Hash the body exactly as MVC will serialize it
+            var jsonOptions = context.HttpContext.RequestServices
+                .GetRequiredService<IOptions<JsonOptions>>().Value.JsonSerializerOptions;
+            var body = JsonSerializer.SerializeToUtf8Bytes(result.Value, result.Value.GetType(), jsonOptions);
+            var etag = $"\"{Convert.ToHexString(SHA256.HashData(body))}\"";
+
+            var response = context.HttpContext.Response;
+            response.Headers.ETag = etag;
+            response.Headers.CacheControl = "no-cache";
+
+            var ifNoneMatch = request.Headers.IfNoneMatch.ToString();
+            if (!string.IsNullOrEmpty(ifNoneMatch) &&
+                ifNoneMatch.Split(',').Select(tag => tag.Trim()).Any(tag => tag == etag || tag == "*"))
+            {
+                context.Result = new StatusCodeResult(StatusCodes.Status304NotModified);
+            }
+        }
+    }
+}
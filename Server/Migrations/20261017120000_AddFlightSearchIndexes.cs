@@ -0,0 +1,36 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Server.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddFlightSearchIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_Flights_DepartureAirportId_ArrivalAirportId_DepartureTime",
+                table: "Flights",
+                columns: new[] { "DepartureAirportId", "ArrivalAirportId", "DepartureTime" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Flights_DepartureTime",
+                table: "Flights",
+                column: "DepartureTime");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Flights_DepartureAirportId_ArrivalAirportId_DepartureTime",
+                table: "Flights");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Flights_DepartureTime",
+                table: "Flights");
+        }
+    }
+}
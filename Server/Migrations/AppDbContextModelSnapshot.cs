@@ -123,6 +123,35 @@ namespace Server.Migrations
                     b.ToTable("Bookings");
                 });
 
+            modelBuilder.Entity("Server.Models.ChangeLogEntry", b =>
+                {
+                    b.Property<long>("Version")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint");
+
+                    SqlServerPropertyBuilderExtensions.UseIdentityColumn(b.Property<long>("Version"));
+
+                    b.Property<DateTime>("ChangedAt")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("Entity")
+                        .IsRequired()
+                        .HasMaxLength(32)
+                        .HasColumnType("nvarchar(32)");
+
+                    b.Property<int>("EntityId")
+                        .HasColumnType("int");
+
+                    b.Property<string>("Operation")
+                        .IsRequired()
+                        .HasMaxLength(16)
+                        .HasColumnType("nvarchar(16)");
+
+                    b.HasKey("Version");
+
+                    b.ToTable("ChangeLog");
+                });
+
             modelBuilder.Entity("Server.Models.Flight", b =>
                 {
                     b.Property<int>("Id")
@@ -151,6 +180,10 @@ namespace Server.Migrations
 
                     b.HasKey("Id");
 
+                    b.HasIndex("DepartureTime");
+
+                    b.HasIndex("DepartureAirportId", "ArrivalAirportId", "DepartureTime");
+
                     b.ToTable("Flights");
                 });
 
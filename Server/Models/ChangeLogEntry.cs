@@ -0,0 +1,18 @@
+namespace Server.Models
+{
+    // One row per insert, update or delete of a synced entity (flights,
+    // planes, airports), written by AppDbContext.SaveChanges. Version is an
+    // identity column, so it only grows and orders the change feed.
+    public class ChangeLogEntry
+    {
+        public const string Flights = "flights";
+        public const string Planes = "planes";
+        public const string Airports = "airports";
+
+        public long Version { get; set; }
+        public string Entity { get; set; } = "";
+        public int EntityId { get; set; }
+        public string Operation { get; set; } = "";
+        public DateTime ChangedAt { get; set; }
+    }
+}
@@ -0,0 +1,26 @@
+namespace Server.Models
+{
+    // Response of api/changes: the current state of every entity that changed
+    // after the client's version. Rows that no longer exist are listed by id
+    // in the Deleted lists. Reset means the client's version is unknown to
+    // this database and it has to download everything again.
+    public class ChangeSet
+    {
+        public long Version { get; set; }
+        public bool HasMore { get; set; }
+        public bool Reset { get; set; }
+
+        public List<Flight> Flights { get; set; } = new();
+        public List<Plane> Planes { get; set; } = new();
+        public List<Airport> Airports { get; set; } = new();
+
+        public DeletedIds Deleted { get; set; } = new();
+
+        public class DeletedIds
+        {
+            public List<int> Flights { get; set; } = new();
+            public List<int> Planes { get; set; } = new();
+            public List<int> Airports { get; set; } = new();
+        }
+    }
+}